@@ -4,7 +4,8 @@ from __future__ import annotations
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
-from typing import Any, Dict, Mapping, Optional, Tuple, cast
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, cast
 
 import jwt
 
@@ -14,7 +15,12 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.util import dt as dt_util
 
 from . import auth_store, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
+from .const import (
+    ACCESS_TOKEN_CACHE_MAX_SIZE,
+    ACCESS_TOKEN_CACHE_TTL,
+    ACCESS_TOKEN_EXPIRATION,
+    GROUP_ID_ADMIN,
+)
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 
@@ -25,6 +31,8 @@ _MfaModuleDict = Dict[str, MultiFactorAuthModule]
 _ProviderKey = Tuple[str, Optional[str]]
 _ProviderDict = Dict[_ProviderKey, AuthProvider]
 
+JWT_LEEWAY = 10
+
 
 class InvalidAuthError(Exception):
     """Raised when a authentication error occurs."""
@@ -155,6 +163,9 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        # Access tokens that passed verification, with the time until which
+        # they are trusted without verifying them again
+        self._verified_access_tokens: dict[str, tuple[float, models.RefreshToken]] = {}
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -288,6 +299,7 @@ class AuthManager:
             await asyncio.wait(tasks)
 
         await self._store.async_remove_user(user)
+        self._async_forget_access_tokens(lambda token: token.user is user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -321,6 +333,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_forget_access_tokens(lambda token: token.user is user)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -447,6 +460,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_forget_access_tokens(lambda token: token is refresh_token)
 
     @callback
     def async_create_access_token(
@@ -506,6 +520,12 @@ class AuthManager:
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        if (cached := self._verified_access_tokens.get(token)) is not None:
+            trusted_until, refresh_token = cached
+            if time.time() < trusted_until and refresh_token.user.is_active:
+                return refresh_token
+            self._verified_access_tokens.pop(token)
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -523,15 +543,46 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=JWT_LEEWAY, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        self._async_remember_access_token(token, claims, refresh_token)
         return refresh_token
 
+    @callback
+    def _async_remember_access_token(
+        self, token: str, claims: dict[str, Any], refresh_token: models.RefreshToken
+    ) -> None:
+        """Trust a verified access token for a short while."""
+        now = time.time()
+        cache = self._verified_access_tokens
+
+        if len(cache) >= ACCESS_TOKEN_CACHE_MAX_SIZE:
+            for key in [key for key, (until, _) in cache.items() if until <= now]:
+                cache.pop(key)
+            if len(cache) >= ACCESS_TOKEN_CACHE_MAX_SIZE:
+                cache.clear()
+
+        trusted_until = now + ACCESS_TOKEN_CACHE_TTL
+        if "exp" in claims:
+            trusted_until = min(trusted_until, claims["exp"] + JWT_LEEWAY)
+        cache[token] = (trusted_until, refresh_token)
+
+    @callback
+    def _async_forget_access_tokens(
+        self, matcher: Callable[[models.RefreshToken], bool]
+    ) -> None:
+        """Stop trusting cached access tokens of matching refresh tokens."""
+        cache = self._verified_access_tokens
+        for key in [key for key, (_, token) in cache.items() if matcher(token)]:
+            cache.pop(key)
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
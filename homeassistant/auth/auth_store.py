@@ -4,12 +4,15 @@ from __future__ import annotations
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
+import hashlib
 import hmac
 from logging import getLogger
 from typing import Any
 
 from homeassistant.auth.const import ACCESS_TOKEN_EXPIRATION
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.util import dt as dt_util
 
 from . import models
@@ -39,6 +42,9 @@ class AuthStore:
         self._users: dict[str, models.User] | None = None
         self._groups: dict[str, models.Group] | None = None
         self._perm_lookup: PermissionLookup | None = None
+        # Indexes of the refresh tokens of all users, by id and token digest
+        self._refresh_tokens: dict[str, models.RefreshToken] = {}
+        self._refresh_tokens_by_digest: dict[str, models.RefreshToken] = {}
         self._store = hass.helpers.storage.Store(
             STORAGE_VERSION, STORAGE_KEY, private=True
         )
@@ -143,6 +149,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for refresh_token in user.refresh_tokens.values():
+            self._async_remove_refresh_token_from_index(refresh_token)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -227,6 +235,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._async_add_refresh_token_to_index(refresh_token)
 
         self._async_schedule_save()
         return refresh_token
@@ -239,10 +248,12 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            if user.refresh_tokens.pop(refresh_token.id, None):
-                self._async_schedule_save()
-                break
+        if (found := self._refresh_tokens.get(refresh_token.id)) is None:
+            return
+
+        found.user.refresh_tokens.pop(found.id, None)
+        self._async_remove_refresh_token_from_index(found)
+        self._async_schedule_save()
 
     async def async_get_refresh_token(
         self, token_id: str
@@ -252,12 +263,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens.get(token_id)
 
     async def async_get_refresh_token_by_token(
         self, token: str
@@ -267,14 +273,32 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        found = None
+        refresh_token = self._refresh_tokens_by_digest.get(_token_digest(token))
 
-        for user in self._users.values():
-            for refresh_token in user.refresh_tokens.values():
-                if hmac.compare_digest(refresh_token.token, token):
-                    found = refresh_token
+        # The digest only narrows the lookup down, the token itself is still
+        # compared in constant time.
+        if refresh_token is None or not hmac.compare_digest(refresh_token.token, token):
+            return None
+
+        return refresh_token
+
+    @callback
+    def _async_add_refresh_token_to_index(
+        self, refresh_token: models.RefreshToken
+    ) -> None:
+        """Add a refresh token to the indexes."""
+        self._refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_tokens_by_digest[
+            _token_digest(refresh_token.token)
+        ] = refresh_token
 
-        return found
+    @callback
+    def _async_remove_refresh_token_from_index(
+        self, refresh_token: models.RefreshToken
+    ) -> None:
+        """Remove a refresh token from the indexes."""
+        self._refresh_tokens.pop(refresh_token.id, None)
+        self._refresh_tokens_by_digest.pop(_token_digest(refresh_token.token), None)
 
     @callback
     def async_log_refresh_token_usage(
@@ -307,6 +331,30 @@ class AuthStore:
 
         self._perm_lookup = perm_lookup = PermissionLookup(ent_reg, dev_reg)
 
+        @callback
+        def entity_registry_updated(event: Event) -> None:
+            """Invalidate cached permissions of an updated entity."""
+            perm_lookup.invalidate_entities(
+                entity_id
+                for entity_id in (
+                    event.data["entity_id"],
+                    event.data.get("old_entity_id"),
+                )
+                if entity_id is not None
+            )
+
+        @callback
+        def device_registry_updated(event: Event) -> None:
+            """Invalidate cached permissions of entities of an updated device."""
+            perm_lookup.invalidate_device(event.data["device_id"])
+
+        self.hass.bus.async_listen(
+            EVENT_ENTITY_REGISTRY_UPDATED, entity_registry_updated
+        )
+        self.hass.bus.async_listen(
+            EVENT_DEVICE_REGISTRY_UPDATED, device_registry_updated
+        )
+
         if data is None:
             self._set_defaults()
             return
@@ -478,6 +526,7 @@ class AuthStore:
                 version=rt_dict.get("version"),
             )
             users[rt_dict["user_id"]].refresh_tokens[token.id] = token
+            self._async_add_refresh_token_to_index(token)
 
         self._groups = groups
         self._users = users
@@ -579,6 +628,11 @@ class AuthStore:
         self._groups = groups
 
 
+def _token_digest(token: str) -> str:
+    """Return the digest a refresh token is indexed by."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 def _system_admin_group() -> models.Group:
     """Create system admin group."""
     return models.Group(
@@ -2,6 +2,8 @@
 from datetime import timedelta
 
 ACCESS_TOKEN_EXPIRATION = timedelta(minutes=30)
+ACCESS_TOKEN_CACHE_TTL = 60
+ACCESS_TOKEN_CACHE_MAX_SIZE = 1024
 MFA_SESSION_EXPIRATION = timedelta(minutes=5)
 
 GROUP_ID_ADMIN = "system-admin"
@@ -1,6 +1,7 @@
 """Permissions for Home Assistant."""
 from __future__ import annotations
 
+from collections.abc import Iterable
 import logging
 from typing import Any, Callable
 
@@ -42,12 +43,36 @@ class AbstractPermissions:
 
 
 class PolicyPermissions(AbstractPermissions):
-    """Handle permissions."""
+    """Handle permissions.
+
+    Results of entity checks are cached per entity. The permission lookup
+    invalidates them when the registry entries they depend on change.
+    """
 
     def __init__(self, policy: PolicyType, perm_lookup: PermissionLookup) -> None:
         """Initialize the permission class."""
         self._policy = policy
         self._perm_lookup = perm_lookup
+        self._entity_cache: dict[str, dict[str, bool]] = {}
+        if perm_lookup is not None:
+            perm_lookup.track_permissions(self)
+
+    def check_entity(self, entity_id: str, key: str) -> bool:
+        """Check if we can access entity."""
+        entity_cache = self._entity_cache.get(entity_id)
+
+        if entity_cache is None:
+            entity_cache = self._entity_cache[entity_id] = {}
+        elif (allowed := entity_cache.get(key)) is not None:
+            return allowed
+
+        allowed = entity_cache[key] = super().check_entity(entity_id, key)
+        return allowed
+
+    def invalidate_entities(self, entity_ids: Iterable[str]) -> None:
+        """Invalidate cached entity checks."""
+        for entity_id in entity_ids:
+            self._entity_cache.pop(entity_id, None)
 
     def access_all_entities(self, key: str) -> bool:
         """Check if we have a certain access to all entities."""
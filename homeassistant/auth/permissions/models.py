@@ -1,7 +1,9 @@
 """Models for permissions."""
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
+import weakref
 
 import attr
 
@@ -11,6 +13,8 @@ if TYPE_CHECKING:
         entity_registry as ent_reg,
     )
 
+    from . import PolicyPermissions
+
 
 @attr.s(slots=True)
 class PermissionLookup:
@@ -18,3 +22,29 @@ class PermissionLookup:
 
     entity_registry: ent_reg.EntityRegistry = attr.ib()
     device_registry: dev_reg.DeviceRegistry = attr.ib()
+    # Permissions that cache entity checks, weakly keyed by their id
+    _permissions: weakref.WeakValueDictionary[int, PolicyPermissions] = attr.ib(
+        factory=weakref.WeakValueDictionary, init=False
+    )
+
+    def track_permissions(self, permissions: PolicyPermissions) -> None:
+        """Track permissions to invalidate their cached entity checks."""
+        self._permissions[id(permissions)] = permissions
+
+    def invalidate_entities(self, entity_ids: Iterable[str]) -> None:
+        """Invalidate cached entity checks of all tracked permissions."""
+        entity_ids = list(entity_ids)
+        for permissions in list(self._permissions.values()):
+            permissions.invalidate_entities(entity_ids)
+
+    def invalidate_device(self, device_id: str) -> None:
+        """Invalidate cached entity checks for the entities of a device."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.helpers.entity_registry import async_entries_for_device
+
+        self.invalidate_entities(
+            entry.entity_id
+            for entry in async_entries_for_device(
+                self.entity_registry, device_id, include_disabled_entities=True
+            )
+        )
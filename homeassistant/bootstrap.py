@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 from datetime import datetime
+import importlib
 import logging
 import logging.handlers
 import os
@@ -19,7 +20,12 @@ from homeassistant import config as conf_util, config_entries, core, loader
 from homeassistant.components import http
 from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import area_registry, device_registry, entity_registry
+from homeassistant.helpers import (
+    area_registry,
+    config_per_platform,
+    device_registry,
+    entity_registry,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
@@ -414,6 +420,52 @@ async def _async_watch_pending_setups(hass: core.HomeAssistant) -> None:
         _LOGGER.debug("Running timeout Zones: %s", hass.timeout.zones)
 
 
+def _preimport_module(name: str) -> None:
+    """Import a module so the import done later during setup is a cache hit."""
+    try:
+        importlib.import_module(name)
+    except Exception:  # pylint: disable=broad-except
+        # Requirements may not be installed yet, setup will report real errors
+        _LOGGER.debug("Unable to preimport %s", name, exc_info=True)
+
+
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant,
+    config: dict[str, Any],
+    integrations: dict[str, loader.Integration],
+) -> None:
+    """Import integrations and their configured platforms in the executor.
+
+    Integrations with the fewest dependencies are imported first as those
+    are the ones that get set up first.
+    """
+    ordered = sorted(integrations.values(), key=lambda itg: len(itg.dependencies))
+    modules = [itg.pkg_path for itg in ordered]
+
+    platforms = [
+        (domain, p_name)
+        for domain in integrations
+        for p_name, _ in config_per_platform(config, domain)
+        if isinstance(p_name, str)
+    ]
+    platform_integrations = await gather_with_concurrency(
+        loader.MAX_LOAD_CONCURRENTLY,
+        *(loader.async_get_integration(hass, p_name) for _, p_name in platforms),
+        return_exceptions=True,
+    )
+    for (domain, _), platform_itg in zip(platforms, platform_integrations):
+        if isinstance(platform_itg, loader.Integration):
+            modules.append(f"{platform_itg.pkg_path}.{domain}")
+
+    async def _async_preimport(module: str) -> None:
+        await hass.loop.run_in_executor(None, _preimport_module, module)
+
+    await gather_with_concurrency(
+        MAX_LOAD_CONCURRENTLY,
+        *(_async_preimport(module) for module in dict.fromkeys(modules)),
+    )
+
+
 async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: set[str],
@@ -488,6 +540,12 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Import integrations in the executor while the ones that come first in
+    # the dependency order are set up, so setup does not block on imports.
+    preimport_task = asyncio.create_task(
+        _async_preimport_integrations(hass, config, integration_cache)
+    )
+
     logging_domains = domains_to_setup & LOGGING_INTEGRATIONS
 
     # Load logging as soon as possible
@@ -559,6 +617,7 @@ async def _async_set_up_integrations(
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
     watch_task.cancel()
+    preimport_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATONS, {})
 
     _LOGGER.debug(
@@ -4,13 +4,14 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from typing import Any
 
 import aiohttp
 import async_timeout
 
-from homeassistant.const import HTTP_ACCEPTED, MATCH_ALL, STATE_ON
+from homeassistant.const import HTTP_ACCEPTED, STATE_ON
 from homeassistant.core import HomeAssistant, State, callback
-from homeassistant.helpers.significant_change import create_checker
+from homeassistant.helpers.state_report import StateReportEvent, StateReportPipeline
 import homeassistant.util.dt as dt_util
 
 from .const import API_CHANGE, DOMAIN, Cause
@@ -20,6 +21,9 @@ from .messages import AlexaResponse
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
 
+# Seconds to wait to group states, 0 reports on the next event loop iteration
+REPORT_STATE_WINDOW = 0
+
 
 async def async_enable_proactive_mode(hass, smart_home_config):
     """Enable the proactive mode.
@@ -30,78 +34,91 @@ async def async_enable_proactive_mode(hass, smart_home_config):
     await smart_home_config.async_get_access_token()
 
     @callback
-    def extra_significant_check(
-        hass: HomeAssistant,
-        old_state: str,
-        old_attrs: dict,
-        old_extra_arg: dict,
-        new_state: str,
-        new_attrs: dict,
-        new_extra_arg: dict,
-    ):
-        """Check if the serialized data has changed."""
-        return old_extra_arg is not None and old_extra_arg != new_extra_arg
+    def should_expose(state: State) -> bool:
+        """Return if the state changes of an entity are reported."""
+        if state.domain not in ENTITY_ADAPTERS:
+            return False
 
-    checker = await create_checker(hass, DOMAIN, extra_significant_check)
+        if not smart_home_config.should_expose(state.entity_id):
+            _LOGGER.debug("Not exposing %s because filtered by config", state.entity_id)
+            return False
 
-    async def async_entity_state_listener(
-        changed_entity: str,
-        old_state: State | None,
-        new_state: State | None,
-    ):
-        if not hass.is_running:
-            return
-
-        if not new_state:
-            return
-
-        if new_state.domain not in ENTITY_ADAPTERS:
-            return
-
-        if not smart_home_config.should_expose(changed_entity):
-            _LOGGER.debug("Not exposing %s because filtered by config", changed_entity)
-            return
+        return True
 
-        alexa_changed_entity: AlexaEntity = ENTITY_ADAPTERS[new_state.domain](
-            hass, smart_home_config, new_state
+    @callback
+    def serialize(state: State) -> tuple[AlexaEntity, list[dict]] | None:
+        """Serialize the properties of an entity that are reported on."""
+        alexa_changed_entity: AlexaEntity = ENTITY_ADAPTERS[state.domain](
+            hass, smart_home_config, state
         )
 
-        # Determine how entity should be reported on
         should_report = False
-        should_doorbell = False
-
         for interface in alexa_changed_entity.interfaces():
-            if not should_report and interface.properties_proactively_reported():
-                should_report = True
-
+            # Doorbell presses are reported as events
             if interface.name() == "Alexa.DoorbellEventSource":
-                should_doorbell = True
-                break
+                return None
+            if interface.properties_proactively_reported():
+                should_report = True
 
-        if not should_report and not should_doorbell:
-            return
+        if not should_report:
+            return None
 
-        if should_doorbell:
-            if new_state.state == STATE_ON:
-                await async_send_doorbell_event_message(
-                    hass, smart_home_config, alexa_changed_entity
-                )
-            return
+        return alexa_changed_entity, list(alexa_changed_entity.serialize_properties())
 
-        alexa_properties = list(alexa_changed_entity.serialize_properties())
+    @callback
+    def serialize_event(state: State) -> StateReportEvent | None:
+        """Serialize a doorbell press."""
+        if state.state != STATE_ON:
+            return None
 
-        if not checker.async_is_significant_change(
-            new_state, extra_arg=alexa_properties
-        ):
-            return
+        alexa_changed_entity: AlexaEntity = ENTITY_ADAPTERS[state.domain](
+            hass, smart_home_config, state
+        )
 
-        await async_send_changereport_message(
-            hass, smart_home_config, alexa_changed_entity, alexa_properties
+        for interface in alexa_changed_entity.interfaces():
+            if interface.name() == "Alexa.DoorbellEventSource":
+                return StateReportEvent(alexa_changed_entity)
+
+        return None
+
+    async def report(reports: dict[str, Any]) -> None:
+        """Send the change reports and doorbell presses."""
+        await asyncio.gather(
+            *(
+                async_send_doorbell_event_message(hass, smart_home_config, data.data)
+                if isinstance(data, StateReportEvent)
+                else async_send_changereport_message(
+                    hass, smart_home_config, data[0], data[1]
+                )
+                for data in reports.values()
+            )
         )
 
-    return hass.helpers.event.async_track_state_change(
-        MATCH_ALL, async_entity_state_listener
+    @callback
+    def extra_significant_check(
+        hass: HomeAssistant,
+        old_state: str,
+        old_attrs: dict,
+        old_extra_arg: tuple[AlexaEntity, list[dict]] | None,
+        new_state: str,
+        new_attrs: dict,
+        new_extra_arg: tuple[AlexaEntity, list[dict]],
+    ):
+        """Check if the serialized properties have changed."""
+        return old_extra_arg is not None and old_extra_arg[1] != new_extra_arg[1]
+
+    pipeline = StateReportPipeline(
+        hass,
+        DOMAIN,
+        should_expose=should_expose,
+        serialize=serialize,
+        report=report,
+        window=REPORT_STATE_WINDOW,
+        extra_significant_check=extra_significant_check,
+        serialize_event=serialize_event,
     )
+    await pipeline.async_setup()
+    return pipeline.async_start()
 
 
 async def async_send_changereport_message(
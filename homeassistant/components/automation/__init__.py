@@ -1,6 +1,7 @@
 """Allow to set up simple automation rules via the config file."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Awaitable, Callable, Dict, cast
 
@@ -8,6 +9,7 @@ import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
 from homeassistant.components import blueprint
+from homeassistant.components.trace.const import CONF_STORED_TRACES
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -220,7 +222,8 @@ async def async_setup(hass, config):
     # To register the automation blueprints
     async_get_blueprints(hass)
 
-    if not await _async_process_config(hass, config, component):
+    blueprints_used, _ = await _async_process_config(hass, config, component)
+    if not blueprints_used:
         await async_get_blueprints(hass).async_populate()
 
     async def trigger_service_handler(entity, service_call):
@@ -248,13 +251,15 @@ async def async_setup(hass, config):
     )
 
     async def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        conf = await component.async_prepare_reload()
+        """Reload the automations that changed in the config."""
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
         async_get_blueprints(hass).async_reset_cache()
-        await _async_process_config(hass, conf, component)
-        hass.bus.async_fire(EVENT_AUTOMATION_RELOADED, context=service_call.context)
+        _, changes = await _async_process_config(hass, conf, component)
+        hass.bus.async_fire(
+            EVENT_AUTOMATION_RELOADED, changes, context=service_call.context
+        )
 
     reload_helper = ReloadServiceHelper(reload_service_handler)
 
@@ -326,6 +331,15 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         """Return True if entity is on."""
         return self._async_detach_triggers is not None or self._is_enabled
 
+    @callback
+    def config_matches(self, raw_config, blueprint_inputs) -> bool:
+        """Return if the automation was created from this configuration."""
+        return (
+            raw_config is not None
+            and raw_config == self._raw_config
+            and blueprint_inputs == self._blueprint_inputs
+        )
+
     @property
     def referenced_areas(self):
         """Return a set of referenced areas."""
@@ -595,13 +609,24 @@ async def _async_process_config(
     hass: HomeAssistant,
     config: dict[str, Any],
     component: EntityComponent,
-) -> bool:
+) -> tuple[bool, dict[str, list[str]]]:
     """Process config and add automations.
 
-    Returns if blueprints were used.
+    Automations that are already running with the same configuration are
+    kept, the others are removed and created again.
+
+    Returns if blueprints were used and the entity ids of the created,
+    removed and unchanged automations.
     """
     entities = []
     blueprints_used = False
+    unchanged: list[str] = []
+    running: dict[tuple[str | None, str | None], AutomationEntity] = {
+        (entity.unique_id, entity.name): entity for entity in component.entities
+    }
+    stale: dict[str, AutomationEntity] = {
+        entity.entity_id: entity for entity in component.entities
+    }
 
     for config_key in extract_domain_configs(config, DOMAIN):
         conf: list[dict[str, Any] | blueprint.BlueprintInputs] = config[config_key]
@@ -634,6 +659,14 @@ async def _async_process_config(
             automation_id = config_block.get(CONF_ID)
             name = config_block.get(CONF_ALIAS) or f"{config_key} {list_no}"
 
+            existing = running.pop((automation_id, name), None)
+            if existing is not None and existing.config_matches(
+                raw_config, raw_blueprint_inputs
+            ):
+                stale.pop(existing.entity_id)
+                unchanged.append(existing.entity_id)
+                continue
+
             initial_state = config_block.get(CONF_INITIAL_STATE)
 
             action_script = Script(
@@ -649,6 +682,7 @@ async def _async_process_config(
                 # We don't pass variables here
                 # Automation will already render them to use them in the condition
                 # and so will pass them on to the script.
+                trace=config_block[CONF_TRACE][CONF_STORED_TRACES] > 0,
             )
 
             if CONF_CONDITION in config_block:
@@ -687,10 +721,29 @@ async def _async_process_config(
 
             entities.append(entity)
 
+    if stale:
+        await asyncio.gather(
+            *(component.async_remove_entity(entity_id) for entity_id in stale)
+        )
+
     if entities:
         await component.async_add_entities(entities)
 
-    return blueprints_used
+    changes = {
+        "created": [
+            entity.entity_id for entity in entities if entity.entity_id is not None
+        ],
+        "removed": list(stale),
+        "unchanged": unchanged,
+    }
+    LOGGER.debug(
+        "Processed automations: created %s, removed %s, unchanged %s",
+        changes["created"],
+        changes["removed"],
+        changes["unchanged"],
+    )
+
+    return blueprints_used, changes
 
 
 async def _async_process_if(hass, name, config, p_config):
@@ -22,9 +22,8 @@ from homeassistant.components.device_tracker.const import (
     SOURCE_TYPE_BLUETOOTH,
 )
 from homeassistant.components.device_tracker.legacy import (
-    YAML_DEVICES,
     Device,
-    async_load_config,
+    async_load_known_devices,
 )
 from homeassistant.const import CONF_DEVICE_ID
 from homeassistant.core import HomeAssistant, ServiceCall
@@ -97,9 +96,7 @@ async def get_tracking_devices(hass: HomeAssistant) -> tuple[set[str], set[str]]
 
     We just need the devices so set consider_home and home range to 0
     """
-    yaml_path: str = hass.config.path(YAML_DEVICES)
-
-    devices = await async_load_config(yaml_path, hass, timedelta(0))
+    devices = await async_load_known_devices(hass, timedelta(0))
     bluetooth_devices = [device for device in devices if is_bluetooth_device(device)]
 
     devices_to_track: set[str] = {
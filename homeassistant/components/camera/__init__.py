@@ -48,6 +48,7 @@ from homeassistant.helpers.config_validation import (  # noqa: F401
 )
 from homeassistant.helpers.entity import Entity, entity_sources
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.executor import POOL_IO, async_run_in_pool
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
@@ -58,10 +59,12 @@ from .const import (
     CONF_DURATION,
     CONF_LOOKBACK,
     DATA_CAMERA_PREFS,
+    DEFAULT_SNAPSHOT_MAX_AGE,
     DOMAIN,
     SERVICE_RECORD,
 )
 from .prefs import CameraPreferences
+from .snapshot import CameraSnapshotCache
 
 # mypy: allow-untyped-calls
 
@@ -134,14 +137,22 @@ async def async_request_stream(hass: HomeAssistant, entity_id: str, fmt: str) ->
 
 @bind_hass
 async def async_get_image(
-    hass: HomeAssistant, entity_id: str, timeout: int = 10
+    hass: HomeAssistant,
+    entity_id: str,
+    timeout: int = 10,
+    width: int | None = None,
+    height: int | None = None,
 ) -> Image:
-    """Fetch an image from a camera entity."""
+    """Fetch an image from a camera entity.
+
+    The image is scaled down as close as possible to width and height
+    when both are given.
+    """
     camera = _get_camera_from_entity_id(hass, entity_id)
 
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            image = await camera.async_camera_image()
+            image = await camera.async_snapshot_image(width, height)
 
             if image:
                 return Image(camera.content_type, image)
@@ -324,6 +335,7 @@ class Camera(Entity):
         self.stream_options: dict[str, str] = {}
         self.content_type: str = DEFAULT_CONTENT_TYPE
         self.access_tokens: collections.deque = collections.deque([], 2)
+        self._snapshot_cache = CameraSnapshotCache(self)
         self.async_update_token()
 
     @property
@@ -361,6 +373,15 @@ class Camera(Entity):
         """Return the camera model."""
         return None
 
+    @property
+    def use_stream_for_stills(self) -> bool:
+        """Return True if still images may be taken from a running stream.
+
+        Cameras that would otherwise decode the stream source for every still
+        image can return True to use the latest keyframe of the stream instead.
+        """
+        return False
+
     @property
     def frame_interval(self) -> float:
         """Return the interval between frames of the mjpeg stream."""
@@ -387,14 +408,33 @@ class Camera(Entity):
 
     async def async_camera_image(self) -> bytes | None:
         """Return bytes of camera image."""
-        return await self.hass.async_add_executor_job(self.camera_image)
+        return await async_run_in_pool(
+            self.hass,
+            POOL_IO,
+            self.platform.platform_name if self.platform else None,
+            self.camera_image,
+        )
+
+    @final
+    async def async_snapshot_image(
+        self, width: int | None = None, height: int | None = None
+    ) -> bytes | None:
+        """Return bytes of a shared, possibly cached camera image.
+
+        Concurrent callers share a single call to async_camera_image and the
+        image is reused for the snapshot max age set in the preferences.
+        """
+        max_age = DEFAULT_SNAPSHOT_MAX_AGE
+        if (prefs := self.hass.data.get(DATA_CAMERA_PREFS)) is not None:
+            max_age = prefs.get(self.entity_id).snapshot_max_age
+        return await self._snapshot_cache.async_get_image(max_age, width, height)
 
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
         """Generate an HTTP MJPEG stream from camera images."""
         return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
+            request, self.async_snapshot_image, self.content_type, interval
         )
 
     async def handle_async_mjpeg_stream(
@@ -523,9 +563,21 @@ class CameraImageView(CameraView):
 
     async def handle(self, request: web.Request, camera: Camera) -> web.Response:
         """Serve camera image."""
+        width = request.query.get("width")
+        height = request.query.get("height")
+        try:
+            width_px = int(width) if width is not None else None
+            height_px = int(height) if height is not None else None
+        except ValueError as err:
+            raise web.HTTPBadRequest() from err
+        if (width_px is not None and width_px <= 0) or (
+            height_px is not None and height_px <= 0
+        ):
+            raise web.HTTPBadRequest()
+
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(CAMERA_IMAGE_TIMEOUT):
-                image = await camera.async_camera_image()
+                image = await camera.async_snapshot_image(width_px, height_px)
 
             if image:
                 return web.Response(body=image, content_type=camera.content_type)
@@ -631,6 +683,7 @@ async def websocket_get_prefs(
         vol.Required("type"): "camera/update_prefs",
         vol.Required("entity_id"): cv.entity_id,
         vol.Optional("preload_stream"): bool,
+        vol.Optional("snapshot_max_age"): vol.All(vol.Coerce(float), vol.Range(min=0)),
     }
 )
 @websocket_api.async_response
@@ -664,7 +717,7 @@ async def async_handle_snapshot_service(
         _LOGGER.error("Can't write %s, no access to path!", snapshot_file)
         return
 
-    image = await camera.async_camera_image()
+    image = await camera.async_snapshot_image()
 
     def _write_image(to_file: str, image_data: bytes | None) -> None:
         """Executor helper to write image."""
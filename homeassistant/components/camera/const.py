@@ -6,6 +6,9 @@ DOMAIN: Final = "camera"
 DATA_CAMERA_PREFS: Final = "camera_prefs"
 
 PREF_PRELOAD_STREAM: Final = "preload_stream"
+PREF_SNAPSHOT_MAX_AGE: Final = "snapshot_max_age"
+
+DEFAULT_SNAPSHOT_MAX_AGE: Final = 0.0
 
 SERVICE_RECORD: Final = "record"
 
@@ -1,4 +1,4 @@
-"""Image processing for HomeKit component."""
+"""Image processing for camera component."""
 
 import logging
 
@@ -33,6 +33,19 @@ def scale_jpeg_camera_image(cam_image, width, height):
     )
 
 
+def jpeg_image_size(content):
+    """Return the width and height of a jpeg image, None if unknown."""
+    turbo_jpeg = TurboJPEGSingleton.instance()
+    if not turbo_jpeg:
+        return None
+
+    try:
+        (width, height, _, _) = turbo_jpeg.decode_header(content)
+    except Exception:  # pylint: disable=broad-except
+        return None
+    return width, height
+
+
 class TurboJPEGSingleton:
     """
     Load TurboJPEG only once.
@@ -63,6 +76,6 @@ class TurboJPEGSingleton:
             TurboJPEGSingleton.__instance = TurboJPEG()
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception(
-                "Error loading libturbojpeg; Cameras may impact HomeKit performance"
+                "Error loading libturbojpeg; Camera snapshots will not be scaled"
             )
             TurboJPEGSingleton.__instance = False
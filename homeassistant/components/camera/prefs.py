@@ -1,12 +1,17 @@
 """Preference management for camera component."""
 from __future__ import annotations
 
-from typing import Final
+from typing import Final, cast
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 
-from .const import DOMAIN, PREF_PRELOAD_STREAM
+from .const import (
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    DOMAIN,
+    PREF_PRELOAD_STREAM,
+    PREF_SNAPSHOT_MAX_AGE,
+)
 
 STORAGE_KEY: Final = DOMAIN
 STORAGE_VERSION: Final = 1
@@ -15,18 +20,25 @@ STORAGE_VERSION: Final = 1
 class CameraEntityPreferences:
     """Handle preferences for camera entity."""
 
-    def __init__(self, prefs: dict[str, bool]) -> None:
+    def __init__(self, prefs: dict[str, bool | float]) -> None:
         """Initialize prefs."""
         self._prefs = prefs
 
-    def as_dict(self) -> dict[str, bool]:
+    def as_dict(self) -> dict[str, bool | float]:
         """Return dictionary version."""
         return self._prefs
 
     @property
     def preload_stream(self) -> bool:
         """Return if stream is loaded on hass start."""
-        return self._prefs.get(PREF_PRELOAD_STREAM, False)
+        return cast(bool, self._prefs.get(PREF_PRELOAD_STREAM, False))
+
+    @property
+    def snapshot_max_age(self) -> float:
+        """Return how many seconds a camera image may be reused."""
+        return cast(
+            float, self._prefs.get(PREF_SNAPSHOT_MAX_AGE, DEFAULT_SNAPSHOT_MAX_AGE)
+        )
 
 
 class CameraPreferences:
@@ -36,7 +48,7 @@ class CameraPreferences:
         """Initialize camera prefs."""
         self._hass = hass
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
-        self._prefs: dict[str, dict[str, bool]] | None = None
+        self._prefs: dict[str, dict[str, bool | float]] | None = None
 
     async def async_initialize(self) -> None:
         """Finish initializing the preferences."""
@@ -52,6 +64,7 @@ class CameraPreferences:
         entity_id: str,
         *,
         preload_stream: bool | UndefinedType = UNDEFINED,
+        snapshot_max_age: float | UndefinedType = UNDEFINED,
         stream_options: dict[str, str] | UndefinedType = UNDEFINED,
     ) -> None:
         """Update camera preferences."""
@@ -60,7 +73,10 @@ class CameraPreferences:
         if not self._prefs.get(entity_id):
             self._prefs[entity_id] = {}
 
-        for key, value in ((PREF_PRELOAD_STREAM, preload_stream),):
+        for key, value in (
+            (PREF_PRELOAD_STREAM, preload_stream),
+            (PREF_SNAPSHOT_MAX_AGE, snapshot_max_age),
+        ):
             if value is not UNDEFINED:
                 self._prefs[entity_id][key] = value
 
@@ -0,0 +1,132 @@
+"""Snapshot cache for camera component."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import async_timeout
+
+from homeassistant.core import callback
+
+from .const import CAMERA_IMAGE_TIMEOUT
+from .img_util import jpeg_image_size, scale_jpeg_camera_image
+
+if TYPE_CHECKING:
+    from . import Camera
+
+# Scaled variants kept per image
+MAX_SCALED_IMAGES = 8
+
+
+class CameraSnapshotCache:
+    """Share still images of a camera between concurrent consumers.
+
+    Requests that arrive while an image is being fetched wait for that fetch
+    instead of starting their own. The last image is reused while it is
+    younger than the requested max age, and the most recently requested
+    scaled variants are produced once per image in the executor.
+    """
+
+    def __init__(self, camera: Camera) -> None:
+        """Initialize the snapshot cache."""
+        self._camera = camera
+        self._image: bytes | None = None
+        self._fetched_at: float = 0.0
+        self._pending: asyncio.Task[bytes | None] | None = None
+        self._image_size: tuple[int, int] | None = None
+        self._scaled: OrderedDict[
+            tuple[int, int], asyncio.Future[bytes]
+        ] = OrderedDict()
+
+    async def async_get_image(
+        self,
+        max_age: float,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> bytes | None:
+        """Return a camera image that is at most max_age seconds old."""
+        hass = self._camera.hass
+        image = self._image
+        if image is None or hass.loop.time() - self._fetched_at > max_age:
+            if self._pending is None:
+                self._pending = hass.async_create_task(self._async_fetch())
+            # Shield the shared fetch so a caller timing out does not
+            # cancel it for everyone else waiting on it.
+            image = await asyncio.shield(self._pending)
+
+        if image is None or width is None or height is None:
+            return image
+
+        if width <= 0 or height <= 0:
+            raise ValueError("Image width and height must be positive")
+
+        if self._camera.content_type != "image/jpeg":
+            return image
+
+        if image is not self._image:
+            # A newer image replaced this one while we were waiting
+            return await self._async_scale(image, width, height)
+
+        if self._image_size is None:
+            self._image_size = await hass.async_add_executor_job(jpeg_image_size, image)
+            if image is not self._image:
+                return await self._async_scale(image, width, height)
+        if self._image_size is not None and (
+            width >= self._image_size[0] or height >= self._image_size[1]
+        ):
+            # Images are never scaled up
+            return image
+
+        key = (width, height)
+        if (scaled := self._scaled.get(key)) is None:
+            scaled = self._scaled[key] = hass.async_create_task(
+                self._async_scale(image, width, height)
+            )
+            scaled.add_done_callback(lambda task: self._async_scaled(key, task))
+            while len(self._scaled) > MAX_SCALED_IMAGES:
+                self._scaled.popitem(last=False)
+        else:
+            self._scaled.move_to_end(key)
+        return await asyncio.shield(scaled)
+
+    @callback
+    def _async_scaled(self, key: tuple[int, int], task: asyncio.Future) -> None:
+        """Forget a scaled variant that could not be produced."""
+        if (task.cancelled() or task.exception() is not None) and self._scaled.get(
+            key
+        ) is task:
+            del self._scaled[key]
+
+    async def _async_fetch(self) -> bytes | None:
+        """Fetch a new image from the camera."""
+        camera = self._camera
+        try:
+            async with async_timeout.timeout(CAMERA_IMAGE_TIMEOUT):
+                image = None
+                if camera.use_stream_for_stills and camera.stream is not None:
+                    image = await camera.stream.async_get_image()
+                if image is None:
+                    image = await camera.async_camera_image()
+        finally:
+            self._pending = None
+
+        if image is None:
+            return None
+
+        if image != self._image:
+            self._image_size = None
+            self._scaled = OrderedDict()
+        self._image = image
+        self._fetched_at = camera.hass.loop.time()
+        return image
+
+    async def _async_scale(self, image: bytes, width: int, height: int) -> bytes:
+        """Scale an image in the executor."""
+        # Deferred import to avoid a circular import at module load
+        from . import Image  # pylint: disable=import-outside-toplevel
+
+        camera = self._camera
+        return await camera.hass.async_add_executor_job(
+            scale_jpeg_camera_image, Image(camera.content_type, image), width, height
+        )
@@ -19,6 +19,7 @@ from homeassistant.const import CLOUD_NEVER_EXPOSED_ENTITIES, HTTP_BAD_REQUEST
 from homeassistant.core import HomeAssistant, callback, split_entity_id
 from homeassistant.helpers import entity_registry, start
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.state_report import async_invalidate_exposed_entities
 from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
@@ -171,6 +172,8 @@ class AlexaConfig(alexa_config.AbstractConfig):
 
     async def _async_prefs_updated(self, prefs):
         """Handle updated preferences."""
+        async_invalidate_exposed_entities(self.hass, ALEXA_DOMAIN)
+
         if ALEXA_DOMAIN not in self.hass.config.components and self.enabled:
             await async_setup_component(self.hass, ALEXA_DOMAIN, {})
 
@@ -10,6 +10,7 @@ from homeassistant.components.google_assistant.helpers import AbstractConfig
 from homeassistant.const import CLOUD_NEVER_EXPOSED_ENTITIES, HTTP_OK
 from homeassistant.core import CoreState, split_entity_id
 from homeassistant.helpers import entity_registry, start
+from homeassistant.helpers.state_report import async_invalidate_exposed_entities
 from homeassistant.setup import async_setup_component
 
 from .const import (
@@ -172,6 +173,8 @@ class CloudGoogleConfig(AbstractConfig):
 
     async def _async_prefs_updated(self, prefs):
         """Handle updated preferences."""
+        async_invalidate_exposed_entities(self.hass, GOOGLE_DOMAIN)
+
         if self.enabled and GOOGLE_DOMAIN not in self.hass.config.components:
             await async_setup_component(self.hass, GOOGLE_DOMAIN, {})
 
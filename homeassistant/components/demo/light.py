@@ -19,6 +19,8 @@ from homeassistant.components.light import (
     SUPPORT_EFFECT,
     LightEntity,
 )
+from homeassistant.const import SERVICE_TURN_OFF, SERVICE_TURN_ON
+from homeassistant.helpers import entity_platform
 
 from . import DOMAIN
 
@@ -86,6 +88,24 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         ]
     )
 
+    # The demo lights are switched together, as a hub would send one command
+    # for all lights targeted by a service call.
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_batch_service(SERVICE_TURN_ON, async_turn_on_lights)
+    platform.async_register_batch_service(SERVICE_TURN_OFF, async_turn_off_lights)
+
+
+async def async_turn_on_lights(lights):
+    """Turn on demo lights at once."""
+    for light, params in lights:
+        await light.async_turn_on(**params)
+
+
+async def async_turn_off_lights(lights):
+    """Turn off demo lights at once."""
+    for light, params in lights:
+        await light.async_turn_off(**params)
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up the Demo config entry."""
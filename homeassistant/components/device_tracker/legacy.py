@@ -38,6 +38,8 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
 )
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType, GPSType, StateType
 from homeassistant.setup import async_prepare_setup_platform, async_start_setup
 from homeassistant.util import dt as dt_util
@@ -70,6 +72,7 @@ from .const import (
 )
 
 SERVICE_SEE: Final = "see"
+SERVICE_EXPORT_KNOWN_DEVICES: Final = "export_known_devices"
 
 SOURCE_TYPES: Final[tuple[str, ...]] = (
     SOURCE_TYPE_GPS,
@@ -118,6 +121,10 @@ SERVICE_SEE_PAYLOAD_SCHEMA: Final[vol.Schema] = vol.Schema(
 )
 
 YAML_DEVICES: Final = "known_devices.yaml"
+DATA_KNOWN_DEVICES: Final = "device_tracker_known_devices"
+STORAGE_KEY: Final = "device_tracker.known_devices"
+STORAGE_VERSION: Final = 1
+SAVE_DELAY: Final = 10
 EVENT_NEW_DEVICE: Final = "device_tracker_new_device"
 
 
@@ -195,6 +202,15 @@ async def async_setup_integration(hass: HomeAssistant, config: ConfigType) -> No
         DOMAIN, SERVICE_SEE, async_see_service, SERVICE_SEE_PAYLOAD_SCHEMA
     )
 
+    async def async_export_known_devices_service(call: ServiceCall) -> None:
+        """Service to move the stored devices to the YAML configuration file."""
+        known_devices = await async_get_known_devices(hass)
+        await known_devices.async_export(hass.config.path(YAML_DEVICES))
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_EXPORT_KNOWN_DEVICES, async_export_known_devices_service
+    )
+
     # restore
     await tracker.async_setup_tracked_device()
 
@@ -389,8 +405,6 @@ def async_setup_scanner_platform(
 
 async def get_tracker(hass: HomeAssistant, config: ConfigType) -> DeviceTracker:
     """Create a tracker."""
-    yaml_path = hass.config.path(YAML_DEVICES)
-
     conf = config.get(DOMAIN, [])
     conf = conf[0] if conf else {}
     consider_home = conf.get(CONF_CONSIDER_HOME, DEFAULT_CONSIDER_HOME)
@@ -400,7 +414,7 @@ async def get_tracker(hass: HomeAssistant, config: ConfigType) -> DeviceTracker:
     if track_new is None:
         track_new = defaults.get(CONF_TRACK_NEW, DEFAULT_TRACK_NEW)
 
-    devices = await async_load_config(yaml_path, hass, consider_home)
+    devices = await async_load_known_devices(hass, consider_home)
     tracker = DeviceTracker(hass, consider_home, track_new, defaults, devices)
     return tracker
 
@@ -427,7 +441,6 @@ class DeviceTracker:
             else defaults.get(CONF_TRACK_NEW, DEFAULT_TRACK_NEW)
         )
         self.defaults = defaults
-        self._is_updating = asyncio.Lock()
 
         for dev in devices:
             if self.devices[dev.dev_id] is not dev:
@@ -562,22 +575,16 @@ class DeviceTracker:
             },
         )
 
-        # update known_devices.yaml
-        self.hass.async_create_task(
-            self.async_update_config(
-                self.hass.config.path(YAML_DEVICES), dev_id, device
-            )
-        )
+        # update the known devices
+        await self.async_add_known_device(device)
 
-    async def async_update_config(self, path: str, dev_id: str, device: Device) -> None:
-        """Add device to YAML configuration file.
+    async def async_add_known_device(self, device: Device) -> None:
+        """Add a device to the known devices.
 
         This method is a coroutine.
         """
-        async with self._is_updating:
-            await self.hass.async_add_executor_job(
-                update_config, self.hass.config.path(YAML_DEVICES), dev_id, device
-            )
+        known_devices = await async_get_known_devices(self.hass)
+        known_devices.async_add(device)
 
     @callback
     def async_update_stale(self, now: dt_util.dt.datetime) -> None:
@@ -896,20 +903,112 @@ async def async_load_config(
     return result
 
 
-def update_config(path: str, dev_id: str, device: Device) -> None:
-    """Add device to YAML configuration file."""
-    with open(path, "a") as out:
+class KnownDevices:
+    """Devices seen by the device tracker that are not configured in YAML.
+
+    The devices are kept in memory and saved to storage with a delay, so
+    discovering many devices at once results in a single write. They can be
+    exported to the YAML configuration file to configure them.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the known devices."""
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self.devices: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the known devices from storage."""
+        data = await self._store.async_load()
+        if data is not None:
+            self.devices = data["devices"]
+
+    @callback
+    def async_add(self, device: Device) -> None:
+        """Add or update a known device."""
         device_config = {
-            device.dev_id: {
-                ATTR_NAME: device.name,
-                ATTR_MAC: device.mac,
-                ATTR_ICON: device.icon,
-                "picture": device.config_picture,
-                "track": device.track,
-            }
+            ATTR_NAME: device.name,
+            ATTR_MAC: device.mac,
+            ATTR_ICON: device.icon,
+            "picture": device.config_picture,
+            "track": device.track,
         }
+        if self.devices.get(device.dev_id) == device_config:
+            return
+        self.devices[device.dev_id] = device_config
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_remove(self, dev_id: str) -> None:
+        """Remove a known device."""
+        if self.devices.pop(dev_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_export(self, path: str) -> None:
+        """Move the known devices to the YAML configuration file."""
+        devices = dict(self.devices)
+        if not devices:
+            return
+        await self.hass.async_add_executor_job(_append_yaml_devices, path, devices)
+        for dev_id in devices:
+            self.async_remove(dev_id)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"devices": self.devices}
+
+
+@singleton(DATA_KNOWN_DEVICES)
+async def async_get_known_devices(hass: HomeAssistant) -> KnownDevices:
+    """Return the known devices."""
+    known_devices = KnownDevices(hass)
+    await known_devices.async_load()
+    return known_devices
+
+
+async def async_load_known_devices(
+    hass: HomeAssistant, consider_home: timedelta
+) -> list[Device]:
+    """Load the devices from the YAML configuration file and from storage.
+
+    Devices configured in the YAML file take precedence, so a known device
+    that is added to the file is removed from storage.
+
+    This method is a coroutine.
+    """
+    devices = await async_load_config(
+        hass.config.path(YAML_DEVICES), hass, consider_home
+    )
+    dev_ids = {device.dev_id for device in devices}
+    macs = {device.mac for device in devices if device.mac}
+
+    known_devices = await async_get_known_devices(hass)
+    for dev_id, device_config in list(known_devices.devices.items()):
+        if dev_id in dev_ids or device_config[ATTR_MAC] in macs:
+            known_devices.async_remove(dev_id)
+            continue
+        devices.append(
+            Device(
+                hass,
+                consider_home,
+                device_config["track"],
+                dev_id,
+                device_config[ATTR_MAC],
+                device_config[ATTR_NAME],
+                picture=device_config["picture"],
+                icon=device_config[ATTR_ICON],
+            )
+        )
+
+    return devices
+
+
+def _append_yaml_devices(path: str, devices: dict[str, dict[str, Any]]) -> None:
+    """Add devices to the YAML configuration file."""
+    with open(path, "a") as out:
         out.write("\n")
-        out.write(dump(device_config))
+        out.write(dump(devices))
 
 
 def get_gravatar_for_email(email: str) -> str:
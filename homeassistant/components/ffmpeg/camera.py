@@ -45,6 +45,11 @@ class FFmpegCamera(Camera):
         """Return supported features."""
         return SUPPORT_STREAM
 
+    @property
+    def use_stream_for_stills(self):
+        """Use the keyframes of a running stream for still images."""
+        return True
+
     async def stream_source(self):
         """Return the stream source."""
         return self._input.split(" ")[-1]
@@ -3,9 +3,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from asyncio import gather
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 import logging
 import pprint
+from typing import Any
 
 from aiohttp.web import json_response
 
@@ -25,6 +26,7 @@ from homeassistant.helpers.entity_registry import RegistryEntry
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.storage import Store
+from homeassistant.util.unit_system import UnitSystem
 
 from . import trait
 from .const import (
@@ -99,6 +101,7 @@ class AbstractConfig(ABC):
         self._store = None
         self._google_sync_unsub = {}
         self._local_sdk_active = False
+        self.serialize_cache = SerializeCache()
 
     async def async_initialize(self):
         """Perform async initialization of config."""
@@ -354,6 +357,31 @@ class GoogleConfigStore:
             self._data = data
 
 
+class SerializeCache:
+    """Serializations of entities for SYNC and QUERY responses.
+
+    A serialization is reused as long as everything it was built from is
+    unchanged. QUERY serializations are keyed by the state object and the
+    unit system, so any state change invalidates them. SYNC serializations
+    are keyed by the attributes of the state and the entity registry, device
+    registry, area and configuration entries they were built from.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.sync: dict[str, tuple[tuple, dict[str, Any]]] = {}
+        self.query: dict[str, tuple[State, UnitSystem, dict[str, Any]]] = {}
+
+    @callback
+    def async_prune(self, entity_ids: Iterable[str]) -> None:
+        """Remove the serializations of all other entities."""
+        keep = set(entity_ids)
+        for entity_id in self.sync.keys() - keep:
+            del self.sync[entity_id]
+        for entity_id in self.query.keys() - keep:
+            del self.query[entity_id]
+
+
 class RequestData:
     """Hold data associated with a particular request."""
 
@@ -480,12 +508,45 @@ class GoogleEntity:
         state = self.state
 
         entity_config = self.config.entity_config.get(state.entity_id, {})
-        name = (entity_config.get(CONF_NAME) or state.name).strip()
-        domain = state.domain
-        device_class = state.attributes.get(ATTR_DEVICE_CLASS)
         entity_entry, device_entry = await _get_entity_and_device(
             self.hass, state.entity_id
         )
+        area = await _get_area(self.hass, entity_entry, device_entry)
+        local = self.config.is_local_sdk_active
+        local_exposed = local and self.should_expose_local()
+        key = (
+            state.attributes,
+            entity_config,
+            entity_entry,
+            device_entry,
+            area,
+            agent_user_id,
+            self.config.should_report_state,
+            local,
+            local and self.config.should_2fa(state),
+            local and self.config.local_sdk_webhook_id,
+            local_exposed and self.hass.http.server_port,
+            local_exposed and self.hass.config.api.use_ssl,
+            local_exposed and get_url(self.hass, prefer_external=True),
+            self.hass.config.units,
+        )
+
+        cache = self.config.serialize_cache.sync
+        if (cached := cache.get(state.entity_id)) is not None and cached[0] == key:
+            return cached[1]
+
+        device = await self._sync_serialize(
+            agent_user_id, entity_config, area, device_entry
+        )
+        cache[state.entity_id] = (key, device)
+        return device
+
+    async def _sync_serialize(self, agent_user_id, entity_config, area, device_entry):
+        """Serialize entity for a SYNC response without using the cache."""
+        state = self.state
+        name = (entity_config.get(CONF_NAME) or state.name).strip()
+        domain = state.domain
+        device_class = state.attributes.get(ATTR_DEVICE_CLASS)
 
         traits = self.traits()
 
@@ -522,10 +583,8 @@ class GoogleEntity:
         room = entity_config.get(CONF_ROOM_HINT)
         if room:
             device["roomHint"] = room
-        else:
-            area = await _get_area(self.hass, entity_entry, device_entry)
-            if area and area.name:
-                device["roomHint"] = area.name
+        elif area and area.name:
+            device["roomHint"] = area.name
 
         device_info = await _get_device_info(device_entry)
         if device_info:
@@ -540,15 +599,23 @@ class GoogleEntity:
         https://developers.google.com/actions/smarthome/create-app#actiondevicesquery
         """
         state = self.state
+        units = self.hass.config.units
+        cache = self.config.serialize_cache.query
+        if (
+            (cached := cache.get(state.entity_id)) is not None
+            and cached[0] is state
+            and cached[1] is units
+        ):
+            return cached[2]
 
         if state.state == STATE_UNAVAILABLE:
-            return {"online": False}
-
-        attrs = {"online": True}
-
-        for trt in self.traits():
-            deep_update(attrs, trt.query_attributes())
+            attrs = {"online": False}
+        else:
+            attrs = {"online": True}
+            for trt in self.traits():
+                deep_update(attrs, trt.query_attributes())
 
+        cache[state.entity_id] = (state, units, attrs)
         return attrs
 
     @callback
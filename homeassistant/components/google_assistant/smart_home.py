@@ -101,6 +101,9 @@ async def async_devices_sync(hass, data, payload):
         else:
             devices.append(result)
 
+    # Forget the serializations of entities that are no longer synced
+    data.config.serialize_cache.async_prune(device["id"] for device in devices)
+
     response = {"agentUserId": agent_user_id, "devices": devices}
 
     await data.config.async_connect_agent_user(agent_user_id)
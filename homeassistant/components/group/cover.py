@@ -1,7 +1,7 @@
 """This platform allows several cover to be grouped into one cover."""
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, cast
 
 import voluptuous as vol
 
@@ -40,11 +40,12 @@ from homeassistant.const import (
     STATE_OPEN,
     STATE_OPENING,
 )
-from homeassistant.core import CoreState, Event, HomeAssistant, State
+from homeassistant.core import CoreState, Event, HomeAssistant, State, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.aggregate import CountAggregate, NumericAggregate
 
 from . import GroupEntity
 
@@ -99,6 +100,15 @@ class CoverGroup(GroupEntity, CoverEntity):
         self._attr_name = name
         self._attr_extra_state_attributes = {ATTR_ENTITY_ID: entities}
 
+        # Contributions of the members to the group state
+        self._order = {entity_id: idx for idx, entity_id in enumerate(entities)}
+        self._states = CountAggregate()
+        # Members that are not closed, by their position in the group
+        self._active = NumericAggregate()
+        self._positions = CountAggregate()
+        self._tilt_positions = CountAggregate()
+        self._assumed = CountAggregate()
+
     async def _update_supported_features_event(self, event: Event) -> None:
         self.async_set_context(event.context)
         entity = event.data.get("entity_id")
@@ -119,6 +129,7 @@ class CoverGroup(GroupEntity, CoverEntity):
                 values.discard(entity_id)
             for values in self._tilts.values():
                 values.discard(entity_id)
+            self._async_update_member(entity_id, None)
             if update_state:
                 await self.async_defer_or_update_ha_state()
             return
@@ -151,9 +162,48 @@ class CoverGroup(GroupEntity, CoverEntity):
         else:
             self._tilts[KEY_POSITION].discard(entity_id)
 
+        self._async_update_member(entity_id, new_state)
+
         if update_state:
             await self.async_defer_or_update_ha_state()
 
+    @callback
+    def _async_update_member(self, entity_id: str, state: State | None) -> None:
+        """Update the contributions of a member to the group state."""
+        if state is None:
+            for aggregate in (
+                self._states,
+                self._active,
+                self._positions,
+                self._tilt_positions,
+                self._assumed,
+            ):
+                aggregate.remove(entity_id)
+            return
+
+        self._states.set_value(entity_id, state.state)
+        if state.state in (STATE_OPEN, STATE_CLOSING, STATE_OPENING):
+            self._active.set_value(entity_id, self._order[entity_id])
+        else:
+            self._active.remove(entity_id)
+
+        if entity_id in self._covers[KEY_POSITION]:
+            self._positions.set_value(
+                entity_id, state.attributes.get(ATTR_CURRENT_POSITION)
+            )
+        else:
+            self._positions.remove(entity_id)
+        if entity_id in self._tilts[KEY_POSITION]:
+            self._tilt_positions.set_value(
+                entity_id, state.attributes.get(ATTR_CURRENT_TILT_POSITION)
+            )
+        else:
+            self._tilt_positions.remove(entity_id)
+
+        self._assumed.set_value(
+            entity_id, bool(state.attributes.get(ATTR_ASSUMED_STATE))
+        )
+
     async def async_added_to_hass(self) -> None:
         """Register listeners."""
         for entity_id in self._entities:
@@ -251,55 +301,32 @@ class CoverGroup(GroupEntity, CoverEntity):
         self._attr_is_closed = True
         self._attr_is_closing = False
         self._attr_is_opening = False
-        for entity_id in self._entities:
-            state = self.hass.states.get(entity_id)
-            if not state:
-                continue
-            if state.state == STATE_OPEN:
-                self._attr_is_closed = False
-                break
-            if state.state == STATE_CLOSING:
-                self._attr_is_closing = True
-                break
-            if state.state == STATE_OPENING:
-                self._attr_is_opening = True
-                break
+        # The first member that is not closed determines the state
+        if (active := self._active.min_member) is not None:
+            state = self._states.values[active]
+            self._attr_is_closed = state != STATE_OPEN
+            self._attr_is_closing = state == STATE_CLOSING
+            self._attr_is_opening = state == STATE_OPENING
 
         self._attr_current_cover_position = None
         if self._covers[KEY_POSITION]:
-            position: int | None = -1
             self._attr_current_cover_position = 0 if self.is_closed else 100
-            for entity_id in self._covers[KEY_POSITION]:
-                state = self.hass.states.get(entity_id)
-                if state is None:
-                    continue
-                pos = state.attributes.get(ATTR_CURRENT_POSITION)
-                if position == -1:
-                    position = pos
-                elif position != pos:
-                    self._attr_assumed_state = True
-                    break
-            else:
-                if position != -1:
-                    self._attr_current_cover_position = position
+            if len(self._positions.counts) > 1:
+                self._attr_assumed_state = True
+            elif self._positions.counts:
+                self._attr_current_cover_position = cast(
+                    "int | None", self._positions.most_common()
+                )
 
         self._attr_current_cover_tilt_position = None
         if self._tilts[KEY_POSITION]:
-            position = -1
             self._attr_current_cover_tilt_position = 100
-            for entity_id in self._tilts[KEY_POSITION]:
-                state = self.hass.states.get(entity_id)
-                if state is None:
-                    continue
-                pos = state.attributes.get(ATTR_CURRENT_TILT_POSITION)
-                if position == -1:
-                    position = pos
-                elif position != pos:
-                    self._attr_assumed_state = True
-                    break
-            else:
-                if position != -1:
-                    self._attr_current_cover_tilt_position = position
+            if len(self._tilt_positions.counts) > 1:
+                self._attr_assumed_state = True
+            elif self._tilt_positions.counts:
+                self._attr_current_cover_tilt_position = cast(
+                    "int | None", self._tilt_positions.most_common()
+                )
 
         supported_features = 0
         supported_features |= (
@@ -317,10 +344,4 @@ class CoverGroup(GroupEntity, CoverEntity):
         self._attr_supported_features = supported_features
 
         if not self._attr_assumed_state:
-            for entity_id in self._entities:
-                state = self.hass.states.get(entity_id)
-                if state is None:
-                    continue
-                if state and state.attributes.get(ATTR_ASSUMED_STATE):
-                    self._attr_assumed_state = True
-                    break
+            self._attr_assumed_state = self._assumed.any(True)
@@ -1,10 +1,9 @@
 """This platform allows several lights to be grouped into one light."""
 from __future__ import annotations
 
-from collections import Counter
-from collections.abc import Iterator
-import itertools
-from typing import Any, Callable, Set, cast
+from functools import reduce
+from operator import or_
+from typing import Any, Set, cast
 
 import voluptuous as vol
 
@@ -42,11 +41,17 @@ from homeassistant.const import (
     STATE_ON,
     STATE_UNAVAILABLE,
 )
-from homeassistant.core import CoreState, Event, HomeAssistant, State
+from homeassistant.core import CoreState, Event, HomeAssistant, State, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.aggregate import (
+    CountAggregate,
+    NumericAggregate,
+    TupleMeanAggregate,
+    UnionAggregate,
+)
 
 from . import GroupEntity
 
@@ -94,13 +99,50 @@ class LightGroup(GroupEntity, light.LightEntity):
         self._attr_name = name
         self._attr_extra_state_attributes = {ATTR_ENTITY_ID: entity_ids}
 
+        # Contributions of the members to the group state
+        self._states = CountAggregate()
+        self._numeric_on = {
+            key: NumericAggregate(entity_ids)
+            for key in (ATTR_BRIGHTNESS, ATTR_COLOR_TEMP, ATTR_WHITE_VALUE)
+        }
+        self._colors_on = {
+            key: TupleMeanAggregate()
+            for key in (
+                ATTR_HS_COLOR,
+                ATTR_RGB_COLOR,
+                ATTR_RGBW_COLOR,
+                ATTR_RGBWW_COLOR,
+                ATTR_XY_COLOR,
+            )
+        }
+        self._counts_on = {
+            key: CountAggregate() for key in (ATTR_EFFECT, ATTR_COLOR_MODE)
+        }
+        self._numeric = {
+            key: NumericAggregate(entity_ids)
+            for key in (ATTR_MIN_MIREDS, ATTR_MAX_MIREDS)
+        }
+        self._unions = {
+            key: UnionAggregate()
+            for key in (ATTR_EFFECT_LIST, ATTR_SUPPORTED_COLOR_MODES)
+        }
+        self._supported_features = UnionAggregate()
+
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
 
-        async def async_state_changed_listener(event: Event) -> None:
+        @callback
+        def async_state_changed_listener(event: Event) -> None:
             """Handle child updates."""
             self.async_set_context(event.context)
-            await self.async_defer_or_update_ha_state()
+            self._async_update_member(
+                event.data["entity_id"], event.data.get("new_state")
+            )
+            if self.hass.state != CoreState.running:
+                return
+
+            self._async_update_group_state()
+            self.async_write_ha_state()
 
         self.async_on_remove(
             async_track_state_change_event(
@@ -181,122 +223,128 @@ class LightGroup(GroupEntity, light.LightEntity):
 
     async def async_update(self) -> None:
         """Query all members and determine the light group state."""
-        all_states = [self.hass.states.get(x) for x in self._entity_ids]
-        states: list[State] = list(filter(None, all_states))
-        on_states = [state for state in states if state.state == STATE_ON]
-
-        self._attr_is_on = len(on_states) > 0
-        self._attr_available = any(state.state != STATE_UNAVAILABLE for state in states)
-        self._attr_brightness = _reduce_attribute(on_states, ATTR_BRIGHTNESS)
-
-        self._attr_hs_color = _reduce_attribute(
-            on_states, ATTR_HS_COLOR, reduce=_mean_tuple
-        )
-        self._attr_rgb_color = _reduce_attribute(
-            on_states, ATTR_RGB_COLOR, reduce=_mean_tuple
-        )
-        self._attr_rgbw_color = _reduce_attribute(
-            on_states, ATTR_RGBW_COLOR, reduce=_mean_tuple
+        for entity_id in self._entity_ids:
+            self._async_update_member(entity_id, self.hass.states.get(entity_id))
+        self._async_update_group_state()
+
+    @callback
+    def _async_update_member(self, entity_id: str, state: State | None) -> None:
+        """Update the contributions of a member to the group state."""
+        if state is None:
+            self._states.remove(entity_id)
+        else:
+            self._states.set_value(entity_id, state.state)
+
+        attributes = state.attributes if state is not None else {}
+        on_attributes = (
+            attributes if self._states.values.get(entity_id) == STATE_ON else {}
         )
-        self._attr_rgbww_color = _reduce_attribute(
-            on_states, ATTR_RGBWW_COLOR, reduce=_mean_tuple
-        )
-        self._attr_xy_color = _reduce_attribute(
-            on_states, ATTR_XY_COLOR, reduce=_mean_tuple
+
+        for key, aggregate in self._numeric_on.items():
+            _set_member_value(aggregate, entity_id, on_attributes.get(key))
+        for key, aggregate in self._colors_on.items():
+            _set_member_value(aggregate, entity_id, on_attributes.get(key))
+        for key, aggregate in self._counts_on.items():
+            _set_member_value(aggregate, entity_id, on_attributes.get(key))
+        for key, aggregate in self._numeric.items():
+            _set_member_value(aggregate, entity_id, attributes.get(key))
+        for key, aggregate in self._unions.items():
+            _set_member_value(aggregate, entity_id, attributes.get(key))
+
+        features = attributes.get(ATTR_SUPPORTED_FEATURES)
+        _set_member_value(
+            self._supported_features,
+            entity_id,
+            None if features is None else _feature_bits(features),
         )
 
-        self._white_value = _reduce_attribute(on_states, ATTR_WHITE_VALUE)
+    @callback
+    def _async_update_group_state(self) -> None:
+        """Determine the light group state from the contributions of the members."""
+        self._attr_is_on = self._states.any(STATE_ON)
+        self._attr_available = len(self._states) > self._states.count(STATE_UNAVAILABLE)
+        self._attr_brightness = _mean_int(self._numeric_on[ATTR_BRIGHTNESS])
 
-        self._attr_color_temp = _reduce_attribute(on_states, ATTR_COLOR_TEMP)
-        self._attr_min_mireds = _reduce_attribute(
-            states, ATTR_MIN_MIREDS, default=154, reduce=min
-        )
-        self._attr_max_mireds = _reduce_attribute(
-            states, ATTR_MAX_MIREDS, default=500, reduce=max
-        )
+        self._attr_hs_color = _mean_tuple(self._colors_on[ATTR_HS_COLOR])
+        self._attr_rgb_color = _mean_tuple(self._colors_on[ATTR_RGB_COLOR])
+        self._attr_rgbw_color = _mean_tuple(self._colors_on[ATTR_RGBW_COLOR])
+        self._attr_rgbww_color = _mean_tuple(self._colors_on[ATTR_RGBWW_COLOR])
+        self._attr_xy_color = _mean_tuple(self._colors_on[ATTR_XY_COLOR])
+
+        self._white_value = _mean_int(self._numeric_on[ATTR_WHITE_VALUE])
+
+        self._attr_color_temp = _mean_int(self._numeric_on[ATTR_COLOR_TEMP])
+        min_mireds = self._numeric[ATTR_MIN_MIREDS].min
+        self._attr_min_mireds = 154 if min_mireds is None else int(min_mireds)
+        max_mireds = self._numeric[ATTR_MAX_MIREDS].max
+        self._attr_max_mireds = 500 if max_mireds is None else int(max_mireds)
 
         self._attr_effect_list = None
-        all_effect_lists = list(_find_state_attributes(states, ATTR_EFFECT_LIST))
-        if all_effect_lists:
+        all_effects = self._unions[ATTR_EFFECT_LIST].union
+        if all_effects:
             # Merge all effects from all effect_lists with a union merge.
-            self._attr_effect_list = list(set().union(*all_effect_lists))
-            self._attr_effect_list.sort()
+            self._attr_effect_list = sorted(all_effects)
             if "None" in self._attr_effect_list:
                 self._attr_effect_list.remove("None")
                 self._attr_effect_list.insert(0, "None")
 
-        self._attr_effect = None
-        all_effects = list(_find_state_attributes(on_states, ATTR_EFFECT))
-        if all_effects:
-            # Report the most common effect.
-            effects_count = Counter(itertools.chain(all_effects))
-            self._attr_effect = effects_count.most_common(1)[0][0]
+        # Report the most common effect.
+        self._attr_effect = cast(
+            "str | None", self._counts_on[ATTR_EFFECT].most_common()
+        )
 
         self._attr_color_mode = None
-        all_color_modes = list(_find_state_attributes(on_states, ATTR_COLOR_MODE))
-        if all_color_modes:
+        color_mode_count = dict(self._counts_on[ATTR_COLOR_MODE].counts)
+        if color_mode_count:
             # Report the most common color mode, select brightness and onoff last
-            color_mode_count = Counter(itertools.chain(all_color_modes))
             if COLOR_MODE_ONOFF in color_mode_count:
                 color_mode_count[COLOR_MODE_ONOFF] = -1
             if COLOR_MODE_BRIGHTNESS in color_mode_count:
                 color_mode_count[COLOR_MODE_BRIGHTNESS] = 0
-            self._attr_color_mode = color_mode_count.most_common(1)[0][0]
+            self._attr_color_mode = cast(
+                str, max(color_mode_count, key=color_mode_count.__getitem__)
+            )
 
-        self._attr_supported_color_modes = None
-        all_supported_color_modes = list(
-            _find_state_attributes(states, ATTR_SUPPORTED_COLOR_MODES)
+        # Merge all color modes.
+        self._attr_supported_color_modes = (
+            cast(Set[str], self._unions[ATTR_SUPPORTED_COLOR_MODES].union) or None
         )
-        if all_supported_color_modes:
-            # Merge all color modes.
-            self._attr_supported_color_modes = cast(
-                Set[str], set().union(*all_supported_color_modes)
-            )
 
-        self._attr_supported_features = 0
-        for support in _find_state_attributes(states, ATTR_SUPPORTED_FEATURES):
-            # Merge supported features by emulating support for every feature
-            # we find.
-            self._attr_supported_features |= support
+        # Merge supported features by emulating support for every feature
+        # we find.
+        self._attr_supported_features = reduce(or_, self._supported_features.union, 0)
         # Bitwise-and the supported features with the GroupedLight's features
         # so that we don't break in the future when a new feature is added.
         self._attr_supported_features &= SUPPORT_GROUP_LIGHT
 
 
-def _find_state_attributes(states: list[State], key: str) -> Iterator[Any]:
-    """Find attributes with matching key from states."""
-    for state in states:
-        value = state.attributes.get(key)
-        if value is not None:
-            yield value
-
-
-def _mean_int(*args: Any) -> int:
-    """Return the mean of the supplied values."""
-    return int(sum(args) / len(args))
-
-
-def _mean_tuple(*args: Any) -> tuple[float | Any, ...]:
-    """Return the mean values along the columns of the supplied values."""
-    return tuple(sum(x) / len(x) for x in zip(*args))
+def _set_member_value(aggregate: Any, entity_id: str, value: Any) -> None:
+    """Set the value of a member, members without a value do not contribute."""
+    if value is None:
+        aggregate.remove(entity_id)
+        return
+    try:
+        aggregate.set_value(entity_id, value)
+    except ValueError:
+        aggregate.remove(entity_id)
 
 
-def _reduce_attribute(
-    states: list[State],
-    key: str,
-    default: Any | None = None,
-    reduce: Callable[..., Any] = _mean_int,
-) -> Any:
-    """Find the first attribute matching key from states.
+def _feature_bits(features: int) -> set[int]:
+    """Return the feature flags set in supported features."""
+    return {1 << bit for bit in range(features.bit_length()) if features & 1 << bit}
 
-    If none are found, return default.
-    """
-    attrs = list(_find_state_attributes(states, key))
 
-    if not attrs:
-        return default
+def _mean_int(aggregate: NumericAggregate) -> Any:
+    """Return the mean of the values as an integer, or the only value."""
+    if len(aggregate) == 1:
+        return next(iter(aggregate.values.values()))
+    if (mean := aggregate.mean) is None:
+        return None
+    return int(mean)
 
-    if len(attrs) == 1:
-        return attrs[0]
 
-    return reduce(*attrs)
+def _mean_tuple(aggregate: TupleMeanAggregate) -> Any:
+    """Return the mean values along the columns, or the only value."""
+    if len(aggregate) == 1:
+        return next(iter(aggregate.values.values()))
+    return aggregate.mean
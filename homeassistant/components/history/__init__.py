@@ -33,6 +33,7 @@ from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
+from homeassistant.helpers.executor import POOL_DATABASE, async_run_in_pool
 import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -151,7 +152,10 @@ async def ws_get_statistics_during_period(
     else:
         end_time = None
 
-    statistics = await hass.async_add_executor_job(
+    statistics = await async_run_in_pool(
+        hass,
+        POOL_DATABASE,
+        DOMAIN,
         statistics_during_period,
         hass,
         start_time,
@@ -173,7 +177,10 @@ async def ws_get_list_statistic_ids(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """Fetch a list of available statistic_id."""
-    statistic_ids = await hass.async_add_executor_job(
+    statistic_ids = await async_run_in_pool(
+        hass,
+        POOL_DATABASE,
+        DOMAIN,
         list_statistic_ids,
         hass,
         msg.get("statistic_type"),
@@ -246,7 +253,10 @@ class HistoryPeriodView(HomeAssistantView):
 
         return cast(
             web.Response,
-            await hass.async_add_executor_job(
+            await async_run_in_pool(
+                hass,
+                POOL_DATABASE,
+                DOMAIN,
                 self._sorted_significant_states_json,
                 hass,
                 start_time,
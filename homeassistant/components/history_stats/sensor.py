@@ -1,4 +1,5 @@
 """Component to make instant statistics about your history."""
+from collections import deque
 import datetime
 import logging
 import math
@@ -120,6 +121,9 @@ class HistoryStatsSensor(SensorEntity):
         self._period = (datetime.datetime.now(), datetime.datetime.now())
         self.value = None
         self.count = None
+        # The measured window and if it keeps up with the state changes
+        self._window = None
+        self._live = False
 
     async def async_added_to_hass(self):
         """Create listeners when the entity is added."""
@@ -127,16 +131,10 @@ class HistoryStatsSensor(SensorEntity):
         @callback
         def start_refresh(*args):
             """Register state tracking."""
-
-            @callback
-            def force_refresh(*args):
-                """Force the component to refresh."""
-                self.async_schedule_update_ha_state(True)
-
-            force_refresh()
+            self.async_schedule_update_ha_state(True)
             self.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, [self._entity_id], force_refresh
+                    self.hass, [self._entity_id], self._async_state_changed
                 )
             )
 
@@ -147,6 +145,17 @@ class HistoryStatsSensor(SensorEntity):
         # Delay first refresh to keep startup fast
         self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, start_refresh)
 
+    @callback
+    def _async_state_changed(self, event):
+        """Add a state change to the window and refresh the sensor."""
+        new_state = event.data.get("new_state")
+        if self._window is not None and self._live and new_state is not None:
+            self._window.add_change(
+                new_state.last_changed.timestamp(),
+                new_state.state in self._entity_states,
+            )
+        self.async_schedule_update_ha_state(True)
+
     @property
     def name(self):
         """Return the name of the sensor."""
@@ -209,58 +218,81 @@ class HistoryStatsSensor(SensorEntity):
         p_end_timestamp = math.floor(dt_util.as_timestamp(p_end))
         now_timestamp = math.floor(dt_util.as_timestamp(now))
 
+        # The window reaches the present if it ends less than a second ago
+        live = end_timestamp >= now_timestamp - 1
+
         # If period has not changed and current time after the period end...
         if (
             start_timestamp == p_start_timestamp
             and end_timestamp == p_end_timestamp
             and end_timestamp <= now_timestamp
+            and not live
         ):
             # Don't compute anything as the value cannot have changed
             return
 
-        await self.hass.async_add_executor_job(
-            self._update, start, end, now_timestamp, start_timestamp, end_timestamp
-        )
+        window = self._window
+
+        if (
+            window is not None
+            and self._live
+            and live
+            and start_timestamp >= window.start
+        ):
+            # Only subtract the changes that slid out of the window
+            window.slide(start_timestamp)
+        else:
+            window = await self.hass.async_add_executor_job(
+                self._load_window, start, end, start_timestamp
+            )
+            if window is None:
+                self._window = None
+                return
 
-    def _update(self, start, end, now_timestamp, start_timestamp, end_timestamp):
+            if live:
+                # Add the current state in case it was not recorded yet
+                state = self.hass.states.get(self._entity_id)
+                if state is not None:
+                    window.add_change(
+                        state.last_changed.timestamp(),
+                        state.state in self._entity_states,
+                    )
+
+            self._window = window
+            self._live = live
+
+        # Count time elapsed between last history state and end of measure
+        measure_end = min(end_timestamp, now_timestamp)
+
+        # Save value in hours
+        self.value = window.elapsed(measure_end) / 3600
+
+        # Save counter
+        self.count = window.count
+
+    def _load_window(self, start, end, start_timestamp):
+        """Load the changes of the entity between start and end."""
         # Get history between start and end
         history_list = history.state_changes_during_period(
             self.hass, start, end, str(self._entity_id)
         )
 
         if self._entity_id not in history_list:
-            return
+            return None
 
         # Get the first state
         last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state in self._entity_states
-        last_time = start_timestamp
-        elapsed = 0
-        count = 0
+        window = HistoryStatsWindow(
+            start_timestamp,
+            last_state is not None and last_state.state in self._entity_states,
+        )
 
-        # Make calculations
         for item in history_list.get(self._entity_id):
-            current_state = item.state in self._entity_states
-            current_time = item.last_changed.timestamp()
-
-            if last_state:
-                elapsed += current_time - last_time
-            if current_state and not last_state:
-                count += 1
-
-            last_state = current_state
-            last_time = current_time
-
-        # Count time elapsed between last history state and end of measure
-        if last_state:
-            measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_time
+            window.add_change(
+                item.last_changed.timestamp(), item.state in self._entity_states
+            )
 
-        # Save value in hours
-        self.value = elapsed / 3600
-
-        # Save counter
-        self.count = count
+        return window
 
     def update_period(self):
         """Parse the templates and store a datetime tuple in _period."""
@@ -323,6 +355,74 @@ class HistoryStatsSensor(SensorEntity):
         self._period = start, end
 
 
+class HistoryStatsWindow:
+    """Time spent in the measured states since the start of a window.
+
+    Changes are added as they happen and the ones sliding out of the
+    window are subtracted, so the recorder is only queried when the window
+    jumps.
+    """
+
+    def __init__(self, start, start_match):
+        """Initialize the window."""
+        self.start = start
+        self.start_match = start_match
+        self.count = 0
+        # Times the entity entered or left the measured states
+        self._changes = deque()
+        # Seconds in the measured states between start and the last change
+        self._elapsed = 0.0
+
+    @property
+    def last_change(self):
+        """Return the time of the last change."""
+        return self._changes[-1][0] if self._changes else self.start
+
+    @property
+    def match(self):
+        """Return if the entity is in one of the measured states."""
+        return self._changes[-1][1] if self._changes else self.start_match
+
+    def add_change(self, timestamp, match):
+        """Add a change of the entity state."""
+        if match == self.match:
+            return
+
+        last_change = self.last_change
+        timestamp = max(timestamp, last_change)
+        if self.match:
+            self._elapsed += timestamp - last_change
+
+        self._changes.append((timestamp, match))
+        if match:
+            self.count += 1
+
+    def slide(self, start):
+        """Move the start of the window forward."""
+        while self._changes and self._changes[0][0] <= start:
+            timestamp, match = self._changes.popleft()
+            if self.start_match:
+                self._elapsed -= timestamp - self.start
+            if match:
+                self.count -= 1
+            self.start = timestamp
+            self.start_match = match
+
+        if not self._changes:
+            self._elapsed = 0.0
+        elif self.start_match:
+            self._elapsed -= start - self.start
+
+        self.start = max(self.start, start)
+
+    def elapsed(self, end):
+        """Return the seconds in the measured states until end."""
+        last_change = self.last_change
+        if self.match and end > last_change:
+            return self._elapsed + end - last_change
+        return self._elapsed
+
+
 class HistoryStatsHelper:
     """Static methods to make the HistoryStatsSensor code lighter."""
 
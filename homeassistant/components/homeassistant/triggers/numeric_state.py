@@ -12,13 +12,13 @@ from homeassistant.const import (
     CONF_FOR,
     CONF_PLATFORM,
     CONF_VALUE_TEMPLATE,
+    MATCH_ALL,
 )
 from homeassistant.core import CALLBACK_TYPE, HassJob, callback
 from homeassistant.helpers import condition, config_validation as cv, template
-from homeassistant.helpers.event import (
-    async_track_same_state,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import async_track_same_state
+
+from .state_index import async_track_state_trigger
 
 # mypy: allow-incomplete-defs, allow-untyped-calls, allow-untyped-defs
 # mypy: no-check-untyped-defs
@@ -119,7 +119,7 @@ async def async_attach_trigger(
             )
 
     @callback
-    def state_automation_listener(event):
+    def state_automation_listener(event, old_value, new_value):
         """Listen for state changes and calls action."""
         entity_id = event.data.get("entity_id")
         from_s = event.data.get("old_state")
@@ -191,7 +191,18 @@ async def async_attach_trigger(
             else:
                 call_action()
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # With fixed limits the result can only change when the value does
+    unsub = async_track_state_trigger(
+        hass,
+        entity_ids,
+        attribute,
+        MATCH_ALL,
+        MATCH_ALL,
+        value_template is None
+        and not isinstance(below, str)
+        and not isinstance(above, str),
+        state_automation_listener,
+    )
 
     @callback
     def async_remove():
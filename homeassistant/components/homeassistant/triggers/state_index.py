@@ -0,0 +1,241 @@
+"""Shared index routing state changes to state based triggers."""
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable
+import logging
+from typing import Any, Callable
+
+from homeassistant.const import MATCH_ALL
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    process_state_match,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATE_TRIGGER_INDEX = "homeassistant_state_trigger_index"
+
+StateValueListener = Callable[[Event, Any, Any], None]
+
+
+def _match_key(parameter: Any) -> Hashable | None:
+    """Return a key identifying the values a from or to parameter matches.
+
+    None means all values match. Parameters that can not be hashed get a key
+    of their own.
+    """
+    if parameter is None or parameter == MATCH_ALL:
+        return None
+
+    if isinstance(parameter, str) or not hasattr(parameter, "__iter__"):
+        parameter = (parameter,)
+
+    try:
+        return frozenset(parameter)
+    except TypeError:
+        return object()
+
+
+def _state_value(state: State | None, attribute: str | None) -> Any:
+    """Return the value of a state or of one of its attributes."""
+    if state is None:
+        return None
+    if attribute is None:
+        return state.state
+    return state.attributes.get(attribute)
+
+
+class _StateMatch:
+    """Listeners that share the same from, to and change requirements."""
+
+    __slots__ = ("match_from", "match_to", "require_change", "listeners")
+
+    def __init__(self, from_state: Any, to_state: Any, require_change: bool) -> None:
+        """Initialize the match."""
+        self.match_from = process_state_match(from_state)
+        self.match_to = process_state_match(to_state)
+        self.require_change = require_change
+        self.listeners: list[StateValueListener] = []
+
+
+class _AttributeIndex:
+    """Matches for one attribute of an entity, indexed by their to values."""
+
+    __slots__ = ("matches", "by_to", "any_to")
+
+    def __init__(self) -> None:
+        """Initialize the attribute index."""
+        self.matches: dict[tuple, _StateMatch] = {}
+        self.by_to: dict[Hashable, list[_StateMatch]] = {}
+        self.any_to: list[_StateMatch] = []
+
+    @callback
+    def async_candidates(self, new_value: Any) -> list[_StateMatch]:
+        """Return the matches that can match a new value."""
+        try:
+            by_to = self.by_to.get(new_value)
+        except TypeError:
+            by_to = None
+        if by_to is None:
+            return self.any_to[:]
+        return [*self.any_to, *by_to]
+
+    @callback
+    def async_add(
+        self, key: tuple, from_state: Any, to_state: Any, require_change: bool
+    ) -> _StateMatch:
+        """Add a match to the index."""
+        match = self.matches[key] = _StateMatch(from_state, to_state, require_change)
+        to_key = key[1]
+        if isinstance(to_key, frozenset):
+            for value in to_key:
+                self.by_to.setdefault(value, []).append(match)
+        else:
+            self.any_to.append(match)
+        return match
+
+    @callback
+    def async_remove(self, key: tuple) -> None:
+        """Remove a match from the index."""
+        match = self.matches.pop(key)
+        to_key = key[1]
+        if not isinstance(to_key, frozenset):
+            self.any_to.remove(match)
+            return
+        for value in to_key:
+            self.by_to[value].remove(match)
+            if not self.by_to[value]:
+                del self.by_to[value]
+
+
+class StateTriggerIndex:
+    """Route state changes to the triggers that can match them.
+
+    Listeners are indexed by entity id, then by attribute and then by the
+    values they want to change to. Each state change extracts the values
+    once per attribute and evaluates listeners sharing the same from and to
+    values only once.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._entities: dict[str, dict[str | None, _AttributeIndex]] = {}
+        self._unsub_entities: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_add_listener(
+        self,
+        entity_ids: str | Iterable[str],
+        attribute: str | None,
+        from_state: Any,
+        to_state: Any,
+        require_change: bool,
+        listener: StateValueListener,
+    ) -> CALLBACK_TYPE:
+        """Listen for the state or attribute of entities to match.
+
+        The listener is called with the event and the old and new values.
+        With require_change, it is only called when the value changed.
+        """
+        key = (_match_key(from_state), _match_key(to_state), require_change)
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        entity_ids = [entity_id.lower() for entity_id in entity_ids]
+
+        for entity_id in entity_ids:
+            if (attributes := self._entities.get(entity_id)) is None:
+                attributes = self._entities[entity_id] = {}
+                self._unsub_entities[entity_id] = async_track_state_change_event(
+                    self.hass, entity_id, self._async_state_changed
+                )
+            if (index := attributes.get(attribute)) is None:
+                index = attributes[attribute] = _AttributeIndex()
+            if (match := index.matches.get(key)) is None:
+                match = index.async_add(key, from_state, to_state, require_change)
+            match.listeners.append(listener)
+
+        @callback
+        def async_remove_listener() -> None:
+            """Remove the listener."""
+            for entity_id in entity_ids:
+                self._async_remove(entity_id, attribute, key, listener)
+
+        return async_remove_listener
+
+    @callback
+    def _async_remove(
+        self,
+        entity_id: str,
+        attribute: str | None,
+        key: tuple,
+        listener: StateValueListener,
+    ) -> None:
+        """Remove a listener of an entity."""
+        attributes = self._entities[entity_id]
+        index = attributes[attribute]
+        match = index.matches[key]
+        match.listeners.remove(listener)
+
+        if match.listeners:
+            return
+        index.async_remove(key)
+
+        if index.matches:
+            return
+        del attributes[attribute]
+
+        if attributes:
+            return
+        del self._entities[entity_id]
+        self._unsub_entities.pop(entity_id)()
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Dispatch a state change to the listeners that match it."""
+        entity_id = event.data["entity_id"]
+        if (attributes := self._entities.get(entity_id)) is None:
+            return
+
+        from_s: State | None = event.data.get("old_state")
+        to_s: State | None = event.data.get("new_state")
+
+        for attribute, index in list(attributes.items()):
+            old_value = _state_value(from_s, attribute)
+            new_value = _state_value(to_s, attribute)
+            changed = old_value != new_value
+
+            for match in index.async_candidates(new_value):
+                if (
+                    (match.require_change and not changed)
+                    or not match.match_from(old_value)
+                    or not match.match_to(new_value)
+                ):
+                    continue
+
+                for listener in match.listeners[:]:
+                    try:
+                        listener(event, old_value, new_value)
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception(
+                            "Error while processing state change for %s", entity_id
+                        )
+
+
+@callback
+def async_track_state_trigger(
+    hass: HomeAssistant,
+    entity_ids: str | Iterable[str],
+    attribute: str | None,
+    from_state: Any,
+    to_state: Any,
+    require_change: bool,
+    listener: StateValueListener,
+) -> CALLBACK_TYPE:
+    """Listen for state changes through the shared state trigger index."""
+    if (index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index.async_add_listener(
+        entity_ids, attribute, from_state, to_state, require_change, listener
+    )
@@ -5,6 +5,7 @@ from contextvars import ContextVar
 from ipaddress import ip_network
 import logging
 import os
+from pathlib import Path
 import ssl
 from typing import Any, Final, Optional, TypedDict, cast
 
@@ -30,7 +31,7 @@ from .cors import setup_cors
 from .forwarded import async_setup_forwarded
 from .request_context import setup_request_context
 from .security_filter import setup_security_filter
-from .static import CACHE_HEADERS, CachingStaticResource
+from .static import CACHE_HEADERS, CachingStaticResource, async_file_response
 from .view import HomeAssistantView
 from .web_runner import HomeAssistantTCPSite
 
@@ -301,23 +302,32 @@ class HomeAssistantHTTP:
         self.app.router.add_route("GET", url, redirect)
 
     def register_static_path(
-        self, url_path: str, path: str, cache_headers: bool = True
+        self,
+        url_path: str,
+        path: str,
+        cache_headers: bool = True,
+        immutable: bool = False,
     ) -> web.FileResponse | None:
-        """Register a folder or file to serve as a static path."""
+        """Register a folder or file to serve as a static path.
+
+        Set immutable for folders of content-hashed files that never change
+        under the same name.
+        """
         if os.path.isdir(path):
             if cache_headers:
-                resource: type[
-                    CachingStaticResource | web.StaticResource
-                ] = CachingStaticResource
+                self.app.router.register_resource(
+                    CachingStaticResource(url_path, path, immutable=immutable)
+                )
             else:
-                resource = web.StaticResource
-            self.app.router.register_resource(resource(url_path, path))
+                self.app.router.register_resource(web.StaticResource(url_path, path))
             return None
 
-        async def serve_file(request: web.Request) -> web.FileResponse:
+        filepath = Path(path)
+
+        async def serve_file(request: web.Request) -> web.StreamResponse:
             """Serve file from disk."""
             if cache_headers:
-                return web.FileResponse(path, headers=CACHE_HEADERS)
+                return await async_file_response(request, filepath, CACHE_HEADERS)
             return web.FileResponse(path)
 
         self.app.router.add_route("GET", url_path, serve_file)
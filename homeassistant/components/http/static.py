@@ -1,23 +1,267 @@
 """Static file handling for HTTP component."""
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping
+import gzip
+import mimetypes
+import os
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.abc import AbstractStreamWriter
+from aiohttp.web import BaseRequest, FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 
+from homeassistant.core import HomeAssistant, callback
+
+from .const import KEY_HASS
+
 CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADERS: Final[Mapping[str, str]] = {
     hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"
 }
+IMMUTABLE_CACHE_TIME: Final = 365 * 86400  # = 1 year
+IMMUTABLE_CACHE_HEADERS: Final[Mapping[str, str]] = {
+    hdrs.CACHE_CONTROL: f"public, max-age={IMMUTABLE_CACHE_TIME}, immutable"
+}
+
+DATA_COMPRESSED_FILES: Final = "http_compressed_static_files"
+
+# Precompressed siblings of a file, in order of preference
+PRECOMPRESSED_SUFFIXES: Final = (("br", ".br"), ("gzip", ".gz"))
+
+COMPRESSIBLE_CONTENT_TYPES: Final = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "image/svg+xml",
+    "text/css",
+    "text/html",
+    "text/javascript",
+    "text/plain",
+}
+COMPRESS_MIN_SIZE: Final = 1024
+COMPRESSED_FILES_MAX_SIZE: Final = 32 * 1024 * 1024
+# Larger variants are not kept, as they would push out most other files
+COMPRESSED_FILE_MAX_SIZE: Final = COMPRESSED_FILES_MAX_SIZE // 8
+
+
+class CompressedFileCache:
+    """Gzip compressed variants of static files without precompressed siblings.
+
+    Variants are generated in the executor on first request and kept in
+    memory until the file changes or the cache runs out of space. Files
+    with too large a variant are served uncompressed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._files: OrderedDict[Path, tuple[tuple[int, int], bytes]] = OrderedDict()
+        self._size = 0
+        self._pending: set[Path] = set()
+        # Versions of files with too large a variant
+        self._too_large: dict[Path, tuple[int, int]] = {}
+
+    @callback
+    def async_get(self, filepath: Path, stat: os.stat_result) -> bytes | None:
+        """Return the compressed file or schedule compressing it."""
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = self._files.get(filepath)
+
+        if entry is not None and entry[0] == version:
+            self._files.move_to_end(filepath)
+            return entry[1]
+
+        if self._too_large.get(filepath) == version:
+            return None
+
+        if filepath not in self._pending:
+            self._pending.add(filepath)
+            self.hass.async_create_task(self._async_compress(filepath, version))
+
+        return None
+
+    async def _async_compress(self, filepath: Path, version: tuple[int, int]) -> None:
+        """Compress a file in the executor and store it."""
+        try:
+            content = await self.hass.async_add_executor_job(_compress_file, filepath)
+        except OSError:
+            return
+        finally:
+            self._pending.discard(filepath)
+
+        if (entry := self._files.pop(filepath, None)) is not None:
+            self._size -= len(entry[1])
+
+        if len(content) > COMPRESSED_FILE_MAX_SIZE:
+            self._too_large[filepath] = version
+            return
+        self._too_large.pop(filepath, None)
+
+        self._files[filepath] = (version, content)
+        self._size += len(content)
+
+        while self._size > COMPRESSED_FILES_MAX_SIZE:
+            _, (_, evicted) = self._files.popitem(last=False)
+            self._size -= len(evicted)
+
+
+def _compress_file(filepath: Path) -> bytes:
+    """Return the gzip compressed contents of a file."""
+    return gzip.compress(filepath.read_bytes())
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    """Return the content codings an Accept-Encoding header accepts.
+
+    Codings with a quality of 0 are refused. A wildcard accepts the
+    codings this module serves that are not listed otherwise.
+    """
+    accepted: set[str] = set()
+    refused: set[str] = set()
+    wildcard = False
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding == "*":
+            wildcard = quality > 0
+        elif quality > 0:
+            accepted.add(coding)
+        else:
+            refused.add(coding)
+
+    if wildcard:
+        accepted.update(
+            encoding
+            for encoding, _ in PRECOMPRESSED_SUFFIXES
+            if encoding not in refused
+        )
+    return accepted
+
+
+def _negotiate_file(
+    filepath: Path, accepted: set[str]
+) -> tuple[Path, str | None, os.stat_result] | None:
+    """Return the variant of a file to serve, its encoding and its stat.
+
+    Returns None if the file does not exist.
+    """
+    for encoding, suffix in PRECOMPRESSED_SUFFIXES:
+        if encoding not in accepted:
+            continue
+        compressed = filepath.with_name(filepath.name + suffix)
+        if compressed.is_file():
+            return compressed, encoding, compressed.stat()
+
+    if not filepath.is_file():
+        return None
+
+    return filepath, None, filepath.stat()
+
+
+class _FileResponse(FileResponse):
+    """File response that serves its path as it is.
+
+    FileResponse serves the .gz sibling of the path on its own whenever
+    the Accept-Encoding header contains gzip, even if gzip is refused.
+    """
+
+    async def prepare(self, request: BaseRequest) -> AbstractStreamWriter | None:
+        """Send the headers of the response."""
+        if hdrs.ACCEPT_ENCODING in request.headers:
+            headers = request.headers.copy()
+            del headers[hdrs.ACCEPT_ENCODING]
+            request = request.clone(headers=headers)
+        return await super().prepare(request)
+
+
+def _etag(stat: os.stat_result, encoding: str | None) -> str:
+    """Return the ETag of a file variant."""
+    etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+    if encoding is not None:
+        etag = f"{etag}-{encoding}"
+    return f'"{etag}"'
+
+
+async def async_file_response(
+    request: Request,
+    filepath: Path,
+    headers: Mapping[str, str] | None = None,
+    chunk_size: int = 256 * 1024,
+) -> StreamResponse:
+    """Serve a static file, preferring a compressed variant of it.
+
+    Precompressed siblings are served as they are. Compressible files
+    without them get a gzip variant generated in the background. Responses
+    carry an ETag so clients can revalidate them cheaply.
+    """
+    hass: HomeAssistant = request.app[KEY_HASS]
+    accepted = _accepted_encodings(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+    negotiated = await hass.async_add_executor_job(_negotiate_file, filepath, accepted)
+
+    if negotiated is None:
+        raise HTTPNotFound
+
+    path, encoding, stat = negotiated
+    content_type = mimetypes.guess_type(str(filepath))[0] or "application/octet-stream"
+    response_headers = dict(headers or {})
+    response_headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+
+    body = None
+    if (
+        encoding is None
+        and "gzip" in accepted
+        and content_type in COMPRESSIBLE_CONTENT_TYPES
+        and stat.st_size >= COMPRESS_MIN_SIZE
+    ):
+        cache: CompressedFileCache | None = hass.data.get(DATA_COMPRESSED_FILES)
+        if cache is None:
+            cache = hass.data[DATA_COMPRESSED_FILES] = CompressedFileCache(hass)
+        if (body := cache.async_get(filepath, stat)) is not None:
+            encoding = "gzip"
+
+    response_headers[hdrs.ETAG] = etag = _etag(stat, encoding)
+
+    if etag in request.headers.get(hdrs.IF_NONE_MATCH, ""):
+        return Response(status=304, headers=response_headers)
+
+    if encoding is not None:
+        response_headers[hdrs.CONTENT_TYPE] = content_type
+        response_headers[hdrs.CONTENT_ENCODING] = encoding
+
+    if body is not None:
+        return Response(body=body, headers=response_headers)
+
+    # FileResponse sends the file with sendfile where available
+    return _FileResponse(path, chunk_size=chunk_size, headers=response_headers)
 
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    Resources serving content-hashed file names can be marked immutable.
+    """
+
+    def __init__(
+        self, prefix: str, directory: str, *, immutable: bool = False, **kwargs: Any
+    ) -> None:
+        """Initialize the static resource."""
+        super().__init__(prefix, directory, **kwargs)
+        self._cache_headers = IMMUTABLE_CACHE_HEADERS if immutable else CACHE_HEADERS
 
     async def _handle(self, request: Request) -> StreamResponse:
         rel_url = request.match_info["filename"]
@@ -42,10 +286,6 @@ class CachingStaticResource(StaticResource):
         # on opening a dir, load its contents if allowed
         if filepath.is_dir():
             return await super()._handle(request)
-        if filepath.is_file():
-            return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                headers=CACHE_HEADERS,
-            )
-        raise HTTPNotFound
+        return await async_file_response(
+            request, filepath, self._cache_headers, self._chunk_size
+        )
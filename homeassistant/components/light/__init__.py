@@ -342,10 +342,11 @@ async def async_setup(hass, config):  # noqa: C901
         base["params"] = data
         return base
 
-    async def async_handle_light_on_service(light, call):
-        """Handle turning a light on.
+    def light_turn_on_params(light, call):
+        """Return the parameters to turn a light on with.
 
-        If brightness is set to 0, this service will turn the light off.
+        Returns None if brightness is set to 0 and the light has to be turned
+        off instead.
         """
         params = dict(call.data["params"])
 
@@ -453,18 +454,32 @@ async def async_setup(hass, config):  # noqa: C901
             params.pop(ATTR_WHITE_VALUE, None)
 
         if params.get(ATTR_BRIGHTNESS) == 0 or params.get(ATTR_WHITE) == 0:
-            await async_handle_light_off_service(light, call)
-        else:
-            await light.async_turn_on(**filter_turn_on_params(light, params))
+            return None
+        return filter_turn_on_params(light, params)
 
-    async def async_handle_light_off_service(light, call):
-        """Handle turning off a light."""
+    def light_turn_off_params(light, call):
+        """Return the parameters to turn a light off with."""
         params = dict(call.data["params"])
 
         if ATTR_TRANSITION not in params:
             profiles.apply_default(light.entity_id, True, params)
 
-        await light.async_turn_off(**filter_turn_off_params(light, params))
+        return filter_turn_off_params(light, params)
+
+    async def async_handle_light_on_service(light, call):
+        """Handle turning a light on.
+
+        If brightness is set to 0, this service will turn the light off.
+        """
+        params = light_turn_on_params(light, call)
+        if params is None:
+            await async_handle_light_off_service(light, call)
+        else:
+            await light.async_turn_on(**params)
+
+    async def async_handle_light_off_service(light, call):
+        """Handle turning off a light."""
+        await light.async_turn_off(**light_turn_off_params(light, call))
 
     async def async_handle_toggle_service(light, call):
         """Handle toggling a light."""
@@ -479,12 +494,14 @@ async def async_setup(hass, config):  # noqa: C901
         SERVICE_TURN_ON,
         vol.All(cv.make_entity_service_schema(LIGHT_TURN_ON_SCHEMA), preprocess_data),
         async_handle_light_on_service,
+        batch_params=light_turn_on_params,
     )
 
     component.async_register_entity_service(
         SERVICE_TURN_OFF,
         vol.All(cv.make_entity_service_schema(LIGHT_TURN_OFF_SCHEMA), preprocess_data),
         async_handle_light_off_service,
+        batch_params=light_turn_off_params,
     )
 
     component.async_register_entity_service(
@@ -42,6 +42,7 @@ from homeassistant.helpers.entityfilter import (
     convert_include_exclude_filter,
     generate_filter,
 )
+from homeassistant.helpers.executor import POOL_DATABASE, async_run_in_pool
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
@@ -254,7 +255,7 @@ class LogbookView(HomeAssistantView):
                 )
             )
 
-        return await hass.async_add_executor_job(json_events)
+        return await async_run_in_pool(hass, POOL_DATABASE, DOMAIN, json_events)
 
 
 def humanify(hass, events, entity_attr_cache, context_lookup):
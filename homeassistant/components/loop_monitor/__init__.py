@@ -0,0 +1,43 @@
+"""Monitor the health of the event loop and the executor."""
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import discovery
+from homeassistant.helpers.typing import ConfigType
+
+from .const import DOMAIN
+from .monitor import LoopMonitor
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the event loop monitor."""
+    monitor = hass.data[DOMAIN] = LoopMonitor(hass)
+    monitor.async_start()
+
+    @callback
+    def _async_stop_monitor(event: Event) -> None:
+        """Stop the monitor when Home Assistant stops."""
+        monitor.async_stop()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_monitor)
+
+    websocket_api.async_register_command(hass, websocket_info)
+    hass.async_create_task(
+        discovery.async_load_platform(hass, "sensor", DOMAIN, {}, config)
+    )
+    return True
+
+
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "loop_monitor/info"})
+def websocket_info(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the event loop lag and the load per integration."""
+    monitor: LoopMonitor = hass.data[DOMAIN]
+    connection.send_result(msg["id"], monitor.as_dict())
@@ -0,0 +1,3 @@
+"""Constants for the event loop monitor."""
+
+DOMAIN = "loop_monitor"
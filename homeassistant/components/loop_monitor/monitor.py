@@ -0,0 +1,194 @@
+"""Sample the event loop lag and attribute stalls to integrations."""
+from __future__ import annotations
+
+from collections import deque
+import dataclasses
+import logging
+import sys
+import threading
+import time
+from types import FrameType
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.executor import async_get_executor_pools
+
+_LOGGER = logging.getLogger(__name__)
+
+# How often the event loop is checked for lag
+TICK_INTERVAL = 0.1
+# How often the watchdog thread samples the event loop
+SAMPLE_INTERVAL = 0.1
+# The loop counts as blocked when a tick is this much late
+BLOCKED_THRESHOLD = 0.1
+# Lag samples kept, one minute worth of ticks
+LAG_SAMPLES = 600
+
+CORE = "homeassistant"
+
+_COMPONENTS_PREFIX = "homeassistant.components."
+_CUSTOM_COMPONENTS_PREFIX = "custom_components."
+
+
+@dataclasses.dataclass
+class BlockedStats:
+    """How often and for how long an integration blocked the event loop."""
+
+    count: int = 0
+    seconds: float = 0.0
+
+
+def frame_integration(frame: FrameType | None) -> str | None:
+    """Return the integration running the innermost frame of a stack."""
+    while frame is not None:
+        module: str = frame.f_globals.get("__name__", "")
+        if module.startswith(_COMPONENTS_PREFIX):
+            return module.split(".")[2]
+        if module.startswith(_CUSTOM_COMPONENTS_PREFIX):
+            return module.split(".")[1]
+        frame = frame.f_back
+    return None
+
+
+class LoopMonitor:
+    """Monitor the event loop and the executor pools of Home Assistant.
+
+    A callback scheduled on the event loop measures how late it runs. A
+    watchdog thread samples the stack of the event loop when a tick is
+    overdue, and attributes the time to the integration running the
+    innermost frames. Nothing is added to the callbacks that are monitored.
+    The load of the executor is taken from the statistics of the executor
+    pools.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the monitor."""
+        self.hass = hass
+        self._lag: deque[float] = deque(maxlen=LAG_SAMPLES)
+        self._blocked: dict[str, BlockedStats] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._loop_thread_id: int | None = None
+        self._last_tick = 0.0
+        self._next_tick = 0.0
+        self._stall: str | None = None
+        self._unsub_tick: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start monitoring."""
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._async_schedule_tick()
+        threading.Thread(target=self._watch, name="LoopMonitor", daemon=True).start()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop monitoring."""
+        self._stop.set()
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+
+    @callback
+    def _async_schedule_tick(self) -> None:
+        """Schedule the next tick of the event loop."""
+        self._next_tick = time.monotonic() + TICK_INTERVAL
+        self._unsub_tick = self.hass.loop.call_later(
+            TICK_INTERVAL, self._async_tick
+        ).cancel
+
+    @callback
+    def _async_tick(self) -> None:
+        """Record how late the event loop ran the tick."""
+        now = time.monotonic()
+        lag = max(0.0, now - self._next_tick)
+        self._lag.append(lag)
+
+        with self._lock:
+            integration, self._stall = self._stall, None
+            if integration is not None:
+                stats = self._blocked.setdefault(integration, BlockedStats())
+                stats.count += 1
+                stats.seconds += lag
+
+        if integration is not None:
+            _LOGGER.debug("Event loop was blocked for %.3fs by %s", lag, integration)
+
+        self._last_tick = now
+        self._async_schedule_tick()
+
+    def _watch(self) -> None:
+        """Sample the event loop until stopped."""
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            self._sample()
+
+    def _sample(self) -> None:
+        """Sample the stack of the event loop when a tick is overdue."""
+        if (
+            self._stall is not None
+            or time.monotonic() - self._last_tick <= TICK_INTERVAL + BLOCKED_THRESHOLD
+        ):
+            return
+
+        frames = sys._current_frames()  # pylint: disable=protected-access
+        integration = frame_integration(frames.get(self._loop_thread_id))
+        with self._lock:
+            self._stall = integration or CORE
+
+    @property
+    def lag(self) -> float:
+        """Return the highest lag of the event loop in the last minute."""
+        return max(self._lag, default=0.0)
+
+    @property
+    def average_lag(self) -> float:
+        """Return the average lag of the event loop in the last minute."""
+        if not self._lag:
+            return 0.0
+        return sum(self._lag) / len(self._lag)
+
+    @property
+    def executor_queue_depth(self) -> int:
+        """Return the number of jobs waiting in the executor pools."""
+        return sum(
+            pool["queue_depth"]
+            for pool in async_get_executor_pools(self.hass).as_dict().values()
+        )
+
+    def most_blocking_integration(self) -> str | None:
+        """Return the integration that blocked the event loop the longest."""
+        with self._lock:
+            if not self._blocked:
+                return None
+            return max(self._blocked, key=lambda domain: self._blocked[domain].seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return dictionary version of the monitored data."""
+        with self._lock:
+            blocked = {
+                integration: dataclasses.asdict(stats)
+                for integration, stats in self._blocked.items()
+            }
+
+        pools = async_get_executor_pools(self.hass).as_dict()
+        run_time: dict[str, float] = {}
+        for pool in pools.values():
+            for integration, stats in pool["integrations"].items():
+                run_time[integration] = (
+                    run_time.get(integration, 0.0) + stats["run_time"]
+                )
+
+        return {
+            "lag": {
+                "current": self._lag[-1] if self._lag else 0.0,
+                "average": self.average_lag,
+                "max": self.lag,
+            },
+            "blocked": blocked,
+            "executor": {
+                "queue_depth": sum(pool["queue_depth"] for pool in pools.values()),
+                "run_time": run_time,
+                "pools": pools,
+            },
+        }
@@ -0,0 +1,70 @@
+"""Sensors for the health of the event loop and the executor."""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import STATE_CLASS_MEASUREMENT, SensorEntity
+from homeassistant.const import TIME_MILLISECONDS
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .const import DOMAIN
+from .monitor import LoopMonitor
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the event loop monitor sensors."""
+    if discovery_info is None:
+        return
+
+    monitor: LoopMonitor = hass.data[DOMAIN]
+    async_add_entities(
+        [EventLoopLagSensor(monitor), ExecutorQueueDepthSensor(monitor)], True
+    )
+
+
+class EventLoopLagSensor(SensorEntity):
+    """Highest lag of the event loop in the last minute."""
+
+    _attr_name = "Event loop lag"
+    _attr_icon = "mdi:timer-sand"
+    _attr_unit_of_measurement = TIME_MILLISECONDS
+    _attr_state_class = STATE_CLASS_MEASUREMENT
+
+    def __init__(self, monitor: LoopMonitor) -> None:
+        """Initialize the sensor."""
+        self._monitor = monitor
+        self._attr_extra_state_attributes: dict[str, Any] = {}
+
+    async def async_update(self) -> None:
+        """Update the lag of the event loop."""
+        self._attr_state = round(self._monitor.lag * 1000, 1)
+        self._attr_extra_state_attributes = {
+            "average": round(self._monitor.average_lag * 1000, 1),
+            "most_blocking_integration": self._monitor.most_blocking_integration(),
+        }
+
+
+class ExecutorQueueDepthSensor(SensorEntity):
+    """Number of jobs waiting in the executor pools."""
+
+    _attr_name = "Executor queue depth"
+    _attr_icon = "mdi:tray-full"
+    _attr_state_class = STATE_CLASS_MEASUREMENT
+
+    def __init__(self, monitor: LoopMonitor) -> None:
+        """Initialize the sensor."""
+        self._monitor = monitor
+
+    async def async_update(self) -> None:
+        """Update the depth of the executor pool queues."""
+        self._attr_state = self._monitor.executor_queue_depth
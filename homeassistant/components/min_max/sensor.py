@@ -15,6 +15,7 @@ from homeassistant.core import callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.reload import async_setup_reload_service
+from homeassistant.util.aggregate import NumericAggregate
 
 from . import DOMAIN, PLATFORMS
 
@@ -79,63 +80,6 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     async_add_entities([MinMaxSensor(entity_ids, name, sensor_type, round_digits)])
 
 
-def calc_min(sensor_values):
-    """Calculate min value, honoring unknown states."""
-    val = None
-    entity_id = None
-    for sensor_id, sensor_value in sensor_values:
-        if sensor_value not in [STATE_UNKNOWN, STATE_UNAVAILABLE] and (
-            val is None or val > sensor_value
-        ):
-            entity_id, val = sensor_id, sensor_value
-    return entity_id, val
-
-
-def calc_max(sensor_values):
-    """Calculate max value, honoring unknown states."""
-    val = None
-    entity_id = None
-    for sensor_id, sensor_value in sensor_values:
-        if sensor_value not in [STATE_UNKNOWN, STATE_UNAVAILABLE] and (
-            val is None or val < sensor_value
-        ):
-            entity_id, val = sensor_id, sensor_value
-    return entity_id, val
-
-
-def calc_mean(sensor_values, round_digits):
-    """Calculate mean value, honoring unknown states."""
-    result = [
-        sensor_value
-        for _, sensor_value in sensor_values
-        if sensor_value not in [STATE_UNKNOWN, STATE_UNAVAILABLE]
-    ]
-
-    if not result:
-        return None
-    return round(sum(result) / len(result), round_digits)
-
-
-def calc_median(sensor_values, round_digits):
-    """Calculate median value, honoring unknown states."""
-    result = [
-        sensor_value
-        for _, sensor_value in sensor_values
-        if sensor_value not in [STATE_UNKNOWN, STATE_UNAVAILABLE]
-    ]
-
-    if not result:
-        return None
-    result.sort()
-    if len(result) % 2 == 0:
-        median1 = result[len(result) // 2]
-        median2 = result[len(result) // 2 - 1]
-        median = (median1 + median2) / 2
-    else:
-        median = result[len(result) // 2]
-    return round(median, round_digits)
-
-
 class MinMaxSensor(SensorEntity):
     """Representation of a min/max sensor."""
 
@@ -155,6 +99,7 @@ class MinMaxSensor(SensorEntity):
         self.min_entity_id = self.max_entity_id = self.last_entity_id = None
         self.count_sensors = len(self._entity_ids)
         self.states = {}
+        self._values = NumericAggregate(self._entity_ids)
 
     async def async_added_to_hass(self):
         """Handle added to Hass."""
@@ -217,6 +162,7 @@ class MinMaxSensor(SensorEntity):
             STATE_UNAVAILABLE,
         ]:
             self.states[entity] = STATE_UNKNOWN
+            self._values.remove(entity)
             self._calc_values()
             self.async_write_ha_state()
             return
@@ -235,8 +181,10 @@ class MinMaxSensor(SensorEntity):
             self._unit_of_measurement_mismatch = True
 
         try:
-            self.states[entity] = float(new_state.state)
-            self.last = float(new_state.state)
+            value = float(new_state.state)
+            self._values.set_value(entity, value)
+            self.states[entity] = value
+            self.last = value
             self.last_entity_id = entity
         except ValueError:
             _LOGGER.warning(
@@ -249,12 +197,12 @@ class MinMaxSensor(SensorEntity):
     @callback
     def _calc_values(self):
         """Calculate the values."""
-        sensor_values = [
-            (entity_id, self.states[entity_id])
-            for entity_id in self._entity_ids
-            if entity_id in self.states
-        ]
-        self.min_entity_id, self.min_value = calc_min(sensor_values)
-        self.max_entity_id, self.max_value = calc_max(sensor_values)
-        self.mean = calc_mean(sensor_values, self._round_digits)
-        self.median = calc_median(sensor_values, self._round_digits)
+        self.min_entity_id = self._values.min_member
+        self.min_value = self._values.min
+        self.max_entity_id = self._values.max_member
+        self.max_value = self._values.max
+        self.mean = self.median = None
+        if (mean := self._values.mean) is not None:
+            self.mean = round(mean, self._round_digits)
+        if (median := self._values.median) is not None:
+            self.median = round(median, self._round_digits)
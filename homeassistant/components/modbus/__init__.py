@@ -60,6 +60,7 @@ from .const import (
     CONF_BYTESIZE,
     CONF_CLIMATES,
     CONF_CLOSE_COMM_ON_ERROR,
+    CONF_CONNECTIONS,
     CONF_DATA_COUNT,
     CONF_DATA_TYPE,
     CONF_FANS,
@@ -68,6 +69,7 @@ from .const import (
     CONF_MIN_TEMP,
     CONF_PARITY,
     CONF_PRECISION,
+    CONF_READ_GAP,
     CONF_RETRIES,
     CONF_RETRY_ON_EMPTY,
     CONF_REVERSE_ORDER,
@@ -285,6 +287,7 @@ MODBUS_SCHEMA = vol.Schema(
         vol.Optional(CONF_DELAY, default=0): cv.positive_int,
         vol.Optional(CONF_RETRIES, default=3): cv.positive_int,
         vol.Optional(CONF_RETRY_ON_EMPTY, default=False): cv.boolean,
+        vol.Optional(CONF_READ_GAP): cv.positive_int,
         vol.Optional(CONF_BINARY_SENSORS): vol.All(
             cv.ensure_list, [BINARY_SENSOR_SCHEMA]
         ),
@@ -318,6 +321,9 @@ ETHERNET_SCHEMA = MODBUS_SCHEMA.extend(
         vol.Required(CONF_HOST): cv.string,
         vol.Required(CONF_PORT): cv.port,
         vol.Required(CONF_TYPE): vol.Any(CONF_TCP, CONF_UDP, CONF_RTUOVERTCP),
+        vol.Optional(CONF_CONNECTIONS, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=8)
+        ),
     }
 )
 
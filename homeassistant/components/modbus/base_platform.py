@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from datetime import timedelta
 import logging
 from typing import Any
 
@@ -18,7 +17,7 @@ from homeassistant.const import (
     STATE_ON,
 )
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import (
@@ -65,9 +64,7 @@ class BasePlatform(Entity):
     async def async_base_added_to_hass(self):
         """Handle entity which will be added."""
         if self._scan_interval > 0:
-            async_track_time_interval(
-                self.hass, self.async_update, timedelta(seconds=self._scan_interval)
-            )
+            self._hub.async_track_update(self._scan_interval, self.async_update)
 
     @property
     def name(self):
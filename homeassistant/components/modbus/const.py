@@ -21,6 +21,7 @@ CONF_BYTESIZE = "bytesize"
 CONF_CLIMATES = "climates"
 CONF_CLOSE_COMM_ON_ERROR = "close_comm_on_error"
 CONF_COILS = "coils"
+CONF_CONNECTIONS = "connections"
 CONF_CURRENT_TEMP = "current_temp_register"
 CONF_CURRENT_TEMP_REGISTER_TYPE = "current_temp_register_type"
 CONF_DATA_COUNT = "data_count"
@@ -39,6 +40,7 @@ CONF_RETRIES = "retries"
 CONF_RETRY_ON_EMPTY = "retry_on_empty"
 CONF_REVERSE_ORDER = "reverse_order"
 CONF_PRECISION = "precision"
+CONF_READ_GAP = "read_gap"
 CONF_RTUOVERTCP = "rtuovertcp"
 CONF_SCALE = "scale"
 CONF_SERIAL = "serial"
@@ -125,6 +127,10 @@ DEFAULT_STRUCT_FORMAT = {
 DEFAULT_TEMP_UNIT = "C"
 MODBUS_DOMAIN = "modbus"
 
+# longest block reads the modbus protocol allows
+MAX_READ_BITS = 2000
+MAX_READ_REGISTERS = 125
+
 PLATFORMS = (
     (BINARY_SENSOR_DOMAIN, CONF_BINARY_SENSORS),
     (CLIMATE_DOMAIN, CONF_CLIMATES),
@@ -1,7 +1,15 @@
 """Support for Modbus."""
+from __future__ import annotations
+
 import asyncio
 from copy import deepcopy
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import partial
 import logging
+import time
+from types import SimpleNamespace
+from typing import Any, Callable
 
 from pymodbus.client.sync import ModbusSerialClient, ModbusTcpClient, ModbusUdpClient
 from pymodbus.constants import Defaults
@@ -18,9 +26,9 @@ from homeassistant.const import (
     CONF_TYPE,
     EVENT_HOMEASSISTANT_STOP,
 )
-from homeassistant.core import callback
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.helpers.discovery import async_load_platform
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 
 from .const import (
     ATTR_ADDRESS,
@@ -39,7 +47,9 @@ from .const import (
     CONF_BAUDRATE,
     CONF_BYTESIZE,
     CONF_CLOSE_COMM_ON_ERROR,
+    CONF_CONNECTIONS,
     CONF_PARITY,
+    CONF_READ_GAP,
     CONF_RETRIES,
     CONF_RETRY_ON_EMPTY,
     CONF_RTUOVERTCP,
@@ -48,61 +58,121 @@ from .const import (
     CONF_TCP,
     CONF_UDP,
     DEFAULT_HUB,
+    MAX_READ_BITS,
+    MAX_READ_REGISTERS,
     MODBUS_DOMAIN as DOMAIN,
     PLATFORMS,
     SERVICE_WRITE_COIL,
     SERVICE_WRITE_REGISTER,
 )
 
-ENTRY_FUNC = "func"
 ENTRY_ATTR = "attr"
 ENTRY_NAME = "name"
 
 _LOGGER = logging.getLogger(__name__)
 
+# Weight of the latest transaction in the average latency
+LATENCY_SMOOTHING = 0.1
+
 PYMODBUS_CALL = {
     CALL_TYPE_COIL: {
         ENTRY_ATTR: "bits",
         ENTRY_NAME: "read_coils",
-        ENTRY_FUNC: None,
     },
     CALL_TYPE_DISCRETE: {
         ENTRY_ATTR: "bits",
         ENTRY_NAME: "read_discrete_inputs",
-        ENTRY_FUNC: None,
     },
     CALL_TYPE_REGISTER_HOLDING: {
         ENTRY_ATTR: "registers",
         ENTRY_NAME: "read_holding_registers",
-        ENTRY_FUNC: None,
     },
     CALL_TYPE_REGISTER_INPUT: {
         ENTRY_ATTR: "registers",
         ENTRY_NAME: "read_input_registers",
-        ENTRY_FUNC: None,
     },
     CALL_TYPE_WRITE_COIL: {
         ENTRY_ATTR: "value",
         ENTRY_NAME: "write_coil",
-        ENTRY_FUNC: None,
     },
     CALL_TYPE_WRITE_COILS: {
         ENTRY_ATTR: "count",
         ENTRY_NAME: "write_coils",
-        ENTRY_FUNC: None,
     },
     CALL_TYPE_WRITE_REGISTER: {
         ENTRY_ATTR: "value",
         ENTRY_NAME: "write_register",
-        ENTRY_FUNC: None,
     },
     CALL_TYPE_WRITE_REGISTERS: {
         ENTRY_ATTR: "count",
         ENTRY_NAME: "write_registers",
-        ENTRY_FUNC: None,
     },
 }
 
+# Reads that can be merged into block reads, and the longest block
+READ_CALLS = {
+    CALL_TYPE_COIL: MAX_READ_BITS,
+    CALL_TYPE_DISCRETE: MAX_READ_BITS,
+    CALL_TYPE_REGISTER_HOLDING: MAX_READ_REGISTERS,
+    CALL_TYPE_REGISTER_INPUT: MAX_READ_REGISTERS,
+}
+
+
+@dataclass
+class SlaveStats:
+    """Latency and errors of the transactions with a slave."""
+
+    transactions: int = 0
+    errors: int = 0
+    latency: float = 0.0
+    max_latency: float = 0.0
+
+    def record(self, latency: float, error: bool) -> None:
+        """Record a transaction."""
+        self.transactions += 1
+        if error:
+            self.errors += 1
+        if self.transactions == 1:
+            self.latency = latency
+        else:
+            self.latency += LATENCY_SMOOTHING * (latency - self.latency)
+        self.max_latency = max(self.max_latency, latency)
+
+
+@dataclass
+class ReadBlock:
+    """A block read covering the reads of several entities."""
+
+    address: int
+    count: int
+    reads: list[tuple[int, int, asyncio.Future]] = field(default_factory=list)
+
+
+def plan_read_blocks(
+    reads: list[tuple[int, int, asyncio.Future]], max_count: int, gap: int
+) -> list[ReadBlock]:
+    """Merge reads of overlapping or nearby addresses into blocks.
+
+    Reads are merged when at most gap addresses lie between them and the
+    block does not get longer than max_count.
+    """
+    blocks: list[ReadBlock] = []
+    block: ReadBlock | None = None
+    for read in sorted(reads, key=lambda read: read[0]):
+        address, count, _ = read
+        end = max(address + count, block.address + block.count) if block else 0
+        if (
+            block is None
+            or address > block.address + block.count + gap
+            or end - block.address > max_count
+        ):
+            block = ReadBlock(address, count)
+            blocks.append(block)
+        else:
+            block.count = end - block.address
+        block.reads.append(read)
+    return blocks
+
 
 async def async_modbus_setup(
     hass, config, service_write_register_schema, service_write_coil_schema
@@ -183,20 +253,39 @@ async def async_modbus_setup(
 
 
 class ModbusHub:
-    """Thread safe wrapper class for pymodbus."""
+    """Thread safe wrapper class for pymodbus.
+
+    If a read gap is configured, reads of the same slave and type that are
+    requested together are merged into block reads. Blocks the device
+    refuses to read are remembered and not merged again. Transactions run
+    concurrently over the connections of the hub, each connection handling
+    one transaction at a time.
+    """
 
     def __init__(self, hass, client_config):
         """Initialize the Modbus hub."""
 
         # generic configuration
-        self._client = None
+        self._clients = []
+        self._idle_clients = asyncio.Queue()
         self._async_cancel_listener = None
         self._in_error = False
-        self._lock = asyncio.Lock()
         self.hass = hass
         self._config_name = client_config[CONF_NAME]
         self._config_type = client_config[CONF_TYPE]
         self._config_delay = client_config[CONF_DELAY]
+        self._connections = (
+            client_config.get(CONF_CONNECTIONS, 1)
+            if self._config_type == CONF_TCP
+            else 1
+        )
+        self._read_gap: int | None = client_config.get(CONF_READ_GAP)
+        self._pending_reads: dict[tuple[int, str], list] = {}
+        self._unmergeable_blocks: set[tuple[int, str, int, int]] = set()
+        self._flush_scheduled = False
+        self._pollers: dict[int, list[Callable]] = {}
+        self._unsub_pollers: list[CALLBACK_TYPE] = []
+        self.slave_stats: dict[int, SlaveStats] = {}
         self._pb_call = deepcopy(PYMODBUS_CALL)
         self._pb_class = {
             CONF_SERIAL: ModbusSerialClient,
@@ -241,16 +330,19 @@ class ModbusHub:
     async def async_setup(self):
         """Set up pymodbus client."""
         try:
-            self._client = self._pb_class[self._config_type](**self._pb_params)
+            self._clients = [
+                self._pb_class[self._config_type](**self._pb_params)
+                for _ in range(self._connections)
+            ]
         except ModbusException as exception_error:
             self._log_error(str(exception_error), error_state=False)
             return False
 
-        for entry in self._pb_call.values():
-            entry[ENTRY_FUNC] = getattr(self._client, entry[ENTRY_NAME])
-
-        async with self._lock:
-            if not await self.hass.async_add_executor_job(self._pymodbus_connect):
+        for client in self._clients:
+            self._idle_clients.put_nowait(client)
+            if not await self.hass.async_add_executor_job(
+                self._pymodbus_connect, client
+            ):
                 self._log_error("initial connect failed, no retry", error_state=False)
                 return False
 
@@ -267,42 +359,76 @@ class ModbusHub:
         self._async_cancel_listener = None
         self._config_delay = 0
 
-    def _pymodbus_close(self):
+    @callback
+    def async_track_update(self, scan_interval: int, action: Callable) -> None:
+        """Call an update action of an entity every scan interval.
+
+        The actions of all entities with the same scan interval are called
+        together, so their reads can be merged.
+        """
+        if (actions := self._pollers.get(scan_interval)) is None:
+            actions = self._pollers[scan_interval] = []
+            self._unsub_pollers.append(
+                async_track_time_interval(
+                    self.hass,
+                    partial(self._async_poll, actions),
+                    timedelta(seconds=scan_interval),
+                )
+            )
+        actions.append(action)
+
+    @callback
+    def _async_poll(self, actions: list[Callable], now) -> None:
+        """Call the update actions of the entities with a scan interval."""
+        for action in actions:
+            self.hass.async_create_task(action(now))
+
+    def _pymodbus_close(self, clients):
         """Close sync. pymodbus."""
-        if self._client:
+        for client in clients:
             try:
-                self._client.close()
+                client.close()
             except ModbusException as exception_error:
                 self._log_error(str(exception_error))
-        self._client = None
 
     async def async_close(self):
         """Disconnect client."""
         if self._async_cancel_listener:
             self._async_cancel_listener()
             self._async_cancel_listener = None
-
-        async with self._lock:
-            return await self.hass.async_add_executor_job(self._pymodbus_close)
-
-    def _pymodbus_connect(self):
+        for unsub in self._unsub_pollers:
+            unsub()
+        self._unsub_pollers.clear()
+
+        # Wait for the running transactions
+        clients = [await self._idle_clients.get() for _ in self._clients]
+        self._clients = []
+        await self.hass.async_add_executor_job(self._pymodbus_close, clients)
+        for client in clients:
+            self._idle_clients.put_nowait(client)
+
+    def _pymodbus_connect(self, client):
         """Connect client."""
         try:
-            return self._client.connect()
+            return client.connect()
         except ModbusException as exception_error:
             self._log_error(str(exception_error), error_state=False)
             return False
 
-    def _pymodbus_call(self, unit, address, value, use_call):
+    def _pymodbus_call(self, client, unit, address, value, use_call, log_error=True):
         """Call sync. pymodbus."""
         kwargs = {"unit": unit} if unit else {}
         try:
-            result = self._pb_call[use_call][ENTRY_FUNC](address, value, **kwargs)
+            result = getattr(client, self._pb_call[use_call][ENTRY_NAME])(
+                address, value, **kwargs
+            )
         except ModbusException as exception_error:
-            self._log_error(str(exception_error))
-            return None
+            result = exception_error
         if not hasattr(result, self._pb_call[use_call][ENTRY_ATTR]):
-            self._log_error(str(result))
+            if log_error:
+                self._log_error(str(result))
+            else:
+                _LOGGER.debug("Pymodbus: %s", result)
             return None
         self._in_error = False
         return result
@@ -311,15 +437,133 @@ class ModbusHub:
         """Convert async to sync pymodbus call."""
         if self._config_delay:
             return None
-        if not self._client:
+        if not self._clients:
             return None
-        if not self._client.is_socket_open():
+        if not self._clients[0].is_socket_open():
             return None
-        async with self._lock:
+        if use_call in READ_CALLS:
+            return await self._async_read(unit, address, value, use_call)
+        return await self._async_transaction(unit, address, value, use_call)
+
+    async def _async_transaction(self, unit, address, value, use_call, log_error=True):
+        """Run a transaction on the next idle connection."""
+        client = await self._idle_clients.get()
+        try:
+            start = time.monotonic()
             result = await self.hass.async_add_executor_job(
-                self._pymodbus_call, unit, address, value, use_call
+                self._pymodbus_call, client, unit, address, value, use_call, log_error
+            )
+            self.slave_stats.setdefault(unit or 0, SlaveStats()).record(
+                time.monotonic() - start, result is None
             )
             if self._config_type == "serial":
                 # small delay until next request/response
                 await asyncio.sleep(30 / 1000)
             return result
+        finally:
+            self._idle_clients.put_nowait(client)
+
+    async def _async_read(self, unit, address, count, use_call):
+        """Queue a read to be merged with the reads requested together."""
+        future = self.hass.loop.create_future()
+        self._pending_reads.setdefault((unit, use_call), []).append(
+            (address, count, future)
+        )
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.hass.loop.call_soon(self._async_flush_reads)
+        return await future
+
+    @callback
+    def _async_flush_reads(self) -> None:
+        """Send the queued reads as block reads."""
+        self._flush_scheduled = False
+        pending, self._pending_reads = self._pending_reads, {}
+        for (unit, use_call), reads in pending.items():
+            if self._read_gap is None:
+                blocks = [ReadBlock(read[0], read[1], [read]) for read in reads]
+            else:
+                blocks = plan_read_blocks(reads, READ_CALLS[use_call], self._read_gap)
+            for block in blocks:
+                if (
+                    len(block.reads) > 1
+                    and (unit, use_call, block.address, block.count)
+                    in self._unmergeable_blocks
+                ):
+                    for read in block.reads:
+                        self.hass.async_create_task(
+                            self._async_read_block(
+                                unit, use_call, ReadBlock(read[0], read[1], [read])
+                            )
+                        )
+                    continue
+                self.hass.async_create_task(
+                    self._async_read_block(unit, use_call, block)
+                )
+
+    async def _async_read_block(self, unit, use_call, block: ReadBlock) -> None:
+        """Read a block and pass the values to the reads it covers.
+
+        The reads get the exception if the block can't be read, so entities
+        don't wait for them forever.
+        """
+        try:
+            await self._async_read_block_values(unit, use_call, block)
+        except asyncio.CancelledError:
+            for _, _, future in block.reads:
+                future.cancel()
+            raise
+        except Exception as exception_error:  # pylint: disable=broad-except
+            for _, _, future in block.reads:
+                if not future.done():
+                    future.set_exception(exception_error)
+
+    async def _async_read_block_values(self, unit, use_call, block: ReadBlock) -> None:
+        """Read a block and set the results of its reads."""
+        if len(block.reads) == 1:
+            _set_read_result(
+                block.reads[0][2],
+                await self._async_transaction(
+                    unit, block.address, block.count, use_call
+                ),
+            )
+            return
+
+        result = await self._async_transaction(
+            unit, block.address, block.count, use_call, log_error=False
+        )
+        if result is None:
+            # The device may not allow reading the addresses in the gaps
+            read_any = False
+            for address, count, future in block.reads:
+                read_result = await self._async_transaction(
+                    unit, address, count, use_call
+                )
+                read_any = read_any or read_result is not None
+                _set_read_result(future, read_result)
+            if read_any:
+                _LOGGER.debug(
+                    "Pymodbus: not merging reads of %s %s-%s of slave %s anymore",
+                    use_call,
+                    block.address,
+                    block.address + block.count - 1,
+                    unit,
+                )
+                self._unmergeable_blocks.add(
+                    (unit, use_call, block.address, block.count)
+                )
+            return
+
+        attr = self._pb_call[use_call][ENTRY_ATTR]
+        values = getattr(result, attr)
+        for address, count, future in block.reads:
+            offset = address - block.address
+            _set_read_result(
+                future, SimpleNamespace(**{attr: values[offset : offset + count]})
+            )
+
+
+def _set_read_result(future: asyncio.Future, result: Any) -> None:
+    """Pass the result of a read unless the entity stopped waiting."""
+    if not future.done():
+        future.set_result(result)
@@ -3,39 +3,49 @@ from __future__ import annotations
 
 import logging
 
-from icmplib import SocketPermissionError, ping as icmp_ping
+import voluptuous as vol
 
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.helpers.reload import async_setup_reload_service
 
-from .const import DOMAIN, PING_PRIVS, PLATFORMS
+from .const import CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT, DOMAIN, PING_ENGINE, PLATFORMS
+from .icmp import ICMPEngine, can_create_socket
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Schema(
+            {
+                vol.Optional(CONF_RATE_LIMIT, default=DEFAULT_RATE_LIMIT): vol.All(
+                    vol.Coerce(float), vol.Range(min=1)
+                ),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 
 async def async_setup(hass, config):
     """Set up the template integration."""
     await async_setup_reload_service(hass, DOMAIN, PLATFORMS)
-    hass.data[DOMAIN] = {
-        PING_PRIVS: await hass.async_add_executor_job(_can_use_icmp_lib_with_privilege),
-    }
+    rate_limit = config.get(DOMAIN, {}).get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT)
+    engine = _async_create_engine(hass, rate_limit)
+    if engine is not None:
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, engine.async_close)
+    hass.data[DOMAIN] = {PING_ENGINE: engine}
     return True
 
 
-def _can_use_icmp_lib_with_privilege() -> None | bool:
-    """Verify we can create a raw socket."""
-    try:
-        icmp_ping("127.0.0.1", count=0, timeout=0, privileged=True)
-    except SocketPermissionError:
-        try:
-            icmp_ping("127.0.0.1", count=0, timeout=0, privileged=False)
-        except SocketPermissionError:
-            _LOGGER.debug(
-                "Cannot use icmplib because privileges are insufficient to create the socket"
-            )
-            return None
-        else:
-            _LOGGER.debug("Using icmplib in privileged=False mode")
-            return False
-    else:
-        _LOGGER.debug("Using icmplib in privileged=True mode")
-        return True
+def _async_create_engine(hass, rate_limit: float) -> ICMPEngine | None:
+    """Create the ICMP engine if we can create a socket."""
+    for privileged in (True, False):
+        if can_create_socket(privileged):
+            _LOGGER.debug("Using ICMP sockets in privileged=%s mode", privileged)
+            return ICMPEngine(hass.loop, privileged, rate_limit)
+
+    _LOGGER.debug(
+        "Cannot use ICMP sockets because privileges are insufficient to create the socket"
+    )
+    return None
@@ -9,7 +9,6 @@ import re
 import sys
 from typing import Any
 
-from icmplib import NameLookupError, async_ping
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import (
@@ -21,7 +20,8 @@ from homeassistant.const import CONF_HOST, CONF_NAME, STATE_ON
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN, ICMP_TIMEOUT, PING_PRIVS, PING_TIMEOUT
+from .const import DOMAIN, ICMP_INTERVAL, ICMP_TIMEOUT, PING_ENGINE, PING_TIMEOUT
+from .icmp import ICMPEngine
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,15 +68,13 @@ async def async_setup_platform(
     host = config[CONF_HOST]
     count = config[CONF_PING_COUNT]
     name = config.get(CONF_NAME, f"{DEFAULT_NAME} {host}")
-    privileged = hass.data[DOMAIN][PING_PRIVS]
-    if privileged is None:
-        ping_cls = PingDataSubProcess
+    engine = hass.data[DOMAIN][PING_ENGINE]
+    if engine is None:
+        ping = PingDataSubProcess(hass, host, count)
     else:
-        ping_cls = PingDataICMPLib
+        ping = PingDataICMP(hass, host, count, engine)
 
-    async_add_entities(
-        [PingBinarySensor(name, ping_cls(hass, host, count, privileged))]
-    )
+    async_add_entities([PingBinarySensor(name, ping)])
 
 
 class PingBinarySensor(RestoreEntity, BinarySensorEntity):
@@ -158,27 +156,23 @@ class PingData:
         self.is_alive = False
 
 
-class PingDataICMPLib(PingData):
-    """The Class for handling the data retrieval using icmplib."""
+class PingDataICMP(PingData):
+    """The Class for handling the data retrieval using the shared ICMP engine."""
 
-    def __init__(self, hass, host, count, privileged) -> None:
+    def __init__(self, hass, host, count, engine: ICMPEngine) -> None:
         """Initialize the data object."""
         super().__init__(hass, host, count)
-        self._privileged = privileged
+        self._engine = engine
 
     async def async_update(self) -> None:
         """Retrieve the latest details from the host."""
         _LOGGER.debug("ping address: %s", self._ip_address)
-        try:
-            data = await async_ping(
-                self._ip_address,
-                count=self._count,
-                timeout=ICMP_TIMEOUT,
-                privileged=self._privileged,
-            )
-        except NameLookupError:
-            self.is_alive = False
-            return
+        data = await self._engine.async_ping(
+            self._ip_address,
+            count=self._count,
+            timeout=ICMP_TIMEOUT,
+            interval=ICMP_INTERVAL,
+        )
 
         self.is_alive = data.is_alive
         if not self.is_alive:
@@ -189,14 +183,14 @@ class PingDataICMPLib(PingData):
             "min": data.min_rtt,
             "max": data.max_rtt,
             "avg": data.avg_rtt,
-            "mdev": "",
+            "mdev": data.mdev_rtt,
         }
 
 
 class PingDataSubProcess(PingData):
     """The Class for handling the data retrieval using the ping binary."""
 
-    def __init__(self, hass, host, count, privileged) -> None:
+    def __init__(self, hass, host, count) -> None:
         """Initialize the data object."""
         super().__init__(hass, host, count)
         if sys.platform == "win32":
@@ -1,18 +1,26 @@
 """Tracks devices by sending a ICMP echo request (ping)."""
 
-# The ping binary and icmplib timeouts are not the same
-# timeout. ping is an overall timeout, icmplib is the
+# The ping binary and ICMP socket timeouts are not the same
+# timeout. ping is an overall timeout, the ICMP socket one is the
 # time since the data was sent.
 
 # ping binary
 PING_TIMEOUT = 3
 
-# icmplib timeout
+# ICMP socket timeout
 ICMP_TIMEOUT = 1
 
+# Time between the echo requests to a host
+ICMP_INTERVAL = 1
+
 PING_ATTEMPTS_COUNT = 3
 
 DOMAIN = "ping"
 PLATFORMS = ["binary_sensor"]
 
-PING_PRIVS = "ping_privs"
+PING_ENGINE = "ping_engine"
+
+CONF_RATE_LIMIT = "rate_limit"
+
+# Echo requests sent per second
+DEFAULT_RATE_LIMIT = 100
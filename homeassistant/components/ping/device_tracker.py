@@ -5,7 +5,6 @@ import logging
 import subprocess
 import sys
 
-from icmplib import async_multiping
 import voluptuous as vol
 
 from homeassistant import const, util
@@ -20,7 +19,7 @@ from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util.async_ import gather_with_concurrency
 from homeassistant.util.process import kill_subprocess
 
-from .const import DOMAIN, ICMP_TIMEOUT, PING_ATTEMPTS_COUNT, PING_PRIVS, PING_TIMEOUT
+from .const import DOMAIN, ICMP_TIMEOUT, PING_ATTEMPTS_COUNT, PING_ENGINE, PING_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,7 +38,7 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 class HostSubProcess:
     """Host object with ping detection."""
 
-    def __init__(self, ip_address, dev_id, hass, config, privileged):
+    def __init__(self, ip_address, dev_id, hass, config):
         """Initialize the Host pinger."""
         self.hass = hass
         self.ip_address = ip_address
@@ -80,7 +79,7 @@ class HostSubProcess:
 async def async_setup_scanner(hass, config, async_see, discovery_info=None):
     """Set up the Host objects and return the update function."""
 
-    privileged = hass.data[DOMAIN][PING_PRIVS]
+    engine = hass.data[DOMAIN][PING_ENGINE]
     ip_to_dev_id = {ip: dev_id for (dev_id, ip) in config[const.CONF_HOSTS].items()}
     interval = config.get(
         CONF_SCAN_INTERVAL,
@@ -92,9 +91,9 @@ async def async_setup_scanner(hass, config, async_see, discovery_info=None):
         ",".join(ip_to_dev_id.keys()),
     )
 
-    if privileged is None:
+    if engine is None:
         hosts = [
-            HostSubProcess(ip, dev_id, hass, config, privileged)
+            HostSubProcess(ip, dev_id, hass, config)
             for (dev_id, ip) in config[const.CONF_HOSTS].items()
         ]
 
@@ -116,13 +115,24 @@ async def async_setup_scanner(hass, config, async_see, discovery_info=None):
 
         async def async_update(now):
             """Update all the hosts on every interval time."""
-            responses = await async_multiping(
-                list(ip_to_dev_id),
-                count=PING_ATTEMPTS_COUNT,
-                timeout=ICMP_TIMEOUT,
-                privileged=privileged,
+            responses = await asyncio.gather(
+                *[
+                    engine.async_ping(
+                        ip,
+                        count=PING_ATTEMPTS_COUNT,
+                        timeout=ICMP_TIMEOUT,
+                        until_alive=True,
+                    )
+                    for ip in ip_to_dev_id
+                ]
+            )
+            _LOGGER.debug(
+                "Ping responses: %s",
+                {
+                    ip: response.is_alive
+                    for ip, response in zip(ip_to_dev_id, responses)
+                },
             )
-            _LOGGER.debug("Multiping responses: %s", responses)
             await asyncio.gather(
                 *[
                     async_see(dev_id=dev_id, source_type=SOURCE_TYPE_ROUTER)
@@ -0,0 +1,320 @@
+"""Send ICMP echo requests to many hosts concurrently.
+
+All echo requests of an address family go out over one socket, either a
+raw socket or, without the privileges for it, an unprivileged datagram
+socket. The replies are read by the event loop and matched to the pending
+requests by their sequence number.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import ipaddress
+import logging
+import random
+import socket
+import statistics
+import struct
+
+from homeassistant.core import callback
+
+_LOGGER = logging.getLogger(__name__)
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+ICMPV6_ECHO_REQUEST = 128
+ICMPV6_ECHO_REPLY = 129
+
+# Same payload size as the ping binary
+PAYLOAD = bytes(56)
+RECEIVE_BUFFER = 1024
+
+# Round trip times kept per host
+RTT_SAMPLES = 100
+
+
+class PingStatistics:
+    """Round trip times of the echo requests sent to a host."""
+
+    def __init__(self, samples: int | None = None) -> None:
+        """Initialize the statistics, keeping the last samples if given."""
+        self.packets_sent = 0
+        self.packets_received = 0
+        self.rtts: deque[float] = deque(maxlen=samples)
+
+    def add(self, rtt: float | None) -> None:
+        """Add the round trip time of a request, None if it was lost."""
+        self.packets_sent += 1
+        if rtt is not None:
+            self.packets_received += 1
+            self.rtts.append(rtt)
+
+    @property
+    def is_alive(self) -> bool:
+        """Return if the host replied to any request."""
+        return self.packets_received > 0
+
+    @property
+    def packet_loss(self) -> float:
+        """Return the share of requests that were lost."""
+        if not self.packets_sent:
+            return 0.0
+        return 1 - self.packets_received / self.packets_sent
+
+    @property
+    def min_rtt(self) -> float:
+        """Return the lowest round trip time in milliseconds."""
+        return round(min(self.rtts, default=0.0), 3)
+
+    @property
+    def max_rtt(self) -> float:
+        """Return the highest round trip time in milliseconds."""
+        return round(max(self.rtts, default=0.0), 3)
+
+    @property
+    def avg_rtt(self) -> float:
+        """Return the average round trip time in milliseconds."""
+        if not self.rtts:
+            return 0.0
+        return round(statistics.fmean(self.rtts), 3)
+
+    @property
+    def mdev_rtt(self) -> float:
+        """Return the deviation of the round trip times in milliseconds."""
+        if not self.rtts:
+            return 0.0
+        return round(statistics.pstdev(self.rtts), 3)
+
+
+def can_create_socket(privileged: bool) -> bool:
+    """Return if an ICMP socket can be created."""
+    try:
+        _create_socket(socket.AF_INET, privileged).close()
+    except OSError:
+        return False
+    return True
+
+
+def _create_socket(family: int, privileged: bool) -> socket.socket:
+    """Create a non-blocking ICMP socket."""
+    sock = socket.socket(
+        family,
+        socket.SOCK_RAW if privileged else socket.SOCK_DGRAM,
+        socket.IPPROTO_ICMP if family == socket.AF_INET else socket.IPPROTO_ICMPV6,
+    )
+    sock.setblocking(False)
+    return sock
+
+
+def _checksum(data: bytes) -> int:
+    """Return the internet checksum of data."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+class _EchoSocket:
+    """ICMP socket of one address family and its pending echo requests."""
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, family: int, privileged: bool
+    ) -> None:
+        """Open the socket and start reading replies."""
+        self._loop = loop
+        self._family = family
+        self._privileged = privileged
+        self._sock = _create_socket(family, privileged)
+        # The kernel replaces the identifier of unprivileged sockets
+        self._identifier = random.getrandbits(16)
+        self._sequence = random.getrandbits(16)
+        self._pending: dict[int, tuple[str, asyncio.Future[float]]] = {}
+        if family == socket.AF_INET:
+            self._request_type, self._reply_type = ICMP_ECHO_REQUEST, ICMP_ECHO_REPLY
+        else:
+            self._request_type, self._reply_type = (
+                ICMPV6_ECHO_REQUEST,
+                ICMPV6_ECHO_REPLY,
+            )
+        loop.add_reader(self._sock.fileno(), self._read)
+
+    def close(self) -> None:
+        """Stop reading replies and close the socket."""
+        self._loop.remove_reader(self._sock.fileno())
+        self._sock.close()
+
+    def send(self, address: str) -> tuple[int, asyncio.Future[float]]:
+        """Send an echo request and return a future for the time of the reply."""
+        while True:
+            self._sequence = (self._sequence + 1) & 0xFFFF
+            if self._sequence not in self._pending:
+                break
+        sequence = self._sequence
+
+        header = struct.pack(
+            "!BBHHH", self._request_type, 0, 0, self._identifier, sequence
+        )
+        checksum = _checksum(header + PAYLOAD)
+        packet = header[:2] + struct.pack("!H", checksum) + header[4:] + PAYLOAD
+
+        self._sock.sendto(packet, (address, 0))
+        future: asyncio.Future[float] = self._loop.create_future()
+        self._pending[sequence] = (address, future)
+        return sequence, future
+
+    def discard(self, sequence: int) -> None:
+        """Stop waiting for the reply to a request."""
+        self._pending.pop(sequence, None)
+
+    def _read(self) -> None:
+        """Read the replies waiting on the socket."""
+        while True:
+            try:
+                packet, source = self._sock.recvfrom(RECEIVE_BUFFER)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as err:
+                _LOGGER.debug("Error receiving ICMP reply: %s", err)
+                return
+            self._handle_reply(packet, source[0], self._loop.time())
+
+    def _handle_reply(self, packet: bytes, source: str, received: float) -> None:
+        """Resolve the request a reply belongs to."""
+        if self._family == socket.AF_INET and self._privileged:
+            # Raw IPv4 sockets receive the IP header as well
+            packet = packet[(packet[0] & 0x0F) * 4 :]
+        if len(packet) < 8:
+            return
+
+        reply_type, _, _, identifier, sequence = struct.unpack_from("!BBHHH", packet)
+        if reply_type != self._reply_type:
+            return
+        # Raw sockets receive the replies to all processes
+        if self._privileged and identifier != self._identifier:
+            return
+        if (pending := self._pending.get(sequence)) is None:
+            return
+        address, future = pending
+        if address != source:
+            return
+
+        del self._pending[sequence]
+        if not future.done():
+            future.set_result(received)
+
+
+class ICMPEngine:
+    """Send echo requests to hosts and track their round trip times."""
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, privileged: bool, rate_limit: float
+    ) -> None:
+        """Initialize the engine, sending at most rate_limit requests per second."""
+        self._loop = loop
+        self.privileged = privileged
+        self._send_interval = 1 / rate_limit
+        self._next_send = 0.0
+        self._sockets: dict[int, _EchoSocket] = {}
+        self._stats: dict[str, PingStatistics] = {}
+
+    @callback
+    def async_close(self, *_) -> None:
+        """Close the sockets."""
+        for echo_socket in self._sockets.values():
+            echo_socket.close()
+        self._sockets.clear()
+
+    def host_statistics(self, host: str) -> PingStatistics | None:
+        """Return the statistics of the last requests sent to a host."""
+        return self._stats.get(host)
+
+    async def async_ping(
+        self,
+        host: str,
+        count: int = 1,
+        timeout: float = 1,
+        interval: float = 0,
+        until_alive: bool = False,
+    ) -> PingStatistics:
+        """Send echo requests to a host one after the other.
+
+        Stops at the first reply if until_alive is set.
+        """
+        result = PingStatistics()
+        if (target := await self._async_resolve(host)) is None:
+            return result
+
+        family, address = target
+        host_stats = self._stats.setdefault(host, PingStatistics(RTT_SAMPLES))
+        for attempt in range(count):
+            if attempt and interval:
+                await asyncio.sleep(interval)
+            rtt = await self._async_probe(family, address, timeout)
+            result.add(rtt)
+            host_stats.add(rtt)
+            if rtt is not None and until_alive:
+                break
+
+        return result
+
+    async def _async_resolve(self, host: str) -> tuple[int, str] | None:
+        """Return the address family and address of a host."""
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            pass
+        else:
+            family = socket.AF_INET if address.version == 4 else socket.AF_INET6
+            return family, str(address)
+
+        try:
+            infos = await self._loop.getaddrinfo(host, None, type=socket.SOCK_DGRAM)
+        except (socket.gaierror, UnicodeError) as err:
+            _LOGGER.debug("Cannot resolve %s: %s", host, err)
+            return None
+        family, _, _, _, sockaddr = infos[0]
+        return family, sockaddr[0]
+
+    def _get_socket(self, family: int) -> _EchoSocket | None:
+        """Return the socket of an address family, opening it if needed."""
+        if (echo_socket := self._sockets.get(family)) is None:
+            try:
+                echo_socket = _EchoSocket(self._loop, family, self.privileged)
+            except OSError as err:
+                _LOGGER.debug("Cannot open ICMP socket: %s", err)
+                return None
+            self._sockets[family] = echo_socket
+        return echo_socket
+
+    async def _async_throttle(self) -> None:
+        """Wait for the next free slot to send a request in."""
+        now = self._loop.time()
+        send_at = max(now, self._next_send)
+        self._next_send = send_at + self._send_interval
+        if send_at > now:
+            await asyncio.sleep(send_at - now)
+
+    async def _async_probe(
+        self, family: int, address: str, timeout: float
+    ) -> float | None:
+        """Send an echo request and return the round trip time in milliseconds."""
+        await self._async_throttle()
+        if (echo_socket := self._get_socket(family)) is None:
+            return None
+
+        sent = self._loop.time()
+        try:
+            sequence, future = echo_socket.send(address)
+        except OSError as err:
+            _LOGGER.debug("Cannot send ICMP echo request to %s: %s", address, err)
+            return None
+
+        try:
+            received = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            echo_socket.discard(sequence)
+        return (received - sent) * 1000
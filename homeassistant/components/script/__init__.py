@@ -9,6 +9,7 @@ import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
 from homeassistant.components.blueprint import BlueprintInputs
+from homeassistant.components.trace.const import CONF_STORED_TRACES
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -52,6 +53,7 @@ from .const import (
     CONF_TRACE,
     DOMAIN,
     ENTITY_ID_FORMAT,
+    EVENT_SCRIPT_RELOADED,
     EVENT_SCRIPT_STARTED,
     LOGGER,
 )
@@ -171,16 +173,18 @@ async def async_setup(hass, config):
     # To register scripts as valid domain for Blueprint
     async_get_blueprints(hass)
 
-    if not await _async_process_config(hass, config, component):
+    blueprints_used, _ = await _async_process_config(hass, config, component)
+    if not blueprints_used:
         await async_get_blueprints(hass).async_populate()
 
     async def reload_service(service):
         """Call a service to reload scripts."""
-        conf = await component.async_prepare_reload()
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
 
-        await _async_process_config(hass, conf, component)
+        _, changes = await _async_process_config(hass, conf, component)
+        hass.bus.async_fire(EVENT_SCRIPT_RELOADED, changes, context=service.context)
 
     async def turn_on_service(service):
         """Call a service to turn script on."""
@@ -226,13 +230,23 @@ async def async_setup(hass, config):
     return True
 
 
-async def _async_process_config(hass, config, component) -> bool:
+async def _async_process_config(
+    hass, config, component
+) -> tuple[bool, dict[str, list[str]]]:
     """Process script configuration.
 
-    Return true, if Blueprints were used.
+    Scripts that are already set up with the same configuration are kept,
+    the others are removed and created again.
+
+    Return if Blueprints were used and the entity ids of the created, removed
+    and unchanged scripts.
     """
     entities = []
     blueprints_used = False
+    unchanged: list[str] = []
+    stale: dict[str, ScriptEntity] = {
+        entity.object_id: entity for entity in component.entities
+    }
 
     for config_key in extract_domain_configs(config, DOMAIN):
         conf: dict[str, dict[str, Any] | BlueprintInputs] = config[config_key]
@@ -263,14 +277,44 @@ async def _async_process_config(hass, config, component) -> bool:
             else:
                 raw_config = cast(ScriptConfig, config_block).raw_config
 
+            existing = stale.get(object_id)
+            if existing is not None and existing.config_matches(
+                raw_config, raw_blueprint_inputs
+            ):
+                stale.pop(object_id)
+                unchanged.append(existing.entity_id)
+                continue
+
             entities.append(
                 ScriptEntity(
                     hass, object_id, config_block, raw_config, raw_blueprint_inputs
                 )
             )
 
+    if stale:
+        await asyncio.gather(
+            *(
+                component.async_remove_entity(entity.entity_id)
+                for entity in stale.values()
+            )
+        )
+
     await component.async_add_entities(entities)
 
+    changes = {
+        "created": [
+            entity.entity_id for entity in entities if entity.entity_id is not None
+        ],
+        "removed": [entity.entity_id for entity in stale.values()],
+        "unchanged": unchanged,
+    }
+    LOGGER.debug(
+        "Processed scripts: created %s, removed %s, unchanged %s",
+        changes["created"],
+        changes["removed"],
+        changes["unchanged"],
+    )
+
     async def service_handler(service):
         """Execute a service call to script.<script name>."""
         entity_id = ENTITY_ID_FORMAT.format(service.service)
@@ -293,7 +337,7 @@ async def _async_process_config(hass, config, component) -> bool:
         }
         async_set_service_schema(hass, DOMAIN, entity.object_id, service_desc)
 
-    return blueprints_used
+    return blueprints_used, changes
 
 
 class ScriptEntity(ToggleEntity):
@@ -321,6 +365,7 @@ class ScriptEntity(ToggleEntity):
             max_exceeded=cfg[CONF_MAX_EXCEEDED],
             logger=logging.getLogger(f"{__name__}.{object_id}"),
             variables=cfg.get(CONF_VARIABLES),
+            trace=cfg[CONF_TRACE][CONF_STORED_TRACES] > 0,
         )
         self._changed = asyncio.Event()
         self._raw_config = raw_config
@@ -351,6 +396,15 @@ class ScriptEntity(ToggleEntity):
             attrs[ATTR_LAST_ACTION] = self.script.last_action
         return attrs
 
+    @callback
+    def config_matches(self, raw_config, blueprint_inputs) -> bool:
+        """Return if the script was created from this configuration."""
+        return (
+            raw_config is not None
+            and raw_config == self._raw_config
+            and blueprint_inputs == self._blueprint_inputs
+        )
+
     @property
     def is_on(self):
         """Return true if script is on."""
@@ -15,6 +15,7 @@ CONF_TRACE = "trace"
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
+EVENT_SCRIPT_RELOADED = "script_reloaded"
 EVENT_SCRIPT_STARTED = "script_started"
 
 LOGGER = logging.getLogger(__package__)
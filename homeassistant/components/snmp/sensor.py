@@ -2,17 +2,6 @@
 from datetime import timedelta
 import logging
 
-import pysnmp.hlapi.asyncio as hlapi
-from pysnmp.hlapi.asyncio import (
-    CommunityData,
-    ContextData,
-    ObjectIdentity,
-    ObjectType,
-    SnmpEngine,
-    UdpTransportTarget,
-    UsmUserData,
-    getCmd,
-)
 import voluptuous as vol
 
 from homeassistant.components.sensor import PLATFORM_SCHEMA, SensorEntity
@@ -20,6 +9,7 @@ from homeassistant.const import (
     CONF_HOST,
     CONF_NAME,
     CONF_PORT,
+    CONF_SCAN_INTERVAL,
     CONF_UNIT_OF_MEASUREMENT,
     CONF_USERNAME,
     CONF_VALUE_TEMPLATE,
@@ -48,6 +38,7 @@ from .const import (
     MAP_PRIV_PROTOCOLS,
     SNMP_VERSIONS,
 )
+from .session import async_get_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -81,60 +72,24 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the SNMP sensor."""
     name = config.get(CONF_NAME)
-    host = config.get(CONF_HOST)
-    port = config.get(CONF_PORT)
-    community = config.get(CONF_COMMUNITY)
     baseoid = config.get(CONF_BASEOID)
     unit = config.get(CONF_UNIT_OF_MEASUREMENT)
-    version = config.get(CONF_VERSION)
-    username = config.get(CONF_USERNAME)
-    authkey = config.get(CONF_AUTH_KEY)
-    authproto = config.get(CONF_AUTH_PROTOCOL)
-    privkey = config.get(CONF_PRIV_KEY)
-    privproto = config.get(CONF_PRIV_PROTOCOL)
     accept_errors = config.get(CONF_ACCEPT_ERRORS)
     default_value = config.get(CONF_DEFAULT_VALUE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
+    scan_interval = config.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL)
 
     if value_template is not None:
         value_template.hass = hass
 
-    if version == "3":
-
-        if not authkey:
-            authproto = "none"
-        if not privkey:
-            privproto = "none"
-
-        request_args = [
-            SnmpEngine(),
-            UsmUserData(
-                username,
-                authKey=authkey or None,
-                privKey=privkey or None,
-                authProtocol=getattr(hlapi, MAP_AUTH_PROTOCOLS[authproto]),
-                privProtocol=getattr(hlapi, MAP_PRIV_PROTOCOLS[privproto]),
-            ),
-            UdpTransportTarget((host, port)),
-            ContextData(),
-        ]
-    else:
-        request_args = [
-            SnmpEngine(),
-            CommunityData(community, mpModel=SNMP_VERSIONS[version]),
-            UdpTransportTarget((host, port)),
-            ContextData(),
-        ]
-
-    errindication, _, _, _ = await getCmd(
-        *request_args, ObjectType(ObjectIdentity(baseoid))
-    )
+    session = async_get_session(hass, config)
+    errindication, _, _, _ = await session.async_get(baseoid, scan_interval)
 
     if errindication and not accept_errors:
         _LOGGER.error("Please check the details in the configuration file")
         return
 
-    data = SnmpData(request_args, baseoid, accept_errors, default_value)
+    data = SnmpData(session, baseoid, scan_interval, accept_errors, default_value)
     async_add_entities([SnmpSensor(data, name, unit, value_template)], True)
 
 
@@ -182,10 +137,11 @@ class SnmpSensor(SensorEntity):
 class SnmpData:
     """Get the latest data and update the states."""
 
-    def __init__(self, request_args, baseoid, accept_errors, default_value):
+    def __init__(self, session, baseoid, scan_interval, accept_errors, default_value):
         """Initialize the data object."""
-        self._request_args = request_args
+        self._session = session
         self._baseoid = baseoid
+        self._scan_interval = scan_interval
         self._accept_errors = accept_errors
         self._default_value = default_value
         self.value = None
@@ -193,8 +149,8 @@ class SnmpData:
     async def async_update(self):
         """Get the latest data from the remote SNMP capable host."""
 
-        errindication, errstatus, errindex, restable = await getCmd(
-            *self._request_args, ObjectType(ObjectIdentity(self._baseoid))
+        errindication, errstatus, errindex, restable = await self._session.async_get(
+            self._baseoid, self._scan_interval
         )
 
         if errindication and not self._accept_errors:
@@ -0,0 +1,221 @@
+"""Share the sessions with SNMP agents between entities.
+
+All entities polling the same agent with the same credentials share one
+session. A value is cached until it is half the shortest scan interval of
+the entities polling the OID old. When an entity needs a value that is not
+cached, the session reads all OIDs polled on the agent whose values are not
+cached with multi-OID GET requests, so the other entities find their values
+in the cache.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+from typing import Any
+
+from pysnmp.error import PySnmpError
+import pysnmp.hlapi.asyncio as hlapi
+from pysnmp.hlapi.asyncio import (
+    CommunityData,
+    ContextData,
+    ObjectIdentity,
+    ObjectType,
+    SnmpEngine,
+    UdpTransportTarget,
+    UsmUserData,
+    getCmd,
+    setCmd,
+)
+
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_USERNAME
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CONF_AUTH_KEY,
+    CONF_AUTH_PROTOCOL,
+    CONF_COMMUNITY,
+    CONF_PRIV_KEY,
+    CONF_PRIV_PROTOCOL,
+    CONF_VERSION,
+    MAP_AUTH_PROTOCOLS,
+    MAP_PRIV_PROTOCOLS,
+    SNMP_VERSIONS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SNMP_SESSIONS = "snmp_sessions"
+
+# Part of the scan interval of an OID its value is cached for
+CACHE_AGE_FACTOR = 0.5
+
+# Most OIDs read with one GET request
+MAX_OIDS_PER_REQUEST = 16
+
+
+@callback
+def async_get_session(hass: HomeAssistant, config: dict[str, Any]) -> SnmpSession:
+    """Return the session with the agent of an entity."""
+    version = config[CONF_VERSION]
+    if version == "3":
+        authkey = config.get(CONF_AUTH_KEY)
+        privkey = config.get(CONF_PRIV_KEY)
+        authproto = config[CONF_AUTH_PROTOCOL] if authkey else "none"
+        privproto = config[CONF_PRIV_PROTOCOL] if privkey else "none"
+        credentials: tuple = (
+            config.get(CONF_USERNAME),
+            authkey,
+            authproto,
+            privkey,
+            privproto,
+        )
+    else:
+        credentials = (config[CONF_COMMUNITY],)
+
+    key = (config[CONF_HOST], config[CONF_PORT], version, *credentials)
+    sessions: dict[tuple, SnmpSession] = hass.data.setdefault(DATA_SNMP_SESSIONS, {})
+    if (session := sessions.get(key)) is not None:
+        return session
+
+    if version == "3":
+        username, authkey, authproto, privkey, privproto = credentials
+        auth_data = UsmUserData(
+            username,
+            authKey=authkey or None,
+            privKey=privkey or None,
+            authProtocol=getattr(hlapi, MAP_AUTH_PROTOCOLS[authproto]),
+            privProtocol=getattr(hlapi, MAP_PRIV_PROTOCOLS[privproto]),
+        )
+    else:
+        auth_data = CommunityData(
+            config[CONF_COMMUNITY], mpModel=SNMP_VERSIONS[version]
+        )
+
+    session = sessions[key] = SnmpSession(
+        hass, auth_data, UdpTransportTarget((config[CONF_HOST], config[CONF_PORT]))
+    )
+    return session
+
+
+class SnmpSession:
+    """Session with an SNMP agent shared by the entities polling it."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        auth_data: CommunityData | UsmUserData,
+        target: UdpTransportTarget,
+    ) -> None:
+        """Initialize the session."""
+        self.hass = hass
+        self._request_args = [SnmpEngine(), auth_data, target, ContextData()]
+        # Seconds a value of the OIDs polled on the agent is cached for, in
+        # the order the OIDs were first requested
+        self._oids: dict[str, float] = {}
+        self._cache: dict[str, tuple[float, tuple]] = {}
+        # Counts the sets, values read before a set are not used after it
+        self._generation = 0
+        self._refresh: asyncio.Task | None = None
+
+    async def async_get(self, oid: str, scan_interval: timedelta) -> tuple:
+        """Return the result of a GET request for an OID.
+
+        The result has the same form as the result of getCmd.
+        """
+        max_age = scan_interval.total_seconds() * CACHE_AGE_FACTOR
+        self._oids[oid] = min(self._oids.get(oid, max_age), max_age)
+        while True:
+            if self._is_cached(oid, self.hass.loop.time()):
+                return self._cache[oid][1]
+
+            if self._refresh is None:
+                self._refresh = self.hass.async_create_task(
+                    self._async_refresh(self._generation)
+                )
+            generation, results = await asyncio.shield(self._refresh)
+            # The OID was requested after the refresh started or set while
+            # reading otherwise
+            if generation == self._generation and oid in results:
+                return results[oid]
+
+    async def async_set(self, oid: str, value: Any) -> tuple:
+        """Set the value of an OID.
+
+        The cache is cleared, because setting an OID can change the values
+        of other OIDs.
+        """
+        try:
+            return await setCmd(
+                *self._request_args, ObjectType(ObjectIdentity(oid), value)
+            )
+        finally:
+            self._generation += 1
+            self._cache.clear()
+
+    def _is_cached(self, oid: str, now: float) -> bool:
+        """Return if the cached value of an OID can be used."""
+        cached = self._cache.get(oid)
+        return cached is not None and now - cached[0] < self._oids[oid]
+
+    async def _async_refresh(self, generation: int) -> tuple[int, dict[str, tuple]]:
+        """Read the OIDs polled on the agent whose values are not cached."""
+        read_time = self.hass.loop.time()
+        oids = [oid for oid in self._oids if not self._is_cached(oid, read_time)]
+        results: dict[str, tuple] = {}
+        try:
+            for chunk_results in await asyncio.gather(
+                *(
+                    self._async_get_many(oids[idx : idx + MAX_OIDS_PER_REQUEST])
+                    for idx in range(0, len(oids), MAX_OIDS_PER_REQUEST)
+                )
+            ):
+                results.update(chunk_results)
+        finally:
+            self._refresh = None
+
+        if generation == self._generation:
+            for oid, result in results.items():
+                self._cache[oid] = (read_time, result)
+        return generation, results
+
+    async def _async_get_many(self, oids: list[str]) -> dict[str, tuple]:
+        """Read OIDs with one GET request and split the result per OID."""
+        try:
+            errindication, errstatus, errindex, restable = await getCmd(
+                *self._request_args, *(ObjectType(ObjectIdentity(oid)) for oid in oids)
+            )
+        except PySnmpError as err:
+            if len(oids) == 1:
+                return {oids[0]: (str(err), None, None, [])}
+            return await self._async_get_each(oids)
+
+        if errindication:
+            return {oid: (errindication, errstatus, errindex, []) for oid in oids}
+
+        if errstatus:
+            if len(oids) == 1:
+                return {oids[0]: (errindication, errstatus, errindex, restable)}
+            bad = int(errindex) - 1 if errindex else -1
+            if not 0 <= bad < len(oids):
+                return await self._async_get_each(oids)
+
+            # SNMPv1 agents fail the whole request for an unknown OID
+            varbinds = restable[bad : bad + 1]
+            results = {oids[bad]: (None, errstatus, len(varbinds), varbinds)}
+            results.update(await self._async_get_many(oids[:bad] + oids[bad + 1 :]))
+            return results
+
+        return {
+            oid: (None, errstatus, errindex, [varbind])
+            for oid, varbind in zip(oids, restable)
+        }
+
+    async def _async_get_each(self, oids: list[str]) -> dict[str, tuple]:
+        """Read OIDs with a GET request each."""
+        results: dict[str, tuple] = {}
+        for chunk_results in await asyncio.gather(
+            *(self._async_get_many([oid]) for oid in oids)
+        ):
+            results.update(chunk_results)
+        return results
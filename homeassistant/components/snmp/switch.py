@@ -1,18 +1,6 @@
 """Support for SNMP enabled switch."""
 import logging
 
-import pysnmp.hlapi.asyncio as hlapi
-from pysnmp.hlapi.asyncio import (
-    CommunityData,
-    ContextData,
-    ObjectIdentity,
-    ObjectType,
-    SnmpEngine,
-    UdpTransportTarget,
-    UsmUserData,
-    getCmd,
-    setCmd,
-)
 from pysnmp.proto.rfc1902 import (
     Counter32,
     Counter64,
@@ -29,13 +17,14 @@ from pysnmp.proto.rfc1902 import (
 )
 import voluptuous as vol
 
-from homeassistant.components.switch import PLATFORM_SCHEMA, SwitchEntity
+from homeassistant.components.switch import PLATFORM_SCHEMA, SCAN_INTERVAL, SwitchEntity
 from homeassistant.const import (
     CONF_HOST,
     CONF_NAME,
     CONF_PAYLOAD_OFF,
     CONF_PAYLOAD_ON,
     CONF_PORT,
+    CONF_SCAN_INTERVAL,
     CONF_USERNAME,
 )
 import homeassistant.helpers.config_validation as cv
@@ -60,6 +49,7 @@ from .const import (
     MAP_PRIV_PROTOCOLS,
     SNMP_VERSIONS,
 )
+from .session import async_get_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -117,38 +107,23 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the SNMP switch."""
     name = config.get(CONF_NAME)
-    host = config.get(CONF_HOST)
-    port = config.get(CONF_PORT)
-    community = config.get(CONF_COMMUNITY)
     baseoid = config.get(CONF_BASEOID)
     command_oid = config.get(CONF_COMMAND_OID)
     command_payload_on = config.get(CONF_COMMAND_PAYLOAD_ON)
     command_payload_off = config.get(CONF_COMMAND_PAYLOAD_OFF)
-    version = config.get(CONF_VERSION)
-    username = config.get(CONF_USERNAME)
-    authkey = config.get(CONF_AUTH_KEY)
-    authproto = config.get(CONF_AUTH_PROTOCOL)
-    privkey = config.get(CONF_PRIV_KEY)
-    privproto = config.get(CONF_PRIV_PROTOCOL)
     payload_on = config.get(CONF_PAYLOAD_ON)
     payload_off = config.get(CONF_PAYLOAD_OFF)
     vartype = config.get(CONF_VARTYPE)
+    scan_interval = config.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL)
 
     async_add_entities(
         [
             SnmpSwitch(
                 name,
-                host,
-                port,
-                community,
+                async_get_session(hass, config),
                 baseoid,
+                scan_interval,
                 command_oid,
-                version,
-                username,
-                authkey,
-                authproto,
-                privkey,
-                privproto,
                 payload_on,
                 payload_off,
                 command_payload_on,
@@ -166,17 +141,10 @@ class SnmpSwitch(SwitchEntity):
     def __init__(
         self,
         name,
-        host,
-        port,
-        community,
+        session,
         baseoid,
+        scan_interval,
         commandoid,
-        version,
-        username,
-        authkey,
-        authproto,
-        privkey,
-        privproto,
         payload_on,
         payload_off,
         command_payload_on,
@@ -186,7 +154,9 @@ class SnmpSwitch(SwitchEntity):
         """Initialize the switch."""
 
         self._name = name
+        self._session = session
         self._baseoid = baseoid
+        self._scan_interval = scan_interval
         self._vartype = vartype
 
         # Set the command OID to the base OID if command OID is unset
@@ -198,33 +168,6 @@ class SnmpSwitch(SwitchEntity):
         self._payload_on = payload_on
         self._payload_off = payload_off
 
-        if version == "3":
-
-            if not authkey:
-                authproto = "none"
-            if not privkey:
-                privproto = "none"
-
-            self._request_args = [
-                SnmpEngine(),
-                UsmUserData(
-                    username,
-                    authKey=authkey or None,
-                    privKey=privkey or None,
-                    authProtocol=getattr(hlapi, MAP_AUTH_PROTOCOLS[authproto]),
-                    privProtocol=getattr(hlapi, MAP_PRIV_PROTOCOLS[privproto]),
-                ),
-                UdpTransportTarget((host, port)),
-                ContextData(),
-            ]
-        else:
-            self._request_args = [
-                SnmpEngine(),
-                CommunityData(community, mpModel=SNMP_VERSIONS[version]),
-                UdpTransportTarget((host, port)),
-                ContextData(),
-            ]
-
     async def async_turn_on(self, **kwargs):
         """Turn on the switch."""
         # If vartype set, use it - http://snmplabs.com/pysnmp/docs/api-reference.html#pysnmp.smi.rfc1902.ObjectType
@@ -248,8 +191,8 @@ class SnmpSwitch(SwitchEntity):
 
     async def async_update(self):
         """Update the state."""
-        errindication, errstatus, errindex, restable = await getCmd(
-            *self._request_args, ObjectType(ObjectIdentity(self._baseoid))
+        errindication, errstatus, errindex, restable = await self._session.async_get(
+            self._baseoid, self._scan_interval
         )
 
         if errindication:
@@ -284,6 +227,4 @@ class SnmpSwitch(SwitchEntity):
         return self._state
 
     async def _set(self, value):
-        await setCmd(
-            *self._request_args, ObjectType(ObjectIdentity(self._commandoid), value)
-        )
+        await self._session.async_set(self._commandoid, value)
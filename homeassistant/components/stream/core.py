@@ -4,6 +4,8 @@ from __future__ import annotations
 import asyncio
 from collections import deque
 import datetime
+from fractions import Fraction
+import logging
 from typing import TYPE_CHECKING
 
 from aiohttp import web
@@ -19,6 +21,8 @@ from .const import ATTR_STREAMS, DOMAIN, TARGET_SEGMENT_DURATION
 if TYPE_CHECKING:
     from . import Stream
 
+_LOGGER = logging.getLogger(__name__)
+
 PROVIDERS = Registry()
 
 
@@ -185,6 +189,76 @@ class StreamOutput:
         self._segments = deque(maxlen=self._segments.maxlen)
 
 
+class KeyFrameConverter:
+    """Convert the latest keyframe of a stream to a JPEG image.
+
+    The worker thread only hands over a copy of each video keyframe. The
+    keyframe is decoded and encoded as JPEG in the executor the first time an
+    image is requested, and the image is reused until the next keyframe.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the KeyFrameConverter."""
+        self._hass = hass
+        self._lock = asyncio.Lock()
+        self._codec_name: str | None = None
+        self._extradata: bytes | None = None
+        self._keyframe: bytes | None = None
+        self._image: bytes | None = None
+
+    def set_codec(self, codec_name: str, extradata: bytes | None) -> None:
+        """Set the codec of the video stream, called from the worker thread."""
+        self._codec_name = codec_name
+        self._extradata = extradata
+        self._keyframe = None
+        self._image = None
+
+    def put(self, keyframe: bytes) -> None:
+        """Store the latest keyframe, called from the worker thread."""
+        self._keyframe = keyframe
+
+    def _generate_image(self) -> None:
+        """Decode the latest keyframe and encode it as JPEG."""
+        # Keep import here so that we can import stream integration without installing reqs
+        # pylint: disable=import-outside-toplevel
+        import av
+
+        keyframe = self._keyframe
+        self._keyframe = None
+        if keyframe is None or self._codec_name is None:
+            return
+
+        try:
+            decoder = av.CodecContext.create(self._codec_name, "r")
+            decoder.extradata = self._extradata
+            frames = decoder.decode(av.Packet(keyframe))
+            if not frames:
+                frames = decoder.decode(None)
+            if not frames:
+                return
+            frame = frames[0]
+
+            encoder = av.CodecContext.create("mjpeg", "w")
+            encoder.width = frame.width
+            encoder.height = frame.height
+            encoder.pix_fmt = "yuvj420p"
+            encoder.time_base = Fraction(1, 1)
+            packets = encoder.encode(frame.reformat(format="yuvj420p"))
+            packets += encoder.encode(None)
+        except av.AVError as err:
+            _LOGGER.debug("Unable to convert keyframe to image: %s", err)
+            return
+
+        self._image = b"".join(bytes(packet) for packet in packets)
+
+    async def async_get_image(self) -> bytes | None:
+        """Return a JPEG image of the latest keyframe."""
+        async with self._lock:
+            if self._keyframe is not None:
+                await self._hass.async_add_executor_job(self._generate_image)
+        return self._image
+
+
 class StreamView(HomeAssistantView):
     """
     Base StreamView.
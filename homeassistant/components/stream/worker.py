@@ -22,7 +22,7 @@ from .const import (
     SOURCE_TIMEOUT,
     TARGET_PART_DURATION,
 )
-from .core import Part, Segment, StreamOutput
+from .core import KeyFrameConverter, Part, Segment, StreamOutput
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,13 +31,16 @@ class SegmentBuffer:
     """Buffer for writing a sequence of packets to the output as a segment."""
 
     def __init__(
-        self, outputs_callback: Callable[[], Mapping[str, StreamOutput]]
+        self,
+        outputs_callback: Callable[[], Mapping[str, StreamOutput]],
+        keyframe_converter: KeyFrameConverter | None = None,
     ) -> None:
         """Initialize SegmentBuffer."""
         self._stream_id: int = 0
         self._outputs_callback: Callable[
             [], Mapping[str, StreamOutput]
         ] = outputs_callback
+        self._keyframe_converter = keyframe_converter
         # sequence gets incremented before the first segment so the first segment
         # has a sequence number of 0.
         self._sequence = -1
@@ -89,6 +92,10 @@ class SegmentBuffer:
         """Initialize output buffer with streams from container."""
         self._input_video_stream = video_stream
         self._input_audio_stream = audio_stream
+        if self._keyframe_converter is not None:
+            self._keyframe_converter.set_codec(
+                video_stream.codec_context.name, video_stream.codec_context.extradata
+            )
 
     def reset(self, video_dts: int) -> None:
         """Initialize a new stream segment."""
@@ -129,6 +136,10 @@ class SegmentBuffer:
                 # Reinitialize
                 self.reset(packet.dts)
 
+            # Copy keyframes before muxing takes ownership of the packet data
+            if packet.is_keyframe and self._keyframe_converter is not None:
+                self._keyframe_converter.put(bytes(packet))
+
             # Mux the packet
             packet.stream = self._output_video_stream
             self._av_output.mux(packet)
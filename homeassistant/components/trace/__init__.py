@@ -9,6 +9,10 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant.core import Context
+from homeassistant.helpers.condition_cache import (
+    ConditionCacheStats,
+    condition_cache_stats_cv,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.trace import (
     TraceElement,
@@ -73,6 +77,8 @@ class ActionTrace:
         self._timestamp_finish: dt.datetime | None = None
         self._timestamp_start: dt.datetime = dt_util.utcnow()
         self.key: tuple[str, str] = key
+        self._condition_cache = ConditionCacheStats()
+        condition_cache_stats_cv.set(self._condition_cache)
         if trace_id_get():
             trace_set_child_id(self.key, self.run_id)
         trace_id_set((key, self.run_id))
@@ -107,6 +113,7 @@ class ActionTrace:
                 "config": self._config,
                 "blueprint_inputs": self._blueprint_inputs,
                 "context": self.context,
+                "condition_cache": self._condition_cache.as_dict(),
             }
         )
         if self._error is not None:
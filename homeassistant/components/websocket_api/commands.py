@@ -11,8 +11,13 @@ import voluptuous as vol
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
 from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
-from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
-from homeassistant.core import Context, Event, HomeAssistant, callback
+from homeassistant.const import (
+    CONF_ENTITY_ID,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
+    MATCH_ALL,
+)
+from homeassistant.core import CALLBACK_TYPE, Context, Event, HomeAssistant, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -27,9 +32,14 @@ from homeassistant.helpers.event import (
     async_track_template_result,
 )
 from homeassistant.helpers.json import ExtendedJSONEncoder
+from homeassistant.helpers.polling import async_watch_entities
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import IntegrationNotFound, async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    async_get_loaded_integrations,
+    async_get_setup_timeline,
+)
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
@@ -49,6 +59,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_setup_timeline)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -305,6 +316,24 @@ async def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/setup_timeline"})
+def handle_integration_setup_timeline(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration setup timeline command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "domain": integration,
+                "phases": [setup_phase.as_dict() for setup_phase in phases],
+            }
+            for integration, phases in async_get_setup_timeline(hass).items()
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -334,6 +363,9 @@ async def handle_render_template(
     variables = msg.get("variables")
     timeout = msg.get("timeout")
     info = None
+    # Entities in the template are polled at the shortest intervals
+    watched: set[str] = set()
+    release_watch: CALLBACK_TYPE | None = None
 
     if timeout:
         try:
@@ -352,9 +384,23 @@ async def handle_render_template(
             )
             return
 
+    @callback
+    def _async_watch(entity_ids: set[str]) -> None:
+        """Watch the entities the template depends on."""
+        nonlocal watched, release_watch
+        if entity_ids == watched:
+            return
+        release_previous = release_watch
+        watched, release_watch = entity_ids, async_watch_entities(hass, entity_ids)
+        if release_previous is not None:
+            release_previous()
+
     @callback
     def _template_listener(event: Event, updates: list[TrackTemplateResult]) -> None:
         nonlocal info
+        _async_watch(
+            set(msg.get("entity_ids", ())) | info.listeners["entities"]  # type: ignore[attr-defined]
+        )
         track_template_result = updates.pop()
         result = track_template_result.result
         if isinstance(result, TemplateError):
@@ -379,7 +425,14 @@ async def handle_render_template(
         connection.send_error(msg["id"], const.ERR_TEMPLATE_ERROR, str(ex))
         return
 
-    connection.subscriptions[msg["id"]] = info.async_remove
+    @callback
+    def _async_unsubscribe() -> None:
+        """Stop tracking the template."""
+        info.async_remove()  # type: ignore[union-attr]
+        if release_watch is not None:
+            release_watch()
+
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
 
     connection.send_result(msg["id"])
 
@@ -462,24 +515,41 @@ async def handle_subscribe_trigger(
             json.dumps(message, cls=ExtendedJSONEncoder, allow_nan=False)
         )
 
-    connection.subscriptions[msg["id"]] = (
-        await trigger.async_initialize_triggers(
-            hass,
-            trigger_config,
-            forward_triggers,
-            const.DOMAIN,
-            const.DOMAIN,
-            connection.logger.log,
-            variables=msg.get("variables"),
-        )
-    ) or (
-        # Some triggers won't return an unsub function. Since the caller expects
-        # a subscription, we're going to fake one.
-        lambda: None
+    unsub_triggers = await trigger.async_initialize_triggers(
+        hass,
+        trigger_config,
+        forward_triggers,
+        const.DOMAIN,
+        const.DOMAIN,
+        connection.logger.log,
+        variables=msg.get("variables"),
     )
+    # Entities of the triggers are polled at the shortest intervals
+    release_watch = async_watch_entities(hass, _trigger_entity_ids(trigger_config))
+
+    @callback
+    def _async_unsubscribe() -> None:
+        """Stop forwarding triggers."""
+        # Some triggers won't return an unsub function.
+        if unsub_triggers is not None:
+            unsub_triggers()
+        release_watch()
+
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
     connection.send_result(msg["id"])
 
 
+def _trigger_entity_ids(trigger_config: list[dict[str, Any]]) -> set[str]:
+    """Return the entity ids of triggers."""
+    entity_ids: set[str] = set()
+    for config in trigger_config:
+        if isinstance(value := config.get(CONF_ENTITY_ID), str):
+            entity_ids.add(value)
+        elif isinstance(value, list):
+            entity_ids.update(value)
+    return entity_ids
+
+
 @decorators.websocket_command(
     {
         vol.Required("type"): "test_condition",
@@ -63,7 +63,7 @@ from homeassistant.requirements import (
 )
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
-from homeassistant.util.yaml import SECRET_YAML, Secrets, load_yaml
+from homeassistant.util.yaml import SECRET_YAML, ParsedYamlCache, Secrets, load_yaml
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -74,6 +74,7 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
+DATA_YAML_CACHE = "yaml_parsed_cache"
 
 GROUP_CONFIG_PATH = "groups.yaml"
 AUTOMATION_CONFIG_PATH = "automations.yaml"
@@ -330,7 +331,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     if hass.config.config_dir is None:
         secrets = None
     else:
-        secrets = Secrets(Path(hass.config.config_dir))
+        secrets = Secrets(Path(hass.config.config_dir), async_get_yaml_cache(hass))
 
     # Not using async_add_executor_job because this is an internal method.
     config = await hass.loop.run_in_executor(
@@ -344,6 +345,18 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     return config
 
 
+@callback
+def async_get_yaml_cache(hass: HomeAssistant) -> ParsedYamlCache | None:
+    """Return the cache of parsed YAML files.
+
+    Storing None in hass.data disables the cache.
+    """
+    if DATA_YAML_CACHE not in hass.data:
+        hass.data[DATA_YAML_CACHE] = ParsedYamlCache()
+    cache: ParsedYamlCache | None = hass.data[DATA_YAML_CACHE]
+    return cache
+
+
 def load_yaml_config_file(
     config_path: str, secrets: Secrets | None = None
 ) -> dict[Any, Any]:
@@ -84,6 +84,7 @@ CONF_CUSTOMIZE: Final = "customize"
 CONF_CUSTOMIZE_DOMAIN: Final = "customize_domain"
 CONF_CUSTOMIZE_GLOB: Final = "customize_glob"
 CONF_DEFAULT: Final = "default"
+CONF_DEFER_SETUP: Final = "defer_setup"
 CONF_DELAY: Final = "delay"
 CONF_DELAY_TIME: Final = "delay_time"
 CONF_DESCRIPTION: Final = "description"
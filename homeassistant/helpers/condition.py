@@ -58,6 +58,7 @@ from homeassistant.helpers.typing import ConfigType, TemplateVarsType
 from homeassistant.util.async_ import run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
+from .condition_cache import condition_cache_cv
 from .trace import (
     TraceElement,
     trace_append_element,
@@ -349,7 +350,10 @@ def async_numeric_state(  # noqa: C901
         variables = dict(variables or {})
         variables["state"] = entity
         try:
-            value = value_template.async_render(variables)
+            if (cache := condition_cache_cv.get()) is None:
+                value = value_template.async_render(variables)
+            else:
+                value = cache.async_render_to_info(value_template, variables).result()
         except TemplateError as ex:
             raise ConditionErrorMessage(
                 "numeric_state", f"template error: {ex}"
@@ -688,7 +692,12 @@ def async_template(
 ) -> bool:
     """Test if template condition matches."""
     try:
-        info = value_template.async_render_to_info(variables, parse_result=False)
+        if (cache := condition_cache_cv.get()) is None:
+            info = value_template.async_render_to_info(variables, parse_result=False)
+        else:
+            info = cache.async_render_to_info(
+                value_template, variables, parse_result=False
+            )
         value = info.result()
     except TemplateError as ex:
         raise ConditionErrorMessage("template", str(ex)) from ex
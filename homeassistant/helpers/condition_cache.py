@@ -0,0 +1,174 @@
+"""Memoize condition templates while a state change is dispatched."""
+from __future__ import annotations
+
+from collections.abc import Hashable, Mapping
+from contextvars import ContextVar
+import functools as ft
+from typing import Any
+
+import jinja2
+from jinja2 import meta
+
+from homeassistant.core import State
+from homeassistant.helpers.template import RenderInfo, Template
+
+MAX_TEMPLATE_VARIABLES_CACHE = 1024
+
+_PARSE_ENV = jinja2.Environment()
+
+
+class ConditionCacheStats:
+    """Count how often condition evaluations were served from the cache."""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return dictionary version of the stats."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class _Identity:
+    """Hashable wrapper comparing objects by identity."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        """Initialize the wrapper."""
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        """Hash the wrapped object by identity."""
+        return id(self.obj)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare the wrapped objects by identity."""
+        return isinstance(other, _Identity) and other.obj is self.obj
+
+
+@ft.lru_cache(maxsize=MAX_TEMPLATE_VARIABLES_CACHE)
+def _template_variables(template: str) -> frozenset[str] | None:
+    """Return the names a template reads that may come from its variables.
+
+    Returns None if the template can not be memoized.
+    """
+    # Filters like random give different results for the same input
+    if "random" in template:
+        return None
+    try:
+        return frozenset(meta.find_undeclared_variables(_PARSE_ENV.parse(template)))
+    except jinja2.TemplateError:
+        return None
+
+
+def _variables_key(
+    names: frozenset[str], variables: Mapping[str, Any] | None
+) -> Hashable | None:
+    """Return a key for the variables a template reads.
+
+    Returns None if one of the values can not be hashed.
+    """
+    if not variables:
+        return ()
+
+    items = []
+    for name in sorted(names & variables.keys()):
+        value = variables[name]
+        # States are immutable but not hashable
+        if isinstance(value, State):
+            value = _Identity(value)
+        items.append((name, value))
+
+    key = tuple(items)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class ConditionCache:
+    """Template renders made while dispatching a state change.
+
+    Renders are keyed by template and by the variables the template reads.
+    A render is reused as long as the states it read are the same objects
+    in the state machine. Renders that depend on the time, on all states or
+    on whole domains are not memoized.
+    """
+
+    __slots__ = ("_renders", "stats")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._renders: dict[
+            tuple[Template, Hashable, bool],
+            tuple[RenderInfo, tuple[tuple[str, State | None], ...]],
+        ] = {}
+        self.stats = ConditionCacheStats()
+
+    def async_render_to_info(
+        self,
+        template: Template,
+        variables: Mapping[str, Any] | None,
+        parse_result: bool = True,
+    ) -> RenderInfo:
+        """Render a template or return the result of an identical render."""
+        key: tuple[Template, Hashable, bool] | None = None
+        if (names := _template_variables(template.template)) is not None and (
+            variables_key := _variables_key(names, variables)
+        ) is not None:
+            key = (template, variables_key, parse_result)
+
+        assert template.hass is not None
+        states = template.hass.states
+
+        if key is not None and (entry := self._renders.get(key)) is not None:
+            info, read_states = entry
+            if all(states.get(entity_id) is state for entity_id, state in read_states):
+                self._async_count(hit=True)
+                return info
+
+        self._async_count(hit=False)
+        info = template.async_render_to_info(variables, parse_result=parse_result)
+
+        if (
+            key is not None
+            and info.exception is None
+            and not info.has_time
+            and not info.all_states
+            and not info.all_states_lifecycle
+            and not info.domains
+            and not info.domains_lifecycle
+        ):
+            self._renders[key] = (
+                info,
+                tuple(
+                    (entity_id, states.get(entity_id)) for entity_id in info.entities
+                ),
+            )
+
+        return info
+
+    def _async_count(self, hit: bool) -> None:
+        """Count a lookup in the cache and in the stats of the current run."""
+        for stats in (self.stats, condition_cache_stats_cv.get()):
+            if stats is None:
+                continue
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+
+
+# The cache of the state change being dispatched
+condition_cache_cv: ContextVar[ConditionCache | None] = ContextVar(
+    "condition_cache_cv", default=None
+)
+# Cache stats of the automation or script being traced
+condition_cache_stats_cv: ContextVar[ConditionCacheStats | None] = ContextVar(
+    "condition_cache_stats_cv", default=None
+)
@@ -36,6 +36,7 @@ from homeassistant.const import (
     CONF_CONTINUE_ON_TIMEOUT,
     CONF_COUNT,
     CONF_DEFAULT,
+    CONF_DEFER_SETUP,
     CONF_DELAY,
     CONF_DEVICE_ID,
     CONF_DOMAIN,
@@ -840,6 +841,7 @@ PLATFORM_SCHEMA = vol.Schema(
         vol.Required(CONF_PLATFORM): string,
         vol.Optional(CONF_ENTITY_NAMESPACE): string,
         vol.Optional(CONF_SCAN_INTERVAL): time_period,
+        vol.Optional(CONF_DEFER_SETUP): boolean,
     }
 )
 
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Awaitable, Iterable
 from datetime import timedelta
-from itertools import chain
+import heapq
+from itertools import chain, count
 import logging
 from types import ModuleType
 from typing import Any, Callable
@@ -14,17 +15,20 @@ import voluptuous as vol
 from homeassistant import config as conf_util
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    CONF_DEFER_SETUP,
     CONF_ENTITY_NAMESPACE,
     CONF_SCAN_INTERVAL,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
 )
-from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.core import CoreState, Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import (
     config_per_platform,
     config_validation as cv,
     discovery,
     entity,
+    entity_registry,
     service,
 )
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
@@ -35,6 +39,12 @@ from .entity_platform import EntityPlatform
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=15)
 DATA_INSTANCES = "entity_components"
+DATA_DEFERRED_SETUP = "entity_component_deferred_setup"
+
+DEFERRED_PRIORITY_DEFAULT = 0
+DEFERRED_PRIORITY_DISABLED = 1
+
+_DEFERRED_ORDER = count()
 
 
 @bind_hass
@@ -60,6 +70,39 @@ async def async_update_entity(hass: HomeAssistant, entity_id: str) -> None:
     await entity_obj.async_update_ha_state(True)
 
 
+@callback
+def _async_defer_setup(
+    hass: HomeAssistant, priority: int, target: Callable[[], Awaitable[None]]
+) -> None:
+    """Run a platform setup in the background once Home Assistant has started.
+
+    Deferred setups run one at a time, lowest priority value first.
+    """
+    queue: list[tuple[int, int, Callable[[], Awaitable[None]]]] | None = hass.data.get(
+        DATA_DEFERRED_SETUP
+    )
+
+    if queue is None:
+        queue = hass.data[DATA_DEFERRED_SETUP] = []
+
+        async def run_deferred_setup(_: Event) -> None:
+            """Set up the deferred platforms."""
+            assert queue is not None
+            while queue:
+                _, _, setup = heapq.heappop(queue)
+                try:
+                    await setup()
+                except Exception:  # pylint: disable=broad-except
+                    logging.getLogger(__name__).exception(
+                        "Error during deferred platform setup"
+                    )
+            hass.data.pop(DATA_DEFERRED_SETUP)
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, run_deferred_setup)
+
+    heapq.heappush(queue, (priority, next(_DEFERRED_ORDER), target))
+
+
 class EntityComponent:
     """The EntityComponent manages platforms that manages entities.
 
@@ -129,7 +172,10 @@ class EntityComponent:
 
         # Look in config for Domain, Domain 2, Domain 3 etc and load them
         for p_type, p_config in config_per_platform(config, self.domain):
-            self.hass.async_create_task(self.async_setup_platform(p_type, p_config))
+            if p_config.get(CONF_DEFER_SETUP) and self.hass.state != CoreState.running:
+                self._async_defer_platform_setup(p_type, p_config)
+            else:
+                self.hass.async_create_task(self.async_setup_platform(p_type, p_config))
 
         # Generic discovery listener for loading platform dynamically
         # Refer to: homeassistant.helpers.discovery.async_load_platform()
@@ -143,6 +189,35 @@ class EntityComponent:
             self.hass, self.domain, component_platform_discovered
         )
 
+    @callback
+    def _async_defer_platform_setup(
+        self, platform_type: str, platform_config: ConfigType
+    ) -> None:
+        """Import and set up a platform in the background after startup.
+
+        Until then, entities of the platform that are in the entity registry
+        are represented by their unavailable placeholder states. Platforms
+        that only have disabled entities are set up last.
+        """
+        registry = entity_registry.async_get(self.hass)
+        entries = [
+            entry
+            for entry in registry.entities.values()
+            if entry.domain == self.domain
+            and entry.platform == platform_type
+            and entry.config_entry_id is None
+        ]
+        if entries and all(entry.disabled for entry in entries):
+            priority = DEFERRED_PRIORITY_DISABLED
+        else:
+            priority = DEFERRED_PRIORITY_DEFAULT
+
+        _async_defer_setup(
+            self.hass,
+            priority,
+            lambda: self.async_setup_platform(platform_type, platform_config),
+        )
+
     async def async_setup_entry(self, config_entry: ConfigEntry) -> bool:
         """Set up a config entry."""
         platform_type = config_entry.domain
@@ -203,15 +278,24 @@ class EntityComponent:
         schema: dict[str, Any] | vol.Schema,
         func: str | Callable[..., Any],
         required_features: list[int] | None = None,
+        batch_params: Callable[[entity.Entity, ServiceCall], dict | None] | None = None,
     ) -> None:
-        """Register an entity service."""
+        """Register an entity service.
+
+        batch_params returns the parameters of an entity for platforms that
+        registered a batch handler for the service.
+        """
         if isinstance(schema, dict):
             schema = cv.make_entity_service_schema(schema)
 
         async def handle_service(call: Callable) -> None:
             """Handle the service."""
             await self.hass.helpers.service.entity_service_call(
-                self._platforms.values(), func, call, required_features
+                self._platforms.values(),
+                func,
+                call,
+                required_features,
+                batch_params,
             )
 
         self.hass.services.async_register(self.domain, name, handle_service, schema)
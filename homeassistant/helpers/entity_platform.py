@@ -7,8 +7,9 @@ from contextvars import ContextVar
 from datetime import datetime, timedelta
 import logging
 from logging import Logger
+from time import monotonic
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Callable, Protocol
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Protocol, Tuple
 
 import voluptuous as vol
 
@@ -21,6 +22,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     CALLBACK_TYPE,
     CoreState,
+    HassJob,
     HomeAssistant,
     ServiceCall,
     callback,
@@ -44,6 +46,8 @@ from . import (
 from .device_registry import DeviceRegistry
 from .entity_registry import DISABLED_INTEGRATION, EntityRegistry
 from .event import async_call_later, async_track_time_interval
+from .executor import POOL_POLLING, async_get_executor_pools
+from .polling import AdaptiveInterval, PollingStats
 from .typing import ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -55,6 +59,10 @@ SLOW_SETUP_MAX_WAIT = 60
 SLOW_ADD_ENTITY_MAX_WAIT = 15  # Per Entity
 SLOW_ADD_MIN_TIMEOUT = 500
 
+BatchServiceHandler = Callable[
+    [List[Tuple["Entity", Dict[str, Any]]]], Coroutine[Any, Any, None]
+]
+
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
@@ -100,11 +108,23 @@ class EntityPlatform:
         self._setup_complete = False
         # Method to cancel the state change listener
         self._async_unsub_polling: CALLBACK_TYPE | None = None
+        # Method to cancel the next poll if the scan interval is adaptive
+        self._async_cancel_poll: CALLBACK_TYPE | None = None
+        self._poll_job = HassJob(self._async_adaptive_poll)
+        self.polling_stats = PollingStats()
+        self._adaptive_interval: AdaptiveInterval | None = None
+        if getattr(platform, "ADAPTIVE_SCAN_INTERVAL", False) is True:
+            self._adaptive_interval = AdaptiveInterval(
+                hass, self.polling_stats, entity_ids=self.entities.keys
+            )
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # Handlers calling services of the domain for many entities at once
+        self.batch_services: dict[str, BatchServiceHandler] = {}
 
         self.parallel_updates: asyncio.Semaphore | None = None
+        self._async_release_polling_quota: CALLBACK_TYPE | None = None
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -144,6 +164,13 @@ class EntityPlatform:
         if parallel_updates == 0:
             parallel_updates = None
 
+        if not entity_has_async_update:
+            # Updates run in the polling pool, reserve the threads they can use
+            pool = async_get_executor_pools(self.hass).pools[POOL_POLLING]
+            self._async_release_polling_quota = pool.async_reserve(
+                self.platform_name, parallel_updates or pool.default_quota
+            )
+
         if parallel_updates is not None:
             self.parallel_updates = asyncio.Semaphore(parallel_updates)
 
@@ -402,12 +429,54 @@ class EntityPlatform:
         ):
             return
 
+        if self._adaptive_interval is not None:
+            self._async_unsub_polling = self._async_start_adaptive_polling()
+            return
+
         self._async_unsub_polling = async_track_time_interval(
             self.hass,
             self._update_entity_states,
             self.scan_interval,
         )
 
+    @callback
+    def _async_start_adaptive_polling(self) -> CALLBACK_TYPE:
+        """Poll the entities at an adaptive interval."""
+        assert self._adaptive_interval is not None
+        unsub_watch_start = self._adaptive_interval.async_track_watch_start(
+            self._async_schedule_poll
+        )
+        self._async_schedule_poll()
+
+        @callback
+        def stop_polling() -> None:
+            """Stop polling."""
+            unsub_watch_start()
+            if self._async_cancel_poll is not None:
+                self._async_cancel_poll()
+                self._async_cancel_poll = None
+
+        return stop_polling
+
+    @callback
+    def _async_schedule_poll(self) -> None:
+        """Schedule the next poll with an adaptive interval."""
+        assert self._adaptive_interval is not None
+        if self._async_cancel_poll is not None:
+            self._async_cancel_poll()
+        self._async_cancel_poll = async_call_later(
+            self.hass,
+            self._adaptive_interval.async_next_delay(self.scan_interval),
+            self._poll_job,
+        )
+
+    async def _async_adaptive_poll(self, now: datetime) -> None:
+        """Poll the entities and schedule the next poll."""
+        self._async_cancel_poll = None
+        await self._update_entity_states(now)
+        if self._async_unsub_polling is not None:
+            self._async_schedule_poll()
+
     async def _async_add_entity(  # noqa: C901
         self,
         entity: Entity,
@@ -617,6 +686,9 @@ class EntityPlatform:
         """
         await self.async_reset()
         self.hass.data[DATA_ENTITY_PLATFORM][self.platform_name].remove(self)
+        if self._async_release_polling_quota is not None:
+            self._async_release_polling_quota()
+            self._async_release_polling_quota = None
 
     async def async_remove_entity(self, entity_id: str) -> None:
         """Remove entity id from platform."""
@@ -678,6 +750,19 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
+    @callback
+    def async_register_batch_service(
+        self, name: str, handler: BatchServiceHandler
+    ) -> None:
+        """Register a handler calling a service for many entities at once.
+
+        Calls of a service of the entity domain are passed to the handler with
+        all targeted entities of this platform, instead of calling the service
+        for each of them. The handler receives a list of entities with the
+        parameters processed by the domain for each of them.
+        """
+        self.batch_services[name] = handler
+
     async def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
@@ -698,15 +783,27 @@ class EntityPlatform:
             return
 
         async with self._process_updates:
+            start = monotonic()
+            states = {}
             tasks = []
             for entity in self.entities.values():
                 if not entity.should_poll:
                     continue
+                states[entity.entity_id] = self.hass.states.get(entity.entity_id)
                 tasks.append(entity.async_update_ha_state(True))
 
             if tasks:
                 await asyncio.gather(*tasks)
 
+            # States are only replaced when they change
+            changed = any(
+                self.hass.states.get(entity_id) is not state
+                for entity_id, state in states.items()
+            )
+            self.polling_stats.record_poll(monotonic() - start, changed)
+            if self._adaptive_interval is not None:
+                self._adaptive_interval.async_record_change(self.scan_interval, changed)
+
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
     "current_platform", default=None
@@ -33,6 +33,7 @@ from homeassistant.core import (
     split_entity_id,
 )
 from homeassistant.exceptions import TemplateError
+from homeassistant.helpers.condition_cache import ConditionCache, condition_cache_cv
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.ratelimit import KeyedRateLimit
 from homeassistant.helpers.sun import get_astral_event_next
@@ -267,13 +268,19 @@ def async_track_state_change_event(
             if entity_id not in entity_callbacks:
                 return
 
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_hass_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state change for %s", entity_id
-                    )
+            # Conditions evaluated by the listeners, including in the tasks
+            # they start, share template renders until the next state change
+            token = condition_cache_cv.set(ConditionCache())
+            try:
+                for job in entity_callbacks[entity_id][:]:
+                    try:
+                        hass.async_run_hass_job(job, event)
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception(
+                            "Error while processing state change for %s", entity_id
+                        )
+            finally:
+                condition_cache_cv.reset(token)
 
         hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
             EVENT_STATE_CHANGED,
@@ -0,0 +1,319 @@
+"""Run blocking jobs in named executor pools.
+
+Jobs of different kinds run in their own pools, so slow jobs of one kind do
+not keep jobs of the other kinds waiting for a thread. Within a pool every
+integration can only run a limited number of jobs at once, so a hung
+integration cannot take up all the threads of the pool. Isolated pools give
+every integration threads of its own.
+"""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.executor import InterruptibleThreadPoolExecutor
+
+_LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DATA_EXECUTOR_POOLS = "executor_pools"
+
+# File and network I/O, runs in the default executor of the event loop
+POOL_IO = "io"
+# Computations like image processing
+POOL_CPU = "cpu"
+# The update method of entities that are polled
+POOL_POLLING = "polling"
+# Reads from the database of the recorder
+POOL_DATABASE = "database"
+
+_CPU_COUNT = os.cpu_count() or 1
+
+# Threads of the pools, None for the default executor. Isolated pools have at
+# least this many threads per integration, or as many as its quota.
+POOL_WORKERS: dict[str, int | None] = {
+    POOL_IO: None,
+    POOL_CPU: _CPU_COUNT,
+    POOL_POLLING: 4,
+    POOL_DATABASE: 4,
+}
+
+# Jobs an integration can run in a pool at once, unless its quota is set or
+# reserved. Entity platforms reserve their parallel updates in the polling pool.
+DEFAULT_QUOTAS = {
+    POOL_IO: 16,
+    POOL_CPU: max(1, _CPU_COUNT // 2),
+    POOL_POLLING: 4,
+    POOL_DATABASE: 2,
+}
+
+# Pools with threads per integration
+ISOLATED_POOLS = {POOL_POLLING}
+
+# Weight of the latest job in the average wait time
+WAIT_TIME_SMOOTHING = 0.1
+
+
+@dataclasses.dataclass
+class JobStats:
+    """How many jobs ran, how long they waited to run and how long they ran."""
+
+    jobs: int = 0
+    active: int = 0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    run_time: float = 0.0
+
+    def record_wait(self, wait_time: float) -> None:
+        """Record the time a finished job waited before it ran."""
+        self.jobs += 1
+        if self.jobs == 1:
+            self.wait_time = wait_time
+        else:
+            self.wait_time += WAIT_TIME_SMOOTHING * (wait_time - self.wait_time)
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+
+class ExecutorPool:
+    """A pool of threads with a quota of jobs per integration."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        workers: int | None,
+        quota: int,
+        isolated: bool = False,
+    ) -> None:
+        """Initialize the pool."""
+        self.hass = hass
+        self.name = name
+        self._workers = workers
+        self._isolated = isolated
+        self._executors: dict[str | None, InterruptibleThreadPoolExecutor] = {}
+        self._executor_workers: dict[str | None, int] = {}
+        # Executors replaced by larger ones, shut down with the pool
+        self._retired_executors: list[InterruptibleThreadPoolExecutor] = []
+        self._shutdown = False
+        self.default_quota = quota
+        self._quotas: dict[str, int] = {}
+        self._reserved: dict[str, int] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._waiting_for_quota = 0
+        # Jobs waiting for a thread, updated by the loop and the threads
+        self._waiting_for_thread = 0
+        self._waiting_lock = threading.Lock()
+        self.stats = JobStats()
+        self.integration_stats: dict[str, JobStats] = {}
+
+    @callback
+    def async_set_quota(self, integration: str, quota: int) -> None:
+        """Set the number of jobs an integration can run at once."""
+        self._quotas[integration] = quota
+        # Jobs that are running release the old semaphore
+        self._semaphores.pop(integration, None)
+
+    @callback
+    def async_reserve(self, integration: str, jobs: int) -> CALLBACK_TYPE:
+        """Add jobs to the quota of an integration until the returned callback is called.
+
+        The quota of an integration with reserved jobs is the sum of its
+        reservations, unless it is set with async_set_quota.
+        """
+        self._reserved[integration] = self._reserved.get(integration, 0) + jobs
+        self._semaphores.pop(integration, None)
+
+        @callback
+        def async_release() -> None:
+            """Release the reserved jobs."""
+            self._reserved[integration] -= jobs
+            if not self._reserved[integration]:
+                del self._reserved[integration]
+            self._semaphores.pop(integration, None)
+
+        return async_release
+
+    def _get_quota(self, integration: str) -> int:
+        """Return the number of jobs an integration can run at once."""
+        if integration in self._quotas:
+            return self._quotas[integration]
+        return self._reserved.get(integration, self.default_quota)
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of jobs waiting for their quota or a thread."""
+        return self._waiting_for_quota + self._waiting_for_thread
+
+    async def async_run(
+        self, integration: str | None, target: Callable[..., T], *args: Any
+    ) -> T:
+        """Run a job in the pool, counting it against the quota of an integration."""
+        stats = [self.stats]
+        semaphore = None
+        if integration is not None:
+            stats.append(self.integration_stats.setdefault(integration, JobStats()))
+            if (semaphore := self._semaphores.get(integration)) is None:
+                semaphore = self._semaphores[integration] = asyncio.Semaphore(
+                    self._get_quota(integration)
+                )
+
+        started = 0.0
+        finished = 0.0
+        waiting = False
+
+        def stop_waiting() -> None:
+            """Stop counting the job as waiting for a thread."""
+            nonlocal waiting
+            with self._waiting_lock:
+                if waiting:
+                    waiting = False
+                    self._waiting_for_thread -= 1
+
+        def run() -> T:
+            """Run the job, noting when it started and finished."""
+            nonlocal started, finished
+            started = time.monotonic()
+            stop_waiting()
+            try:
+                return target(*args)
+            finally:
+                finished = time.monotonic()
+
+        submitted = time.monotonic()
+        for job_stats in stats:
+            job_stats.active += 1
+        try:
+            if semaphore is not None:
+                self._waiting_for_quota += 1
+                try:
+                    await semaphore.acquire()
+                finally:
+                    self._waiting_for_quota -= 1
+            with self._waiting_lock:
+                waiting = True
+                self._waiting_for_thread += 1
+            try:
+                return await self.hass.loop.run_in_executor(
+                    self._get_executor(integration), run
+                )
+            finally:
+                # The job never runs if it's cancelled before it started
+                stop_waiting()
+                if semaphore is not None:
+                    semaphore.release()
+        finally:
+            for job_stats in stats:
+                job_stats.active -= 1
+                if started:
+                    job_stats.record_wait(started - submitted)
+                if finished:
+                    job_stats.run_time += finished - started
+
+    def _get_executor(
+        self, integration: str | None
+    ) -> InterruptibleThreadPoolExecutor | None:
+        """Return the executor for jobs of an integration, creating it when first used.
+
+        Jobs run in the default executor once the pool is shut down.
+        """
+        if self._workers is None or self._shutdown:
+            return None
+
+        key = integration if self._isolated else None
+        workers = self._workers
+        prefix = f"{self.name.title()}Worker"
+        if key is not None:
+            # Threads are only started when needed
+            workers = max(workers, self._get_quota(key))
+            prefix = f"{prefix}-{key}"
+
+        executor = self._executors.get(key)
+        if executor is not None and self._executor_workers[key] >= workers:
+            return executor
+
+        if executor is not None:
+            # Running jobs finish in the old executor
+            self._retired_executors.append(executor)
+        executor = self._executors[key] = InterruptibleThreadPoolExecutor(
+            thread_name_prefix=prefix, max_workers=workers
+        )
+        self._executor_workers[key] = workers
+        return executor
+
+    async def async_shutdown(self) -> None:
+        """Shut down the threads of the pool."""
+        self._shutdown = True
+        executors = [*self._executors.values(), *self._retired_executors]
+        self._executors.clear()
+        self._retired_executors.clear()
+        await asyncio.gather(
+            *(
+                self.hass.async_add_executor_job(executor.shutdown)
+                for executor in executors
+            )
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return dictionary version of the pool statistics."""
+        return {
+            **dataclasses.asdict(self.stats),
+            "queue_depth": self.queue_depth,
+            "integrations": {
+                integration: dataclasses.asdict(stats)
+                for integration, stats in self.integration_stats.items()
+            },
+        }
+
+
+class ExecutorPools:
+    """The executor pools of Home Assistant."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the pools."""
+        self.hass = hass
+        self.pools = {
+            name: ExecutorPool(
+                hass, name, workers, DEFAULT_QUOTAS[name], name in ISOLATED_POOLS
+            )
+            for name, workers in POOL_WORKERS.items()
+        }
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_shutdown)
+
+    async def _async_shutdown(self, _event: Event) -> None:
+        """Shut down the pools."""
+        await asyncio.gather(*(pool.async_shutdown() for pool in self.pools.values()))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return dictionary version of the statistics of the pools."""
+        return {name: pool.as_dict() for name, pool in self.pools.items()}
+
+
+@callback
+@singleton(DATA_EXECUTOR_POOLS)
+def async_get_executor_pools(hass: HomeAssistant) -> ExecutorPools:
+    """Return the executor pools."""
+    return ExecutorPools(hass)
+
+
+async def async_run_in_pool(
+    hass: HomeAssistant,
+    pool: str,
+    integration: str | None,
+    target: Callable[..., T],
+    *args: Any,
+) -> T:
+    """Run a job in an executor pool."""
+    return (
+        await async_get_executor_pools(hass)
+        .pools[pool]
+        .async_run(integration, target, *args)
+    )
@@ -0,0 +1,223 @@
+"""Adapt polling intervals to how often the polled data changes.
+
+An adaptive interval starts at the configured interval. It doubles after
+every poll that returned the same data, up to a maximum, and drops back to
+the configured interval, or below it down to a minimum, when the data
+changes. While entities of a poller are watched, for example by a template
+or trigger subscription of the frontend, the minimum interval is used. The
+first poll is delayed by a random part of the interval, so pollers set up at
+the same time do not poll in the same second.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+import dataclasses
+from datetime import timedelta
+import random
+from typing import Any, Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+
+DATA_POLLING_WATCHERS = "polling_watchers"
+
+# Longest interval if no maximum is given, relative to the configured interval
+DEFAULT_MAX_INTERVAL_FACTOR = 8
+
+# Weight of the latest poll in the average duration
+DURATION_SMOOTHING = 0.1
+
+
+@dataclasses.dataclass
+class PollingStats:
+    """How long polls took and how many were skipped."""
+
+    polls: int = 0
+    failed: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    last_duration: float = 0.0
+    avg_duration: float = 0.0
+    max_duration: float = 0.0
+    interval: float = 0.0
+
+    def record_poll(self, duration: float, changed: bool | None) -> None:
+        """Record a finished poll, changed is None if it failed."""
+        self.polls += 1
+        if changed is None:
+            self.failed += 1
+        elif not changed:
+            self.unchanged += 1
+        self.last_duration = duration
+        if self.polls == 1:
+            self.avg_duration = duration
+        else:
+            self.avg_duration += DURATION_SMOOTHING * (duration - self.avg_duration)
+        self.max_duration = max(self.max_duration, duration)
+
+    def record_delay(self, delay: float, interval: float) -> None:
+        """Record the delay until the next poll and the polls it skips."""
+        self.interval = delay
+        if delay > interval:
+            self.skipped += int(delay / interval) - 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return dictionary version of the statistics."""
+        return dataclasses.asdict(self)
+
+
+class AdaptiveInterval:
+    """Interval between polls that adapts to changes of the polled data."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        stats: PollingStats,
+        min_interval: timedelta | None = None,
+        max_interval: timedelta | None = None,
+        entity_ids: Callable[[], Iterable[str]] | None = None,
+    ) -> None:
+        """Initialize the interval.
+
+        The minimum defaults to the configured interval and the maximum to
+        DEFAULT_MAX_INTERVAL_FACTOR times the configured interval. entity_ids
+        returns the entities updated by the poller.
+        """
+        self.hass = hass
+        self.stats = stats
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._entity_ids = entity_ids
+        # Current interval relative to the configured interval
+        self._factor = 1.0
+        self._started = False
+
+    @callback
+    def async_next_delay(self, interval: timedelta) -> float:
+        """Return the seconds until the next poll."""
+        base = interval.total_seconds()
+        if self._entity_ids is not None and async_is_watched(
+            self.hass, self._entity_ids()
+        ):
+            delay = self._bounds(base)[0]
+        else:
+            delay = base * self._factor
+
+        self.stats.record_delay(delay, base)
+        if not self._started:
+            self._started = True
+            return random.uniform(0, delay)
+        return delay
+
+    @callback
+    def async_record_change(self, interval: timedelta, changed: bool) -> None:
+        """Adapt the interval to whether the last poll returned new data."""
+        base = interval.total_seconds()
+        min_interval, max_interval = self._bounds(base)
+        if not changed:
+            self._factor = min(self._factor * 2, max_interval / base)
+        elif self._factor > 1:
+            self._factor = 1.0
+        else:
+            self._factor = max(self._factor / 2, min_interval / base)
+
+    @callback
+    def async_track_watch_start(self, action: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call an action when entities of the poller start being watched."""
+
+        @callback
+        def watch_started(entity_ids: set[str]) -> None:
+            """Call the action if one of the entities is watched now."""
+            if self._entity_ids is not None and not entity_ids.isdisjoint(
+                self._entity_ids()
+            ):
+                action()
+
+        return async_track_watch_start(self.hass, watch_started)
+
+    def _bounds(self, base: float) -> tuple[float, float]:
+        """Return the shortest and longest interval in seconds."""
+        min_interval = (
+            base
+            if self._min_interval is None
+            else min(base, self._min_interval.total_seconds())
+        )
+        max_interval = (
+            base * DEFAULT_MAX_INTERVAL_FACTOR
+            if self._max_interval is None
+            else max(base, self._max_interval.total_seconds())
+        )
+        return min_interval, max_interval
+
+
+class _PollingWatchers:
+    """Count the watchers of entities."""
+
+    def __init__(self) -> None:
+        """Initialize the watchers."""
+        self.entities: dict[str, int] = {}
+        self.listeners: list[Callable[[set[str]], None]] = []
+
+
+@callback
+@singleton(DATA_POLLING_WATCHERS)
+def _async_get_watchers(hass: HomeAssistant) -> _PollingWatchers:
+    """Return the watchers of entities."""
+    return _PollingWatchers()
+
+
+@callback
+def async_is_watched(hass: HomeAssistant, entity_ids: Iterable[str]) -> bool:
+    """Return if any of the entities is watched."""
+    watched = _async_get_watchers(hass).entities
+    return any(entity_id in watched for entity_id in entity_ids)
+
+
+@callback
+def async_watch_entities(
+    hass: HomeAssistant, entity_ids: Iterable[str]
+) -> CALLBACK_TYPE:
+    """Poll entities at the shortest intervals until the returned callback is called."""
+    watchers = _async_get_watchers(hass)
+    entity_ids = set(entity_ids)
+    started = {
+        entity_id for entity_id in entity_ids if entity_id not in watchers.entities
+    }
+    for entity_id in entity_ids:
+        watchers.entities[entity_id] = watchers.entities.get(entity_id, 0) + 1
+
+    if started:
+        for listener in list(watchers.listeners):
+            listener(started)
+
+    released = False
+
+    @callback
+    def release() -> None:
+        """Stop watching."""
+        nonlocal released
+        if released:
+            return
+        released = True
+        for entity_id in entity_ids:
+            watchers.entities[entity_id] -= 1
+            if not watchers.entities[entity_id]:
+                del watchers.entities[entity_id]
+
+    return release
+
+
+@callback
+def async_track_watch_start(
+    hass: HomeAssistant, action: Callable[[set[str]], None]
+) -> CALLBACK_TYPE:
+    """Call an action with the entities that start being watched."""
+    watchers = _async_get_watchers(hass)
+    watchers.listeners.append(action)
+
+    @callback
+    def remove_listener() -> None:
+        """Remove the listener."""
+        watchers.listeners.remove(action)
+
+    return remove_listener
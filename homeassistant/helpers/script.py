@@ -319,6 +319,8 @@ class _ScriptRun:
         self._action: dict[str, Any] | None = None
         self._stop = asyncio.Event()
         self._stopped = asyncio.Event()
+        # Scripts without stored traces skip the trace bookkeeping of each step
+        self._traced = script.trace
 
     def _changed(self) -> None:
         if not self._stop.is_set():
@@ -362,19 +364,26 @@ class _ScriptRun:
             self._finish()
 
     async def _async_step(self, log_exceptions):
+        if not self._traced:
+            await self._async_run_step(log_exceptions)
+            return
+
         with trace_path(str(self._step)):
             async with trace_action(self._hass, self, self._stop, self._variables):
                 if self._stop.is_set():
                     return
-                try:
-                    handler = f"_async_{cv.determine_script_action(self._action)}_step"
-                    await getattr(self, handler)()
-                except Exception as ex:
-                    if not isinstance(ex, _StopScript) and (
-                        self._log_exceptions or log_exceptions
-                    ):
-                        self._log_exception(ex)
-                    raise
+                await self._async_run_step(log_exceptions)
+
+    async def _async_run_step(self, log_exceptions):
+        try:
+            handler = f"_async_{cv.determine_script_action(self._action)}_step"
+            await getattr(self, handler)()
+        except Exception as ex:
+            if not isinstance(ex, _StopScript) and (
+                self._log_exceptions or log_exceptions
+            ):
+                self._log_exception(ex)
+            raise
 
     def _finish(self) -> None:
         self._script._runs.remove(self)  # pylint: disable=protected-access
@@ -541,8 +550,10 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
+        params = (
+            self._script._async_get_service_params(  # pylint: disable=protected-access
+                self._step, self._action, self._variables
+            )
         )
 
         running_script = (
@@ -558,20 +569,18 @@ class _ScriptRun:
             limit = SERVICE_CALL_LIMIT
 
         trace_set_result(params=params, running_script=running_script, limit=limit)
-        service_task = self._hass.async_create_task(
-            self._hass.services.async_call(
-                **params,
-                blocking=True,
-                context=self._context,
-                limit=limit,
-            )
+        service_call = self._hass.services.async_call(
+            **params,
+            blocking=True,
+            context=self._context,
+            limit=limit,
         )
         if limit is not None:
             # There is a call limit, so just wait for it to finish.
-            await service_task
+            await service_call
             return
 
-        await self._async_run_long_action(service_task)
+        await self._async_run_long_action(self._hass.async_create_task(service_call))
 
     async def _async_device_step(self):
         """Perform the device automation specified in the action."""
@@ -909,6 +918,20 @@ async def _async_stop_scripts_at_shutdown(hass, event):
 _VarsType = Union[Dict[str, Any], MappingProxyType]
 
 
+def _is_static_config(value: Any) -> bool:
+    """Return if a config does not contain templates that need rendering."""
+    if isinstance(value, template.Template):
+        return value.is_static
+    if isinstance(value, list):
+        return all(_is_static_config(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            _is_static_config(key) and _is_static_config(item)
+            for key, item in value.items()
+        )
+    return True
+
+
 def _referenced_extract_ids(data: dict[str, Any], key: str, found: set[str]) -> None:
     """Extract referenced IDs."""
     if not data:
@@ -951,8 +974,13 @@ class Script:
         log_exceptions: bool = True,
         top_level: bool = True,
         variables: ScriptVariables | None = None,
+        trace: bool = True,
     ) -> None:
-        """Initialize the script."""
+        """Initialize the script.
+
+        Steps of scripts created with trace set to False are not traced, which
+        also disables breakpoints.
+        """
         all_scripts = hass.data.get(DATA_SCRIPTS)
         if not all_scripts:
             all_scripts = hass.data[DATA_SCRIPTS] = []
@@ -981,6 +1009,7 @@ class Script:
         self.script_mode = script_mode
         self._set_logger(logger)
         self._log_exceptions = log_exceptions
+        self.trace = trace
 
         self.last_action = None
         self.last_triggered: datetime | None = None
@@ -993,6 +1022,7 @@ class Script:
         self._config_cache: dict[set[tuple], Callable[..., bool]] = {}
         self._repeat_script: dict[int, Script] = {}
         self._choose_data: dict[int, _ChooseData] = {}
+        self._service_params: dict[int, service.ServiceParams | None] = {}
         self._referenced_entities: set[str] | None = None
         self._referenced_devices: set[str] | None = None
         self._referenced_areas: set[str] | None = None
@@ -1243,6 +1273,32 @@ class Script:
             return
         await asyncio.shield(self._async_stop(aws, update_state, spare))
 
+    @callback
+    def _async_get_service_params(
+        self, step: int, action: dict[str, Any], variables: dict[str, Any]
+    ) -> service.ServiceParams:
+        """Return the parameters of a service call step.
+
+        Steps without dynamic templates are only rendered on their first run.
+        """
+        if step not in self._service_params:
+            self._service_params[step] = (
+                service.async_prepare_call_from_config(self._hass, action)
+                if _is_static_config(action)
+                else None
+            )
+
+        params = self._service_params[step]
+        if params is None:
+            return service.async_prepare_call_from_config(self._hass, action, variables)
+
+        # The service call adds the target to the service data
+        return {
+            **params,
+            "service_data": dict(params["service_data"]),
+            "target": dict(params["target"] or {}),
+        }
+
     async def _async_get_condition(self, config):
         if isinstance(config, template.Template):
             config_cache_key = config.template
@@ -1267,6 +1323,7 @@ class Script:
             max_runs=self.max_runs,
             logger=self._logger,
             top_level=False,
+            trace=self.trace,
         )
         sub_script.change_listener = partial(self._chain_change_listener, sub_script)
         return sub_script
@@ -1298,6 +1355,7 @@ class Script:
                 max_runs=self.max_runs,
                 logger=self._logger,
                 top_level=False,
+                trace=self.trace,
             )
             sub_script.change_listener = partial(
                 self._chain_change_listener, sub_script
@@ -1316,6 +1374,7 @@ class Script:
                 max_runs=self.max_runs,
                 logger=self._logger,
                 top_level=False,
+                trace=self.trace,
             )
             default_script.change_listener = partial(
                 self._chain_change_listener, default_script
@@ -523,10 +523,13 @@ async def entity_service_call(
     func: str | Callable[..., Any],
     call: ServiceCall,
     required_features: Iterable[int] | None = None,
+    batch_params: Callable[[Entity, ServiceCall], dict | None] | None = None,
 ) -> None:
     """Handle an entity service call.
 
-    Calls all platforms simultaneously.
+    Calls all platforms simultaneously. batch_params returns the processed
+    parameters of an entity for platforms handling the service in batches, or
+    None if the entity has to be called on its own.
     """
     if call.context.user_id:
         user = await hass.auth.async_get_user(call.context.user_id)
@@ -645,12 +648,10 @@ async def entity_service_call(
 
     done, pending = await asyncio.wait(
         [
-            asyncio.create_task(
-                entity.async_request_call(
-                    _handle_entity_call(hass, entity, func, data, call.context)
-                )
+            asyncio.create_task(entity_call)
+            for entity_call in _entity_calls(
+                hass, entities, func, data, call, batch_params
             )
-            for entity in entities
         ]
     )
     assert not pending
@@ -675,6 +676,70 @@ async def entity_service_call(
             future.result()  # pop exception if have
 
 
+@callback
+def _entity_calls(
+    hass: HomeAssistant,
+    entities: list[Entity],
+    func: str | Callable[..., Any],
+    data: dict | ServiceCall,
+    call: ServiceCall,
+    batch_params: Callable[[Entity, ServiceCall], dict | None] | None,
+) -> list[Awaitable]:
+    """Return the calls handling a service call for entities.
+
+    Entities of platforms that can handle the service for many of their
+    entities at once are called in one batch per platform, with the
+    parameters processed for each entity.
+    """
+    batches: dict[EntityPlatform, list[tuple[Entity, dict]]] = {}
+    calls: list[Awaitable] = []
+
+    for entity in entities:
+        params: dict | None = None
+        if (
+            entity.platform is not None
+            and entity.platform.domain == call.domain
+            and call.service in entity.platform.batch_services
+        ):
+            if batch_params is not None:
+                params = batch_params(entity, call)
+            elif isinstance(data, dict):
+                params = dict(data)
+
+        if params is not None:
+            batches.setdefault(entity.platform, []).append((entity, params))
+        else:
+            calls.append(
+                entity.async_request_call(
+                    _handle_entity_call(hass, entity, func, data, call.context)
+                )
+            )
+
+    for platform, entity_params in batches.items():
+        calls.append(_handle_batch_call(platform, entity_params, call))
+
+    return calls
+
+
+async def _handle_batch_call(
+    platform: EntityPlatform,
+    entity_params: list[tuple[Entity, dict]],
+    call: ServiceCall,
+) -> None:
+    """Handle calling a service for entities of a platform at once."""
+    for entity, _ in entity_params:
+        entity.async_set_context(call.context)
+
+    if platform.parallel_updates:
+        await platform.parallel_updates.acquire()
+
+    try:
+        await platform.batch_services[call.service](entity_params)
+    finally:
+        if platform.parallel_updates:
+            platform.parallel_updates.release()
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
@@ -0,0 +1,269 @@
+"""Report state changes of exposed entities to voice assistants.
+
+All pipelines share a single listener for state changes. Each pipeline
+keeps an index of the entities it exposes, coalesces the changes of an
+entity while a report is pending and only serializes and checks the last
+state of the entity for a significant change when the batch is reported.
+Events, such as doorbell presses, are serialized when the state changes and
+every one of them is reported, even if the entity changed again before the
+report.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from datetime import datetime
+import logging
+from typing import Any, Callable
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HassJob,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.significant_change import (
+    ExtraCheckTypeFunc,
+    SignificantlyChangedChecker,
+    create_checker,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATE_REPORT = "state_report"
+
+
+class StateReportEvent:
+    """Serialized event that is reported without being coalesced or checked."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any) -> None:
+        """Initialize the event."""
+        self.data = data
+
+
+class StateReportPipeline:
+    """Report significant state changes of exposed entities in batches."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        domain: str,
+        *,
+        should_expose: Callable[[State], bool],
+        serialize: Callable[[State], Any],
+        report: Callable[[dict[str, Any]], Awaitable[None]],
+        window: float = 0,
+        extra_significant_check: ExtraCheckTypeFunc | None = None,
+        serialize_event: Callable[[State], StateReportEvent | None] | None = None,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Whether an entity is exposed is decided on the first state of the
+        entity seen and kept until the index is invalidated. The serializer
+        returns None for states that should not be reported. Changes are
+        reported together after the window, or on the next iteration of the
+        event loop if the window is 0. The event serializer is called for
+        every state change and returns None if the change is not an event.
+        An entity with several events is reported in several batches.
+        """
+        self.hass = hass
+        self.domain = domain
+        self._should_expose = should_expose
+        self._serialize = serialize
+        self._serialize_event = serialize_event
+        self._report = report
+        self._window = window
+        self._extra_significant_check = extra_significant_check
+        self._checker: SignificantlyChangedChecker | None = None
+        self._exposed: dict[str, bool] = {}
+        self._pending: dict[str, State] = {}
+        self._events: list[tuple[str, StateReportEvent]] = []
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._flush_job = HassJob(self._async_flush_later)
+        self._remove: CALLBACK_TYPE | None = None
+
+    async def async_setup(self) -> None:
+        """Set up the significant change checker."""
+        self._checker = await create_checker(
+            self.hass, self.domain, self._extra_significant_check
+        )
+
+    @callback
+    def async_is_significant_change(self, state: State, data: Any) -> bool:
+        """Return if a state serialized outside of the pipeline changed significantly.
+
+        The state is remembered, so later changes are compared to it.
+        """
+        assert self._checker is not None
+        return self._checker.async_is_significant_change(state, extra_arg=data)
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start reporting state changes."""
+        assert self._checker is not None
+        self._remove = _async_get_fan_out(self.hass).async_add(self)
+        return self._async_stop
+
+    @callback
+    def _async_stop(self) -> None:
+        """Stop reporting state changes."""
+        if self._remove is not None:
+            self._remove()
+            self._remove = None
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._pending.clear()
+        self._events.clear()
+
+    @callback
+    def async_invalidate_exposed(self) -> None:
+        """Decide again which entities are exposed."""
+        self._exposed.clear()
+
+    @callback
+    def async_state_changed(self, entity_id: str, new_state: State | None) -> None:
+        """Queue a state change of an exposed entity for the next report.
+
+        A removed entity is forgotten, so a pending change of it is not
+        reported and an entity added again with the same id is handled as a
+        new one. Its pending events are still reported.
+        """
+        if new_state is None:
+            self._exposed.pop(entity_id, None)
+            self._pending.pop(entity_id, None)
+            if self._checker is not None:
+                self._checker.last_approved_entities.pop(entity_id, None)
+            return
+
+        if (exposed := self._exposed.get(entity_id)) is None:
+            exposed = self._exposed[entity_id] = self._should_expose(new_state)
+        if not exposed:
+            return
+
+        if (
+            self._serialize_event is not None
+            and (event := self._serialize_event(new_state)) is not None
+        ):
+            self._events.append((entity_id, event))
+        self._pending[entity_id] = new_state
+        self._async_schedule_flush()
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Schedule a report unless one is scheduled or in progress."""
+        if self._unsub_flush is not None or self._flush_task is not None:
+            return
+        if self._window:
+            self._unsub_flush = async_call_later(
+                self.hass, self._window, self._flush_job
+            )
+        else:
+            self._flush_task = self.hass.async_create_task(self._async_flush())
+
+    @callback
+    def _async_flush_later(self, _now: datetime) -> None:
+        """Report the changes at the end of the window."""
+        self._unsub_flush = None
+        self._flush_task = self.hass.async_create_task(self._async_flush())
+
+    async def _async_flush(self) -> None:
+        """Report the significant changes and the events that are pending."""
+        assert self._checker is not None
+        pending, self._pending = self._pending, {}
+        events, self._events = self._events, []
+        batches: list[dict[str, Any]] = [{}]
+        try:
+            for entity_id, state in pending.items():
+                if (data := self._serialize(state)) is None:
+                    continue
+                if not self._checker.async_is_significant_change(state, extra_arg=data):
+                    continue
+                batches[0][entity_id] = data
+
+            for entity_id, event in events:
+                for batch in batches:
+                    if entity_id not in batch:
+                        batch[entity_id] = event
+                        break
+                else:
+                    batches.append({entity_id: event})
+
+            for batch in batches:
+                if not batch:
+                    continue
+                _LOGGER.debug("Reporting %s states for %s", len(batch), self.domain)
+                try:
+                    await self._report(batch)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error reporting states for %s", self.domain)
+        finally:
+            self._flush_task = None
+            # Changes made while reporting go in the next report
+            if self._pending or self._events:
+                self._async_schedule_flush()
+
+
+class _StateReportFanOut:
+    """Dispatch state changes to all state report pipelines."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the fan-out."""
+        self.hass = hass
+        self.pipelines: list[StateReportPipeline] = []
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, pipeline: StateReportPipeline) -> CALLBACK_TYPE:
+        """Add a pipeline, listening to state changes if it's the first one."""
+        self.pipelines.append(pipeline)
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed
+            )
+
+        @callback
+        def remove_pipeline() -> None:
+            """Remove the pipeline."""
+            self.pipelines.remove(pipeline)
+            if not self.pipelines and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return remove_pipeline
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Pass a state change to the pipelines."""
+        if not self.hass.is_running:
+            return
+        entity_id = event.data["entity_id"]
+        new_state = event.data.get("new_state")
+        for pipeline in self.pipelines:
+            pipeline.async_state_changed(entity_id, new_state)
+
+
+@callback
+def _async_get_fan_out(hass: HomeAssistant) -> _StateReportFanOut:
+    """Return the state change fan-out."""
+    fan_out: _StateReportFanOut | None = hass.data.get(DATA_STATE_REPORT)
+    if fan_out is None:
+        fan_out = hass.data[DATA_STATE_REPORT] = _StateReportFanOut(hass)
+    return fan_out
+
+
+@callback
+def async_invalidate_exposed_entities(hass: HomeAssistant, domain: str) -> None:
+    """Decide again which entities the pipelines of a domain expose."""
+    if (fan_out := hass.data.get(DATA_STATE_REPORT)) is None:
+        return
+    for pipeline in fan_out.pipelines:
+        if pipeline.domain == domain:
+            pipeline.async_invalidate_exposed()
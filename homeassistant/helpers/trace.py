@@ -196,12 +196,22 @@ def trace_set_child_id(child_key: tuple[str, str], child_run_id: str) -> None:
 def trace_set_result(**kwargs: Any) -> None:
     """Set the result of TraceElement at the top of the stack."""
     node = cast(TraceElement, trace_stack_top(trace_stack_cv))
+
+    # Untraced script runs do not push elements
+    if not node:
+        return
+
     node.set_result(**kwargs)
 
 
 def trace_update_result(**kwargs: Any) -> None:
     """Update the result of TraceElement at the top of the stack."""
     node = cast(TraceElement, trace_stack_top(trace_stack_cv))
+
+    # Untraced script runs do not push elements
+    if not node:
+        return
+
     node.update_result(**kwargs)
 
 
@@ -19,6 +19,7 @@ from homeassistant.helpers import entity, event
 from homeassistant.util.dt import utcnow
 
 from .debounce import Debouncer
+from .polling import AdaptiveInterval, PollingStats
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
@@ -42,8 +43,17 @@ class DataUpdateCoordinator(Generic[T]):
         update_interval: timedelta | None = None,
         update_method: Callable[[], Awaitable[T]] | None = None,
         request_refresh_debouncer: Debouncer | None = None,
+        adaptive_update_interval: bool = False,
+        min_update_interval: timedelta | None = None,
+        max_update_interval: timedelta | None = None,
     ) -> None:
-        """Initialize global data updater."""
+        """Initialize global data updater.
+
+        With an adaptive update interval, refreshes are further apart while
+        the data does not change, closer together while it does and while
+        the states are watched. Data is compared with the data of the last
+        refresh, so the update method must return a new object.
+        """
         self.hass = hass
         self.logger = logger
         self.name = name
@@ -64,6 +74,17 @@ class DataUpdateCoordinator(Generic[T]):
         self._request_refresh_task: asyncio.TimerHandle | None = None
         self.last_update_success = True
         self.last_exception: Exception | None = None
+        self.polling_stats = PollingStats()
+        self._adaptive_interval: AdaptiveInterval | None = None
+        self._unsub_watch_start: CALLBACK_TYPE | None = None
+        if adaptive_update_interval:
+            self._adaptive_interval = AdaptiveInterval(
+                hass,
+                self.polling_stats,
+                min_update_interval,
+                max_update_interval,
+                self._listener_entity_ids,
+            )
 
         if request_refresh_debouncer is None:
             request_refresh_debouncer = Debouncer(
@@ -88,6 +109,12 @@ class DataUpdateCoordinator(Generic[T]):
         # This is the first listener, set up interval.
         if schedule_refresh:
             self._schedule_refresh()
+            if self._adaptive_interval is not None:
+                self._unsub_watch_start = (
+                    self._adaptive_interval.async_track_watch_start(
+                        self._async_watch_started
+                    )
+                )
 
         @callback
         def remove_listener() -> None:
@@ -105,6 +132,24 @@ class DataUpdateCoordinator(Generic[T]):
             self._unsub_refresh()
             self._unsub_refresh = None
 
+        if not self._listeners and self._unsub_watch_start:
+            self._unsub_watch_start()
+            self._unsub_watch_start = None
+
+    def _listener_entity_ids(self) -> list[str]:
+        """Return the entity ids of the entities listening for updates."""
+        return [
+            listener.__self__.entity_id  # type: ignore[attr-defined]
+            for listener in self._listeners
+            if isinstance(getattr(listener, "__self__", None), entity.Entity)
+        ]
+
+    @callback
+    def _async_watch_started(self) -> None:
+        """Refresh at the shortest interval once its entities are watched."""
+        if self._unsub_refresh:
+            self._schedule_refresh()
+
     @callback
     def _schedule_refresh(self) -> None:
         """Schedule a refresh."""
@@ -118,6 +163,14 @@ class DataUpdateCoordinator(Generic[T]):
             self._unsub_refresh()
             self._unsub_refresh = None
 
+        if self._adaptive_interval is not None:
+            self._unsub_refresh = event.async_call_later(
+                self.hass,
+                self._adaptive_interval.async_next_delay(self.update_interval),
+                self._job,
+            )
+            return
+
         # We _floor_ utcnow to create a schedule on a rounded second,
         # minimizing the time between the point and the real activation.
         # That way we obtain a constant update frequency,
@@ -182,8 +235,10 @@ class DataUpdateCoordinator(Generic[T]):
 
         start = monotonic()
         auth_failed = False
+        changed: bool | None = None
 
         try:
+            previous = self.data
             self.data = await self._async_update_data()
 
         except (asyncio.TimeoutError, requests.exceptions.Timeout) as err:
@@ -251,12 +306,20 @@ class DataUpdateCoordinator(Generic[T]):
             if not self.last_update_success:
                 self.last_update_success = True
                 self.logger.info("Fetching %s data recovered", self.name)
+            # Data changed in place cannot be compared
+            changed = self.data is previous or self.data != previous
+            if self._adaptive_interval is not None and self.update_interval:
+                self._adaptive_interval.async_record_change(
+                    self.update_interval, changed
+                )
 
         finally:
+            duration = monotonic() - start
+            self.polling_stats.record_poll(duration, changed)
             self.logger.debug(
                 "Finished fetching %s data in %.3f seconds",
                 self.name,
-                monotonic() - start,
+                duration,
             )
             if not auth_failed and self._listeners and not self.hass.is_stopping:
                 self._schedule_refresh()
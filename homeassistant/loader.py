@@ -14,8 +14,18 @@ import json
 import logging
 import pathlib
 import sys
+import threading
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    TypedDict,
+    TypeVar,
+    cast,
+)
 
 from awesomeversion import (
     AwesomeVersion,
@@ -23,6 +33,8 @@ from awesomeversion import (
     AwesomeVersionStrategy,
 )
 
+from homeassistant.const import __version__
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.generated.dhcp import DHCP
 from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
@@ -32,6 +44,7 @@ from homeassistant.util.async_ import gather_with_concurrency
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.storage import Store
 
 # mypy: disallow-any-generics
 
@@ -44,6 +57,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -57,6 +71,10 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 30
+
 
 class Manifest(TypedDict, total=False):
     """
@@ -122,12 +140,17 @@ async def _async_get_custom_components(
     dirs = await hass.async_add_executor_job(
         get_sub_directories, custom_components.__path__
     )
+    manifest_index = await async_get_manifest_index(hass)
 
     integrations = await gather_with_concurrency(
         MAX_LOAD_CONCURRENTLY,
         *(
             hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
+                Integration.resolve_from_root,
+                hass,
+                custom_components,
+                comp.name,
+                manifest_index,
             )
             for comp in dirs
         ),
@@ -162,6 +185,159 @@ async def async_get_custom_components(
     return cast(Dict[str, "Integration"], reg_or_evt)
 
 
+class ManifestIndex:
+    """Index of integration manifests that is persisted between restarts.
+
+    The whole index is loaded with a single file read and validated once when
+    it is loaded. Indexed built-in manifests are trusted as long as the Home
+    Assistant version and the mtime of the components directory did not
+    change. Indexed custom manifests are trusted as long as the mtime of
+    their manifest.json matches the one they were indexed with. Manifests
+    that no longer exist are dropped from the index.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        store: Store,
+        manifests: dict[str, dict[str, Any]],
+        components_mtime: float | None,
+    ) -> None:
+        """Initialize the manifest index."""
+        self.hass = hass
+        self._store = store
+        # Manifests are looked up and added from the executor
+        self._lock = threading.Lock()
+        self._manifests = manifests
+        self._components_mtime = components_mtime
+
+    @classmethod
+    async def async_load(cls, hass: HomeAssistant) -> ManifestIndex:
+        """Load the manifest index from disk."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.helpers.storage import Store
+
+        store = Store(
+            hass, MANIFEST_INDEX_STORAGE_VERSION, MANIFEST_INDEX_STORAGE_KEY, True
+        )
+        try:
+            data = await store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to load manifest index, rebuilding it: %s", err)
+            data = None
+
+        manifests, components_mtime = await hass.async_add_executor_job(
+            _validate_manifest_index, data
+        )
+        index = cls(hass, store, manifests, components_mtime)
+        if data is not None and len(manifests) != len(data.get("manifests", {})):
+            index._async_schedule_save()
+        return index
+
+    def get(self, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return the indexed manifest at a path.
+
+        Safe to call from the executor.
+        """
+        with self._lock:
+            entry = self._manifests.get(str(manifest_path))
+        if entry is None:
+            return None
+        return cast(Manifest, dict(entry["manifest"]))
+
+    def add(self, manifest_path: pathlib.Path, manifest: Manifest) -> None:
+        """Add a freshly read manifest to the index.
+
+        Safe to call from the executor.
+        """
+        entry = {
+            "mtime": manifest_path.stat().st_mtime,
+            "manifest": dict(manifest),
+        }
+        with self._lock:
+            self._manifests[str(manifest_path)] = entry
+        self.hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the index."""
+        self._store.async_delay_save(self._data_to_save, MANIFEST_INDEX_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the index to store on disk."""
+        with self._lock:
+            manifests = dict(self._manifests)
+        return {
+            "ha_version": __version__,
+            "components_mtime": self._components_mtime,
+            "manifests": manifests,
+        }
+
+
+def _validate_manifest_index(
+    data: dict[str, Any] | None
+) -> tuple[dict[str, dict[str, Any]], float | None]:
+    """Return the valid manifests of a stored index and the components mtime.
+
+    Runs in the executor.
+    """
+    from homeassistant import components  # pylint: disable=import-outside-toplevel
+
+    components_dir = pathlib.Path(components.__file__).parent
+    try:
+        components_mtime: float | None = components_dir.stat().st_mtime
+    except OSError:
+        components_mtime = None
+
+    if data is None or data.get("ha_version") != __version__:
+        return {}, components_mtime
+
+    builtin_valid = (
+        components_mtime is not None
+        and data.get("components_mtime") == components_mtime
+    )
+    manifests = {}
+    for path, entry in data["manifests"].items():
+        manifest_path = pathlib.Path(path)
+        if components_dir in manifest_path.parents:
+            if builtin_valid:
+                manifests[path] = entry
+            continue
+        try:
+            mtime = manifest_path.stat().st_mtime
+        except OSError:
+            continue
+        if mtime == entry["mtime"]:
+            manifests[path] = entry
+
+    return manifests, components_mtime
+
+
+async def async_get_manifest_index(hass: HomeAssistant) -> ManifestIndex | None:
+    """Return the cached manifest index.
+
+    The index is disabled by setting DATA_MANIFEST_INDEX to None.
+    """
+    if hass.config.config_dir is None:
+        return None
+
+    index_or_evt = hass.data.get(DATA_MANIFEST_INDEX, _UNDEF)
+
+    if index_or_evt is _UNDEF:
+        evt = hass.data[DATA_MANIFEST_INDEX] = asyncio.Event()
+
+        index = await ManifestIndex.async_load(hass)
+
+        hass.data[DATA_MANIFEST_INDEX] = index
+        evt.set()
+        return index
+
+    if isinstance(index_or_evt, asyncio.Event):
+        await index_or_evt.wait()
+        return cast(Optional[ManifestIndex], hass.data.get(DATA_MANIFEST_INDEX))
+
+    return cast(Optional[ManifestIndex], index_or_evt)
+
+
 async def async_get_config_flows(hass: HomeAssistant) -> set[str]:
     """Return cached list of config flows."""
     # pylint: disable=import-outside-toplevel
@@ -273,22 +449,31 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        manifest_index: ManifestIndex | None = None,
     ) -> Integration | None:
         """Resolve an integration from a root module."""
         for base in root_module.__path__:  # type: ignore
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
+            manifest = manifest_index.get(manifest_path) if manifest_index else None
 
-            if not manifest_path.is_file():
-                continue
+            if manifest is None:
+                if not manifest_path.is_file():
+                    continue
 
-            try:
-                manifest = json.loads(manifest_path.read_text())
-            except ValueError as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+                try:
+                    manifest = json.loads(manifest_path.read_text())
+                except ValueError as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                if manifest_index is not None:
+                    manifest_index.add(manifest_path, manifest)
 
             integration = cls(
                 hass,
@@ -554,7 +739,11 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
     if integration := await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
+        Integration.resolve_from_root,
+        hass,
+        components,
+        domain,
+        await async_get_manifest_index(hass),
     ):
         return integration
 
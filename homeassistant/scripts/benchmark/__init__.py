@@ -8,14 +8,19 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import Callable, TypeVar
 
-from homeassistant import core
+from homeassistant import config_entries, core
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.helpers import area_registry, device_registry, entity_registry
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.script import Script
+from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -390,6 +395,82 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def script_service_calls(hass):
+    """Run a script calling a service for 60 lights a thousand times."""
+    count = 0
+
+    @core.callback
+    def service_handler(call):
+        """Handle service call."""
+        nonlocal count
+        count += 1
+
+    hass.services.async_register("light", "turn_on", service_handler)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "service": "light.turn_on",
+                "target": {"entity_id": f"light.light_{idx}"},
+                "data": {"brightness": 255, "transition": 2},
+            }
+            for idx in range(60)
+        ]
+    )
+    benchmark_script = Script(hass, sequence, "Benchmark", "script")
+
+    start = timer()
+
+    for _ in range(10 ** 3):
+        await benchmark_script.async_run(context=core.Context())
+
+    assert count == 60 * 10 ** 3
+    return timer() - start
+
+
+@benchmark
+async def script_entity_service_calls(hass):
+    """Run a traced script entity calling a service for 60 lights a thousand times."""
+    count = 0
+
+    @core.callback
+    def service_handler(call):
+        """Handle service call."""
+        nonlocal count
+        count += 1
+
+    hass.services.async_register("light", "turn_on", service_handler)
+    sequence = [
+        {
+            "service": "light.turn_on",
+            "target": {"entity_id": f"light.light_{idx}"},
+            "data": {"brightness": 255, "transition": 2},
+        }
+        for idx in range(60)
+    ]
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.config.skip_pip = True
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await asyncio.gather(
+            area_registry.async_load(hass),
+            device_registry.async_load(hass),
+            entity_registry.async_load(hass),
+        )
+        assert await async_setup_component(
+            hass, "script", {"script": {"benchmark": {"sequence": sequence}}}
+        )
+
+        start = timer()
+
+        for _ in range(10 ** 3):
+            await hass.services.async_call("script", "benchmark", blocking=True)
+
+        assert count == 60 * 10 ** 3
+        return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
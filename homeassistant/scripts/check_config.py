@@ -11,7 +11,7 @@ import os
 from typing import Any, Callable
 from unittest.mock import patch
 
-from homeassistant import core
+from homeassistant import core, loader
 from homeassistant.config import get_default_config_dir
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.check_config import async_check_ha_config_file
@@ -190,7 +190,8 @@ def check(config_dir, secrets=False):
 
     if secrets:
         # Ensure !secrets point to the patched function
-        yaml_loader.SafeLineLoader.add_constructor("!secret", yaml_loader.secret_yaml)
+        for yaml_ldr in (yaml_loader.SafeLineLoader, yaml_loader.FastSafeLoader):
+            yaml_ldr.add_constructor("!secret", yaml_loader.secret_yaml)
 
     def secrets_proxy(*args):
         secrets = Secrets(*args)
@@ -218,9 +219,8 @@ def check(config_dir, secrets=False):
             pat.stop()
         if secrets:
             # Ensure !secrets point to the original function
-            yaml_loader.SafeLineLoader.add_constructor(
-                "!secret", yaml_loader.secret_yaml
-            )
+            for yaml_ldr in (yaml_loader.SafeLineLoader, yaml_loader.FastSafeLoader):
+                yaml_ldr.add_constructor("!secret", yaml_loader.secret_yaml)
 
     return res
 
@@ -229,6 +229,8 @@ async def async_check_config(config_dir):
     """Check the HA config."""
     hass = core.HomeAssistant()
     hass.config.config_dir = config_dir
+    # Do not write to the storage of the instance being checked
+    hass.data[loader.DATA_MANIFEST_INDEX] = None
     components = await async_check_ha_config_file(hass)
     await hass.async_stop(force=True)
     return components
@@ -4,11 +4,14 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Generator, Iterable
 import contextlib
+from datetime import datetime, timedelta
 import logging.handlers
 from timeit import default_timer as timer
 from types import ModuleType
 from typing import Callable
 
+import attr
+
 from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
 from homeassistant.const import (
@@ -52,6 +55,7 @@ BASE_PLATFORMS = {
 DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP_TIME = "setup_time"
+DATA_SETUP_TIMELINE = "setup_timeline"
 
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
@@ -59,6 +63,32 @@ DATA_DEPS_REQS = "deps_reqs_processed"
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
+PHASE_IMPORT = "import"
+PHASE_CONFIG = "config_validation"
+PHASE_SETUP = "setup"
+PHASE_CONFIG_ENTRIES = "config_entries"
+PHASE_PLATFORM = "platform"
+
+
+@attr.s(slots=True, frozen=True)
+class SetupPhase:
+    """Represent a timed phase of setting up an integration."""
+
+    phase: str = attr.ib()
+    started: datetime = attr.ib()
+    duration: timedelta = attr.ib()
+    # The entity domain for the platform phase
+    platform: str | None = attr.ib(default=None)
+
+    def as_dict(self) -> dict[str, str | float | None]:
+        """Return a dictionary representation of the phase."""
+        return {
+            "phase": self.phase,
+            "platform": self.platform,
+            "start": self.started.isoformat(),
+            "seconds": self.duration.total_seconds(),
+        }
+
 
 @core.callback
 def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: set[str]) -> None:
@@ -198,7 +228,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with async_record_setup_phase(hass, domain, PHASE_IMPORT):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -206,9 +237,10 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with async_record_setup_phase(hass, domain, PHASE_CONFIG):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.", integration.documentation)
@@ -245,8 +277,9 @@ async def _async_setup_component(
                 return False
 
             if task:
-                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-                    result = await task
+                with async_record_setup_phase(hass, domain, PHASE_SETUP):
+                    async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                        result = await task
         except asyncio.TimeoutError:
             _LOGGER.error(
                 "Setup of %s is taking longer than %s seconds."
@@ -279,12 +312,14 @@ async def _async_setup_component(
         await asyncio.sleep(0)
         await hass.config_entries.flow.async_wait_init_flow_finish(domain)
 
-        await asyncio.gather(
-            *[
-                entry.async_setup(hass, integration=integration)
-                for entry in hass.config_entries.async_entries(domain)
-            ]
-        )
+        if entries := hass.config_entries.async_entries(domain):
+            with async_record_setup_phase(hass, domain, PHASE_CONFIG_ENTRIES):
+                await asyncio.gather(
+                    *[
+                        entry.async_setup(hass, integration=integration)
+                        for entry in entries
+                    ]
+                )
 
         hass.config.components.add(domain)
 
@@ -471,10 +506,52 @@ def async_start_setup(hass: core.HomeAssistant, components: Iterable) -> Generat
     for unique, domain in unique_components.items():
         del setup_started[unique]
         if "." in domain:
-            _, integration = domain.split(".", 1)
+            platform, integration = domain.split(".", 1)
+            _async_add_setup_phase(
+                hass,
+                integration,
+                SetupPhase(PHASE_PLATFORM, started, time_taken, platform),
+            )
         else:
             integration = domain
         if integration in setup_time:
             setup_time[integration] += time_taken
         else:
             setup_time[integration] = time_taken
+
+
+@contextlib.contextmanager
+def async_record_setup_phase(
+    hass: core.HomeAssistant, integration: str, phase: str
+) -> Generator:
+    """Record when a setup phase of an integration starts and how long it takes."""
+    started = dt_util.utcnow()
+    try:
+        yield
+    finally:
+        _async_add_setup_phase(
+            hass, integration, SetupPhase(phase, started, dt_util.utcnow() - started)
+        )
+
+
+@core.callback
+def _async_add_setup_phase(
+    hass: core.HomeAssistant, integration: str, setup_phase: SetupPhase
+) -> None:
+    """Add a phase to the setup timeline of an integration.
+
+    Only phases of setting up Home Assistant are recorded, so the timeline
+    does not grow with every reload once Home Assistant is running.
+    """
+    if hass.state is core.CoreState.running:
+        return
+    timeline: dict[str, list[SetupPhase]] = hass.data.setdefault(
+        DATA_SETUP_TIMELINE, {}
+    )
+    timeline.setdefault(integration, []).append(setup_phase)
+
+
+@core.callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> dict[str, list[SetupPhase]]:
+    """Return the recorded setup phases per integration, in order of completion."""
+    return hass.data.get(DATA_SETUP_TIMELINE, {})  # type: ignore
@@ -0,0 +1,263 @@
+"""Aggregate values of group members incrementally.
+
+Each aggregate holds the contribution of every member. Updating a member
+only adjusts the running totals for that member instead of reducing the
+values of all members again.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import Counter
+from collections.abc import Hashable, Iterable, Mapping
+import math
+from typing import Any, Generic, TypeVar
+
+_T = TypeVar("_T")
+
+# Values removed from a numeric aggregate before its sum is computed again
+RESUM_INTERVAL = 64
+
+
+class _Aggregate(ABC, Generic[_T]):
+    """Base class holding the value of each member.
+
+    Subclasses keep their running totals up to date in _add and _remove.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        self._values: dict[Hashable, _T] = {}
+
+    def __len__(self) -> int:
+        """Return the number of members with a value."""
+        return len(self._values)
+
+    @property
+    def values(self) -> Mapping[Hashable, _T]:
+        """Return the value of each member."""
+        return self._values
+
+    def set_value(self, member: Hashable, value: _T) -> None:
+        """Set the value of a member."""
+        self.remove(member)
+        self._values[member] = value
+        self._add(member, value)
+
+    def remove(self, member: Hashable) -> None:
+        """Remove the value of a member."""
+        if member in self._values:
+            self._remove(member, self._values.pop(member))
+
+    @abstractmethod
+    def _add(self, member: Hashable, value: _T) -> None:
+        """Add the value of a member to the running totals."""
+
+    @abstractmethod
+    def _remove(self, member: Hashable, value: _T) -> None:
+        """Remove the value of a member from the running totals."""
+
+
+class NumericAggregate(_Aggregate[float]):
+    """Sum, mean, median, minimum and maximum of numeric values.
+
+    Values are kept sorted, so updates take O(log n) comparisons. Members
+    with equal values are ordered by the order they were first seen in, or
+    by the order of the members passed in. NaN can not be ordered and is
+    rejected.
+
+    The sum is kept up to date incrementally. It is computed again from the
+    values every RESUM_INTERVAL removals, so rounding errors and
+    cancellation do not accumulate.
+    """
+
+    def __init__(self, members: Iterable[Hashable] = ()) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self._order = {member: idx for idx, member in enumerate(members)}
+        self._sorted: list[tuple[float, int, Hashable]] = []
+        self._sum: float = 0
+        self._removals = 0
+
+    def set_value(self, member: Hashable, value: float) -> None:
+        """Set the value of a member."""
+        if isinstance(value, float) and math.isnan(value):
+            raise ValueError("NaN can not be aggregated")
+        if member not in self._order:
+            self._order[member] = len(self._order)
+        super().set_value(member, value)
+
+    def _add(self, member: Hashable, value: float) -> None:
+        """Add the value of a member to the running totals."""
+        self._sum += value
+        insort(self._sorted, (value, self._order[member], member))
+
+    def _remove(self, member: Hashable, value: float) -> None:
+        """Remove the value of a member from the running totals."""
+        del self._sorted[bisect_left(self._sorted, (value, self._order[member]))]
+        self._removals += 1
+        if not self._values or self._removals >= RESUM_INTERVAL:
+            self._sum = math.fsum(self._values.values())
+            self._removals = 0
+        else:
+            self._sum -= value
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of the values."""
+        return self._sum
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the values."""
+        if not self._values:
+            return None
+        return self._sum / len(self._values)
+
+    @property
+    def median(self) -> float | None:
+        """Return the median of the values."""
+        values = self._sorted
+        if not values:
+            return None
+        middle = len(values) // 2
+        if len(values) % 2:
+            return values[middle][0]
+        return (values[middle - 1][0] + values[middle][0]) / 2
+
+    @property
+    def min(self) -> float | None:
+        """Return the lowest value."""
+        return self._sorted[0][0] if self._sorted else None
+
+    @property
+    def max(self) -> float | None:
+        """Return the highest value."""
+        return self._sorted[-1][0] if self._sorted else None
+
+    @property
+    def min_member(self) -> Hashable | None:
+        """Return the first member with the lowest value."""
+        return self._sorted[0][2] if self._sorted else None
+
+    @property
+    def max_member(self) -> Hashable | None:
+        """Return the first member with the highest value."""
+        if not self._sorted:
+            return None
+        return self._sorted[bisect_left(self._sorted, (self._sorted[-1][0],))][2]
+
+
+class TupleMeanAggregate(_Aggregate[Iterable[float]]):
+    """Column wise mean of tuples of numbers, like colors."""
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        # Only the columns all values have are averaged
+        self._widths: Counter[int] = Counter()
+        # Sums of the columns, None when they need to be summed up again
+        self._sums: list[float] | None = None
+
+    def _add(self, member: Hashable, value: Iterable[float]) -> None:
+        """Add the value of a member to the running totals."""
+        self._update_sums(tuple(value), 1)
+
+    def _remove(self, member: Hashable, value: Iterable[float]) -> None:
+        """Remove the value of a member from the running totals."""
+        self._update_sums(tuple(value), -1)
+
+    def _update_sums(self, value: tuple[float, ...], sign: int) -> None:
+        """Add or subtract a value from the sums of the columns."""
+        width = min(self._widths, default=None)
+        self._widths[len(value)] += sign
+        if not self._widths[len(value)]:
+            del self._widths[len(value)]
+        if self._sums is None:
+            return
+        if min(self._widths, default=None) != width:
+            self._sums = None
+            return
+        for idx in range(len(self._sums)):
+            self._sums[idx] += sign * value[idx]
+
+    @property
+    def mean(self) -> tuple[float, ...] | None:
+        """Return the mean of the values."""
+        if not self._values:
+            return None
+        if self._sums is None:
+            self._sums = [sum(column) for column in zip(*self._values.values())]
+        count = len(self._values)
+        return tuple(column / count for column in self._sums)
+
+
+class CountAggregate(_Aggregate[Hashable]):
+    """Number of members per value."""
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self._counts: Counter[Hashable] = Counter()
+
+    def _add(self, member: Hashable, value: Hashable) -> None:
+        """Add the value of a member to the running totals."""
+        self._counts[value] += 1
+
+    def _remove(self, member: Hashable, value: Hashable) -> None:
+        """Remove the value of a member from the running totals."""
+        self._counts[value] -= 1
+        if not self._counts[value]:
+            del self._counts[value]
+
+    @property
+    def counts(self) -> Mapping[Hashable, int]:
+        """Return the number of members per value."""
+        return self._counts
+
+    def count(self, value: Hashable) -> int:
+        """Return the number of members with a value."""
+        return self._counts.get(value, 0)
+
+    def any(self, value: Hashable) -> bool:
+        """Return if any member has a value."""
+        return value in self._counts
+
+    def all(self, value: Hashable) -> bool:
+        """Return if all members have a value."""
+        return self._counts.get(value, 0) == len(self._values)
+
+    def most_common(self) -> Hashable | None:
+        """Return the value most members have."""
+        if not self._counts:
+            return None
+        return self._counts.most_common(1)[0][0]
+
+
+class UnionAggregate(_Aggregate[Iterable[Any]]):
+    """Union of collections of items."""
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self._counts: Counter[Any] = Counter()
+
+    def set_value(self, member: Hashable, value: Iterable[Any]) -> None:
+        """Set the items of a member."""
+        super().set_value(member, set(value))
+
+    def _add(self, member: Hashable, value: Iterable[Any]) -> None:
+        """Add the value of a member to the running totals."""
+        self._counts.update(value)
+
+    def _remove(self, member: Hashable, value: Iterable[Any]) -> None:
+        """Remove the value of a member from the running totals."""
+        self._counts.subtract(value)
+        for item in value:
+            if not self._counts[item]:
+                del self._counts[item]
+
+    @property
+    def union(self) -> set[Any]:
+        """Return the items of all members."""
+        return set(self._counts)
@@ -2,7 +2,7 @@
 from .const import SECRET_YAML
 from .dumper import dump, save_yaml
 from .input import UndefinedSubstitution, extract_inputs, substitute
-from .loader import Secrets, load_yaml, parse_yaml, secret_yaml
+from .loader import ParsedYamlCache, Secrets, load_yaml, parse_yaml, secret_yaml
 from .objects import Input
 
 __all__ = [
@@ -10,6 +10,7 @@ __all__ = [
     "Input",
     "dump",
     "save_yaml",
+    "ParsedYamlCache",
     "Secrets",
     "load_yaml",
     "secret_yaml",
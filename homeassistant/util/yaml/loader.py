@@ -2,15 +2,25 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+import copy
 import fnmatch
 import logging
 import os
 from pathlib import Path
-from typing import Any, TextIO, TypeVar, Union, overload
+import threading
+from typing import Any, TextIO, Tuple, TypeVar, Union, overload
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore
+
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import SECRET_YAML
@@ -25,11 +35,18 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class Secrets:
-    """Store secrets while loading YAML."""
+    """Store secrets while loading YAML.
+
+    YAML files loaded with secrets that have a parsed cache are looked up in
+    that cache first.
+    """
 
-    def __init__(self, config_dir: Path) -> None:
+    def __init__(
+        self, config_dir: Path, parsed_cache: ParsedYamlCache | None = None
+    ) -> None:
         """Initialize secrets."""
         self.config_dir = config_dir
+        self.parsed_cache = parsed_cache
         self._cache: dict[Path, dict[str, str]] = {}
 
     def get(self, requester_path: str, secret: str) -> str:
@@ -61,6 +78,7 @@ class Secrets:
     def _load_secret_yaml(self, secret_dir: Path) -> dict[str, str]:
         """Load the secrets yaml from path."""
         secret_path = secret_dir / SECRET_YAML
+        _record_dependency(str(secret_path))
 
         if secret_path in self._cache:
             return self._cache[secret_path]
@@ -106,8 +124,149 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+class FastSafeLoader(FastestAvailableSafeLoader):  # type: ignore[misc,valid-type]
+    """Loader class using libyaml when available.
+
+    Provenance is added by the same constructors as SafeLineLoader, based on
+    the start marks of the nodes.
+    """
+
+    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+        """Initialize a fast safe loader."""
+        super().__init__(stream)
+        if not hasattr(self, "name"):
+            self.name = getattr(stream, "name", "<file>")
+            self.stream = stream
+        self.secrets = secrets
+
+
+# Modification time and size of a path
+_Stat = Tuple[int, int]
+
+
+class _Dependencies:
+    """Files a parsed YAML file depends on, with their stats."""
+
+    __slots__ = ("files", "cacheable")
+
+    def __init__(self) -> None:
+        """Initialize the dependencies."""
+        self.files: dict[str, _Stat | None] = {}
+        self.cacheable = True
+
+
+_RECORDING = threading.local()
+
+
+def _stat(path: str) -> _Stat | None:
+    """Return the mtime and size of a path or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _active_dependencies() -> list[_Dependencies]:
+    """Return the dependencies recorded by the current thread."""
+    stack: list[_Dependencies] | None = getattr(_RECORDING, "stack", None)
+    if stack is None:
+        stack = _RECORDING.stack = []
+    return stack
+
+
+def _record_dependency(path: str) -> None:
+    """Record that the files being parsed depend on a path."""
+    if not (stack := _active_dependencies()):
+        return
+    stat = _stat(path)
+    for dependencies in stack:
+        dependencies.files[path] = stat
+
+
+def _record_uncacheable() -> None:
+    """Record that the files being parsed can not be cached."""
+    for dependencies in _active_dependencies():
+        dependencies.cacheable = False
+
+
+class ParsedYamlCache:
+    """Cache of parsed YAML files, kept in memory.
+
+    Entries are keyed by path and hold the mtimes and sizes of every file,
+    secrets file and included directory that went into them. An entry is
+    used only while all of those are unchanged. Files using !env_var are not
+    cached. Entries of files that no longer exist are pruned after every
+    load. The cache is never written to disk, as the parsed files hold the
+    values of their secrets.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: dict[str, tuple[dict[str, _Stat | None], JSON_TYPE]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, fname: str, load_file: Callable[[], JSON_TYPE]) -> JSON_TYPE:
+        """Return a parsed file from the cache or parse and cache it.
+
+        Every load returns fresh objects that callers are free to mutate.
+        """
+        with self._lock:
+            entry = self._entries.get(fname)
+
+        if entry is not None:
+            files, value = entry
+            if all(_stat(path) == stat for path, stat in files.items()):
+                for dependencies in _active_dependencies():
+                    dependencies.files.update(files)
+                return copy.deepcopy(value)
+
+        stack = _active_dependencies()
+        dependencies = _Dependencies()
+        stack.append(dependencies)
+        try:
+            _record_dependency(fname)
+            value = load_file()
+        finally:
+            stack.pop()
+
+        for parent in stack:
+            parent.files.update(dependencies.files)
+            parent.cacheable = parent.cacheable and dependencies.cacheable
+
+        # Files that can not be stat'ed can not be validated
+        if dependencies.cacheable and dependencies.files[fname] is not None:
+            with self._lock:
+                self._entries[fname] = (dependencies.files, copy.deepcopy(value))
+
+        if not stack:
+            self.prune()
+
+        return value
+
+    def prune(self) -> None:
+        """Forget the files that no longer exist."""
+        with self._lock:
+            paths = list(self._entries)
+        gone = [path for path in paths if not os.path.isfile(path)]
+        with self._lock:
+            for path in gone:
+                self._entries.pop(path, None)
+
+
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
+    parsed_cache = getattr(secrets, "parsed_cache", None)
+
+    if parsed_cache is None:
+        _record_dependency(fname)
+        return _load_yaml(fname, secrets)
+
+    return parsed_cache.load(fname, lambda: _load_yaml(fname, secrets))
+
+
+def _load_yaml(fname: str, secrets: Secrets | None) -> JSON_TYPE:
+    """Parse a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -122,7 +281,7 @@ def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TY
         # If configuration file is empty YAML returns None
         # We convert that to an empty dict
         return (
-            yaml.load(content, Loader=lambda stream: SafeLineLoader(stream, secrets))
+            yaml.load(content, Loader=lambda stream: FastSafeLoader(stream, secrets))
             or OrderedDict()
         )
     except yaml.YAMLError as exc:
@@ -186,6 +345,8 @@ def _is_file_valid(name: str) -> bool:
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
     for root, dirs, files in os.walk(directory, topdown=True):
+        # Files added to or removed from the directory change its mtime
+        _record_dependency(root)
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -289,6 +450,7 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
 
 def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
+    _record_uncacheable()
     args = node.value.split()
 
     # Check for a default value
@@ -308,19 +470,18 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     return loader.secrets.get(loader.name, node.value)
 
 
-SafeLineLoader.add_constructor("!include", _include_yaml)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-SafeLineLoader.add_constructor("!env_var", _env_var_yaml)
-SafeLineLoader.add_constructor("!secret", secret_yaml)
-SafeLineLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-SafeLineLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-SafeLineLoader.add_constructor("!input", Input.from_node)
+for _loader in (SafeLineLoader, FastSafeLoader):
+    _loader.add_constructor("!include", _include_yaml)
+    _loader.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
+    )
+    _loader.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
+    )
+    _loader.add_constructor("!env_var", _env_var_yaml)
+    _loader.add_constructor("!secret", secret_yaml)
+    _loader.add_constructor("!include_dir_list", _include_dir_list_yaml)
+    _loader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+    _loader.add_constructor("!include_dir_named", _include_dir_named_yaml)
+    _loader.add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
+    _loader.add_constructor("!input", Input.from_node)
@@ -71,6 +71,7 @@ NO_IOT_CLASS = [
     "lock",
     "logbook",
     "logger",
+    "loop_monitor",
     "lovelace",
     "mailbox",
     "map",
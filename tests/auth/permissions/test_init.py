@@ -0,0 +1,61 @@
+"""Tests for the permissions classes."""
+from unittest.mock import Mock
+
+from homeassistant.auth import auth_store
+from homeassistant.auth.permissions import PolicyPermissions
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from tests.common import MockConfigEntry
+
+
+def test_entity_checks_cached():
+    """Test entity checks are cached until invalidated."""
+    perm_lookup = Mock(spec=["track_permissions"])
+    perms = PolicyPermissions(
+        {"entities": {"entity_ids": {"light.kitchen": True}}}, perm_lookup
+    )
+    perm_lookup.track_permissions.assert_called_once_with(perms)
+
+    perms._cached_entity_func = entity_func = Mock(return_value=True)
+    assert perms.check_entity("light.kitchen", "read") is True
+    assert perms.check_entity("light.kitchen", "read") is True
+    assert perms.check_entity("light.kitchen", "control") is True
+    assert entity_func.call_count == 2
+
+    perms.invalidate_entities(["light.kitchen"])
+    assert perms.check_entity("light.kitchen", "read") is True
+    assert entity_func.call_count == 3
+
+
+async def test_entity_checks_follow_registries(hass, hass_storage):
+    """Test cached entity checks follow device and entity registry updates."""
+    store = auth_store.AuthStore(hass)
+    await store.async_get_users()
+
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    device_registry = dr.async_get(hass)
+    entity_registry = er.async_get(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    entry = entity_registry.async_get_or_create(
+        "light", "hue", "1234", device_id=device.id
+    )
+    await hass.async_block_till_done()
+
+    perms = PolicyPermissions(
+        {"entities": {"area_ids": {"kitchen": {"read": True}}}},
+        store._perm_lookup,
+    )
+    assert perms.check_entity(entry.entity_id, "read") is False
+
+    device_registry.async_update_device(device.id, area_id="kitchen")
+    await hass.async_block_till_done()
+    assert perms.check_entity(entry.entity_id, "read") is True
+
+    entity_registry.async_update_entity(entry.entity_id, new_entity_id="light.moved")
+    await hass.async_block_till_done()
+    assert perms.check_entity("light.moved", "read") is True
+    assert perms.check_entity(entry.entity_id, "read") is False
@@ -248,3 +248,40 @@ async def test_loading_race_condition(hass):
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_refresh_token_lookups(hass, hass_storage):
+    """Test refresh tokens are found by id and token until they are removed."""
+    store = auth_store.AuthStore(hass)
+    user = await store.async_create_user("Paulus")
+    token = await store.async_create_refresh_token(user, "http://localhost:8123/")
+    other_token = await store.async_create_refresh_token(user, "http://localhost:8123/")
+
+    assert await store.async_get_refresh_token(token.id) is token
+    assert await store.async_get_refresh_token_by_token(token.token) is token
+    assert await store.async_get_refresh_token_by_token("not-a-token") is None
+
+    await store.async_remove_refresh_token(token)
+    assert await store.async_get_refresh_token(token.id) is None
+    assert await store.async_get_refresh_token_by_token(token.token) is None
+    assert await store.async_get_refresh_token(other_token.id) is other_token
+
+    await store.async_remove_user(user)
+    assert await store.async_get_refresh_token(other_token.id) is None
+    assert await store.async_get_refresh_token_by_token(other_token.token) is None
+
+
+async def test_refresh_token_lookups_after_load(hass, hass_storage):
+    """Test refresh tokens loaded from storage can be looked up."""
+    store = auth_store.AuthStore(hass)
+    user = await store.async_create_user("Paulus")
+    token = await store.async_create_refresh_token(user, "http://localhost:8123/")
+    hass_storage[auth_store.STORAGE_KEY] = {
+        "version": auth_store.STORAGE_VERSION,
+        "data": store._data_to_save(),
+    }
+
+    store = auth_store.AuthStore(hass)
+    loaded = await store.async_get_refresh_token(token.id)
+    assert loaded.token == token.token
+    assert await store.async_get_refresh_token_by_token(token.token) is loaded
@@ -1,5 +1,6 @@
 """Tests for the Home Assistant auth module."""
 from datetime import timedelta
+import time
 from unittest.mock import Mock, patch
 
 import jwt
@@ -360,6 +361,51 @@ async def test_cannot_retrieve_expired_access_token(hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_verified_access_tokens_are_cached(hass):
+    """Test that verified access tokens are not decoded again."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert not mock_decode.called
+
+    with patch(
+        "homeassistant.auth.time.time",
+        return_value=time.time() + auth_const.ACCESS_TOKEN_CACHE_TTL + 1,
+    ), patch("homeassistant.auth.jwt.decode", return_value={}) as mock_decode:
+        await manager.async_validate_access_token(access_token)
+    assert mock_decode.called
+
+
+async def test_cached_access_tokens_revoked(hass):
+    """Test that cached access tokens stop working when revoked."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_cached_access_tokens_deactivated_user(hass):
+    """Test that cached access tokens stop working when a user is deactivated."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_update_user(user, is_active=False)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
 async def test_generating_system_user(hass):
     """Test that we can add a system user."""
     events = []
@@ -113,6 +113,8 @@ def get_test_home_assistant():
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     hass = loop.run_until_complete(async_test_home_assistant(loop))
+    # Storage is not mocked, keep the manifest index out of the config dir
+    hass.data[loader.DATA_MANIFEST_INDEX] = None
 
     loop_stop_event = threading.Event()
 
@@ -219,6 +219,29 @@ async def test_doorbell_event(hass, aioclient_mock):
 
     assert len(aioclient_mock.mock_calls) == 2
 
+    # A press is reported even if the doorbell is released before the report
+    hass.states.async_set(
+        "binary_sensor.test_doorbell",
+        "off",
+        {"friendly_name": "Test Doorbell Sensor", "device_class": "occupancy"},
+    )
+    hass.states.async_set(
+        "binary_sensor.test_doorbell",
+        "on",
+        {"friendly_name": "Test Doorbell Sensor", "device_class": "occupancy"},
+    )
+    hass.states.async_set(
+        "binary_sensor.test_doorbell",
+        "off",
+        {"friendly_name": "Test Doorbell Sensor", "device_class": "occupancy"},
+    )
+
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 3
+    call_json = aioclient_mock.mock_calls[2][2]
+    assert call_json["event"]["header"]["name"] == "DoorbellPress"
+
 
 async def test_proactive_mode_filter_states(hass, aioclient_mock):
     """Test all the cases that filter states."""
@@ -257,7 +280,7 @@ async def test_proactive_mode_filter_states(hass, aioclient_mock):
 
     # unsupported entity should not report
     hass.states.async_set(
-        "binary_sensor.test_contact",
+        "binary_sensor.test_unsupported",
         "on",
         {"friendly_name": "Test Contact Sensor", "device_class": "door"},
     )
@@ -270,7 +293,7 @@ async def test_proactive_mode_filter_states(hass, aioclient_mock):
 
     # Not exposed by config should not report
     hass.states.async_set(
-        "binary_sensor.test_contact",
+        "binary_sensor.test_not_exposed",
         "off",
         {"friendly_name": "Test Contact Sensor", "device_class": "door"},
     )
@@ -673,6 +673,7 @@ async def test_automation_stops(hass, calls, service):
             blocking=True,
         )
     else:
+        config[automation.DOMAIN]["description"] = "changed"
         with patch(
             "homeassistant.config.load_yaml_config_file",
             autospec=True,
@@ -688,6 +689,88 @@ async def test_automation_stops(hass, calls, service):
     assert len(calls) == (1 if service == "turn_off_no_stop" else 0)
 
 
+async def test_reload_keeps_unchanged_automations(hass, calls):
+    """Test reloading only recreates automations whose config changed."""
+    hello = {
+        "alias": "hello",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [
+            {"event": "running"},
+            {"wait_template": "{{ is_state('test.entity', 'goodbye') }}"},
+            {"service": "test.automation"},
+        ],
+    }
+    bye = {
+        "alias": "bye",
+        "trigger": {"platform": "event", "event_type": "test_event_2"},
+        "action": {"service": "test.automation"},
+    }
+    assert await async_setup_component(
+        hass, automation.DOMAIN, {automation.DOMAIN: [hello, bye]}
+    )
+    component = hass.data[automation.DOMAIN]
+    hello_entity = component.get_entity("automation.hello")
+    bye_entity = component.get_entity("automation.bye")
+
+    running = asyncio.Event()
+
+    @callback
+    def running_cb(event):
+        running.set()
+
+    hass.bus.async_listen_once("running", running_cb)
+    hass.states.async_set("test.entity", "hello")
+    hass.bus.async_fire("test_event")
+    await running.wait()
+
+    reload_events = async_capture_events(hass, EVENT_AUTOMATION_RELOADED)
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={
+            automation.DOMAIN: [
+                hello,
+                {**bye, "action": [{"service": "test.automation"}] * 2},
+                {
+                    "alias": "new",
+                    "trigger": {"platform": "event", "event_type": "test_event_3"},
+                    "action": {"service": "test.automation"},
+                },
+            ]
+        },
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    # The unchanged automation is kept, including its running actions
+    assert component.get_entity("automation.hello") is hello_entity
+    assert component.get_entity("automation.bye") is not bye_entity
+    assert hass.states.get("automation.new") is not None
+    assert reload_events[0].data == {
+        "created": ["automation.bye", "automation.new"],
+        "removed": ["automation.bye"],
+        "unchanged": ["automation.hello"],
+    }
+
+    hass.states.async_set("test.entity", "goodbye")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    hass.bus.async_fire("test_event_2")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={automation.DOMAIN: [hello]},
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert component.get_entity("automation.hello") is hello_entity
+    assert hass.states.get("automation.bye") is None
+    assert hass.states.get("automation.new") is None
+
+
 async def test_automation_restore_state(hass):
     """Ensure states are restored on startup."""
     time = dt_util.utcnow()
@@ -1,9 +1,10 @@
-"""Test HomeKit img_util module."""
+"""Test camera img_util module."""
 from unittest.mock import patch
 
 from homeassistant.components.camera import Image
-from homeassistant.components.homekit.img_util import (
+from homeassistant.components.camera.img_util import (
     TurboJPEGSingleton,
+    jpeg_image_size,
     scale_jpeg_camera_image,
 )
 
@@ -42,6 +43,18 @@ def test_scale_jpeg_camera_image():
     assert jpeg_bytes == EMPTY_8_6_JPEG
 
 
+def test_jpeg_image_size():
+    """Test we can read the size of a jpeg image."""
+    with patch("turbojpeg.TurboJPEG", return_value=False):
+        TurboJPEGSingleton()
+        assert jpeg_image_size(EMPTY_16_12_JPEG) is None
+
+    turbo_jpeg = mock_turbo_jpeg(first_width=16, first_height=12)
+    with patch("turbojpeg.TurboJPEG", return_value=turbo_jpeg):
+        TurboJPEGSingleton()
+        assert jpeg_image_size(EMPTY_16_12_JPEG) == (16, 12)
+
+
 def test_turbojpeg_load_failure():
     """Handle libjpegturbo not being installed."""
 
@@ -2,19 +2,25 @@
 import asyncio
 import base64
 import io
-from unittest.mock import Mock, PropertyMock, mock_open, patch
+from unittest.mock import AsyncMock, Mock, PropertyMock, mock_open, patch
 
 import pytest
 
 from homeassistant.components import camera
-from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
+from homeassistant.components.camera.const import (
+    DOMAIN,
+    PREF_PRELOAD_STREAM,
+    PREF_SNAPSHOT_MAX_AGE,
+)
 from homeassistant.components.camera.prefs import CameraEntityPreferences
+from homeassistant.components.camera.snapshot import MAX_SCALED_IMAGES
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     EVENT_HOMEASSISTANT_START,
     HTTP_BAD_GATEWAY,
+    HTTP_BAD_REQUEST,
     HTTP_OK,
 )
 from homeassistant.exceptions import HomeAssistantError
@@ -115,6 +121,148 @@ async def test_get_image_fails(hass, image_mock_url):
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+async def test_get_image_coalesces_concurrent_requests(hass, image_mock_url):
+    """Concurrent image requests share a single camera fetch."""
+    fetched = asyncio.Event()
+
+    async def _slow_image(*_):
+        await fetched.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_slow_image,
+    ) as mock_camera_image:
+        tasks = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        fetched.set()
+        images = await asyncio.gather(*tasks)
+
+    assert len(mock_camera_image.mock_calls) == 1
+    assert all(image.content == b"Test" for image in images)
+
+
+async def test_get_image_snapshot_max_age(hass, image_mock_url):
+    """Images are reused within the configured snapshot max age."""
+    common.mock_camera_prefs(hass, "camera.demo_camera", {PREF_SNAPSHOT_MAX_AGE: 60})
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ) as mock_camera_image:
+        await camera.async_get_image(hass, "camera.demo_camera")
+        await camera.async_get_image(hass, "camera.demo_camera")
+
+    assert len(mock_camera_image.mock_calls) == 1
+
+    common.mock_camera_prefs(hass, "camera.demo_camera", {PREF_SNAPSHOT_MAX_AGE: 0})
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ) as mock_camera_image:
+        await camera.async_get_image(hass, "camera.demo_camera")
+
+    assert len(mock_camera_image.mock_calls) == 1
+
+
+async def test_get_image_scaled(hass, image_mock_url):
+    """Scaled images are produced once per image and size."""
+    common.mock_camera_prefs(hass, "camera.demo_camera", {PREF_SNAPSHOT_MAX_AGE: 60})
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ), patch(
+        "homeassistant.components.camera.snapshot.jpeg_image_size",
+        return_value=(16, 12),
+    ), patch(
+        "homeassistant.components.camera.snapshot.scale_jpeg_camera_image",
+        return_value=b"Scaled",
+    ) as mock_scale:
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=8, height=6
+        )
+        assert image.content == b"Scaled"
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=8, height=6
+        )
+        assert image.content == b"Scaled"
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Test"
+
+    assert len(mock_scale.mock_calls) == 1
+
+
+async def test_get_image_scaled_cache_bounded(hass, image_mock_url):
+    """Only a few scaled variants are kept and failures are not kept."""
+    common.mock_camera_prefs(hass, "camera.demo_camera", {PREF_SNAPSHOT_MAX_AGE: 60})
+    demo_camera = hass.data[DOMAIN].get_entity("camera.demo_camera")
+    cache = demo_camera._snapshot_cache
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ), patch(
+        "homeassistant.components.camera.snapshot.jpeg_image_size",
+        return_value=(640, 480),
+    ), patch(
+        "homeassistant.components.camera.snapshot.scale_jpeg_camera_image",
+        return_value=b"Scaled",
+    ) as mock_scale:
+        # Not scaled up
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=640, height=480
+        )
+        assert image.content == b"Test"
+        assert not mock_scale.called
+
+        for width in range(1, MAX_SCALED_IMAGES + 4):
+            await camera.async_get_image(
+                hass, "camera.demo_camera", width=width, height=1
+            )
+        assert len(cache._scaled) == MAX_SCALED_IMAGES
+
+        with pytest.raises(ValueError):
+            await cache.async_get_image(60, 0, 1)
+
+        mock_scale.side_effect = OSError
+        with pytest.raises(OSError):
+            await cache.async_get_image(60, 100, 100)
+        await hass.async_block_till_done()
+        assert (100, 100) not in cache._scaled
+
+        mock_scale.side_effect = None
+        assert await cache.async_get_image(60, 100, 100) == b"Scaled"
+
+
+async def test_get_image_from_stream(hass, image_mock_url):
+    """Cameras can take still images from a running stream."""
+    mock_stream = Mock()
+    mock_stream.async_get_image = AsyncMock(return_value=b"Keyframe")
+    demo_camera = hass.data[DOMAIN].get_entity("camera.demo_camera")
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.use_stream_for_stills",
+        new_callable=PropertyMock,
+        return_value=True,
+    ), patch.object(demo_camera, "stream", mock_stream), patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ) as mock_camera_image:
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Keyframe"
+        assert not mock_camera_image.called
+
+        # Fall back to the camera when the stream has no keyframe yet
+        mock_stream.async_get_image.return_value = None
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Test"
+
+
 async def test_snapshot_service(hass, mock_camera):
     """Test snapshot service."""
     mopen = mock_open()
@@ -241,6 +389,19 @@ async def test_websocket_update_prefs(
         == setup_camera_prefs[PREF_PRELOAD_STREAM]
     )
 
+    await client.send_json(
+        {
+            "id": 9,
+            "type": "camera/update_prefs",
+            "entity_id": "camera.demo_camera",
+            "snapshot_max_age": 5,
+        }
+    )
+    response = await client.receive_json()
+
+    assert response["success"]
+    assert response["result"][PREF_SNAPSHOT_MAX_AGE] == 5.0
+
 
 async def test_play_stream_service_no_source(hass, mock_camera, mock_stream):
     """Test camera play_stream service."""
@@ -375,3 +536,28 @@ async def test_camera_proxy_stream(hass, mock_camera, hass_client):
     ):
         response = await client.get("/api/camera_proxy_stream/camera.demo_camera")
         assert response.status == HTTP_BAD_GATEWAY
+
+
+async def test_camera_proxy_image_scaled(hass, mock_camera, hass_client):
+    """Test the camera proxy serves scaled images."""
+
+    client = await hass_client()
+
+    with patch(
+        "homeassistant.components.camera.snapshot.jpeg_image_size",
+        return_value=(16, 12),
+    ), patch(
+        "homeassistant.components.camera.snapshot.scale_jpeg_camera_image",
+        return_value=b"Scaled",
+    ):
+        response = await client.get(
+            "/api/camera_proxy/camera.demo_camera?width=8&height=6"
+        )
+        assert response.status == HTTP_OK
+        assert await response.read() == b"Scaled"
+
+    response = await client.get("/api/camera_proxy/camera.demo_camera?width=wide")
+    assert response.status == HTTP_BAD_REQUEST
+
+    response = await client.get("/api/camera_proxy/camera.demo_camera?width=0&height=6")
+    assert response.status == HTTP_BAD_REQUEST
@@ -7,10 +7,12 @@ from homeassistant.components.light import (
     ATTR_BRIGHTNESS_PCT,
     ATTR_COLOR_TEMP,
     ATTR_EFFECT,
+    ATTR_HS_COLOR,
     ATTR_KELVIN,
     ATTR_MAX_MIREDS,
     ATTR_MIN_MIREDS,
     ATTR_RGB_COLOR,
+    ATTR_RGBW_COLOR,
     ATTR_XY_COLOR,
     DOMAIN as LIGHT_DOMAIN,
     SERVICE_TURN_OFF,
@@ -118,3 +120,35 @@ async def test_turn_off_without_entity_id(hass):
 
     state = hass.states.get(ENTITY_LIGHT)
     assert state.state == STATE_OFF
+
+
+async def test_turn_on_lights_at_once(hass):
+    """Test the demo lights are switched in one batch."""
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        {
+            ATTR_ENTITY_ID: ["light.bed_light", "light.office_rgbw_lights"],
+            ATTR_BRIGHTNESS_PCT: 50,
+            ATTR_RGB_COLOR: (0, 0, 255),
+        },
+        blocking=True,
+    )
+
+    state = hass.states.get("light.bed_light")
+    assert state.state == STATE_ON
+    assert state.attributes.get(ATTR_BRIGHTNESS) == 128
+    assert state.attributes.get(ATTR_HS_COLOR) == (240, 100)
+    state = hass.states.get("light.office_rgbw_lights")
+    assert state.attributes.get(ATTR_BRIGHTNESS) == 128
+    assert state.attributes.get(ATTR_RGBW_COLOR) == (0, 0, 255, 0)
+
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ["light.bed_light", "light.office_rgbw_lights"]},
+        blocking=True,
+    )
+
+    assert hass.states.get("light.bed_light").state == STATE_OFF
+    assert hass.states.get("light.office_rgbw_lights").state == STATE_OFF
@@ -108,7 +108,17 @@ async def test_reading_yaml_config(hass, yaml_devices, enable_custom_integration
         icon="mdi:kettle",
     )
     await hass.async_add_executor_job(
-        legacy.update_config, yaml_devices, dev_id, device
+        legacy._append_yaml_devices,
+        yaml_devices,
+        {
+            dev_id: {
+                "name": device.name,
+                "mac": device.mac,
+                "icon": device.icon,
+                "picture": device.config_picture,
+                "track": device.track,
+            }
+        },
     )
     assert await async_setup_component(hass, device_tracker.DOMAIN, TEST_PLATFORM)
     config = (await legacy.async_load_config(yaml_devices, hass, device.consider_home))[
@@ -425,7 +435,7 @@ async def test_see_state(hass, yaml_devices, enable_custom_integrations):
     common.async_see(hass, **params)
     await hass.async_block_till_done()
 
-    config = await legacy.async_load_config(yaml_devices, hass, timedelta(seconds=0))
+    config = await legacy.async_load_known_devices(hass, timedelta(seconds=0))
     assert len(config) == 1
 
     state = hass.states.get("device_tracker.example_com")
@@ -539,6 +549,103 @@ async def test_see_failures(mock_warning, hass, mock_device_tracker_conf):
     assert len(devices) == 4
 
 
+async def test_known_devices_stored(hass, hass_storage):
+    """Test new devices are saved to storage instead of the YAML file."""
+    hass_storage[legacy.STORAGE_KEY] = {
+        "version": legacy.STORAGE_VERSION,
+        "key": legacy.STORAGE_KEY,
+        "data": {
+            "devices": {
+                "phone": {
+                    "name": "Phone",
+                    "mac": "AA:BB:CC:DD:EE:01",
+                    "icon": None,
+                    "picture": None,
+                    "track": True,
+                },
+                "configured": {
+                    "name": "Configured",
+                    "mac": "AA:BB:CC:DD:EE:02",
+                    "icon": None,
+                    "picture": None,
+                    "track": True,
+                },
+            }
+        },
+    }
+    path = hass.config.path(legacy.YAML_DEVICES)
+    files = {path: "laptop:\n  name: Laptop\n  mac: AA:BB:CC:DD:EE:02\n"}
+
+    with patch_yaml_files(files), patch(
+        "homeassistant.components.device_tracker.legacy._append_yaml_devices"
+    ) as mock_append_yaml_devices:
+        assert await async_setup_component(hass, device_tracker.DOMAIN, {})
+        await hass.async_block_till_done()
+
+        # The stored device configured in YAML is replaced by it
+        assert hass.states.get("device_tracker.phone").name == "Phone"
+        assert hass.states.get("device_tracker.configured") is None
+
+        common.async_see(hass, mac="AA:BB:CC:DD:EE:03", host_name="tablet")
+        common.async_see(hass, mac="AA:BB:CC:DD:EE:04", host_name="watch")
+        await hass.async_block_till_done()
+
+    assert not mock_append_yaml_devices.called
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=legacy.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert set(hass_storage[legacy.STORAGE_KEY]["data"]["devices"]) == {
+        "phone",
+        "tablet",
+        "watch",
+    }
+    assert hass_storage[legacy.STORAGE_KEY]["data"]["devices"]["tablet"] == {
+        "name": "tablet",
+        "mac": "AA:BB:CC:DD:EE:03",
+        "icon": None,
+        "picture": None,
+        "track": True,
+    }
+
+
+async def test_export_known_devices(hass, hass_storage, yaml_devices):
+    """Test stored devices are moved to the YAML file by a service."""
+    hass_storage[legacy.STORAGE_KEY] = {
+        "version": legacy.STORAGE_VERSION,
+        "key": legacy.STORAGE_KEY,
+        "data": {
+            "devices": {
+                "phone": {
+                    "name": "Phone",
+                    "mac": "AA:BB:CC:DD:EE:01",
+                    "icon": None,
+                    "picture": None,
+                    "track": True,
+                },
+            }
+        },
+    }
+    assert await async_setup_component(hass, device_tracker.DOMAIN, {})
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        device_tracker.DOMAIN, legacy.SERVICE_EXPORT_KNOWN_DEVICES, blocking=True
+    )
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=legacy.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert hass_storage[legacy.STORAGE_KEY]["data"]["devices"] == {}
+
+    devices = await legacy.async_load_config(yaml_devices, hass, timedelta(seconds=180))
+    assert len(devices) == 1
+    assert devices[0].dev_id == "phone"
+    assert devices[0].mac == "AA:BB:CC:DD:EE:01"
+    assert devices[0].name == "Phone"
+
+
 async def test_async_added_to_hass(hass):
     """Test restoring state."""
     attr = {
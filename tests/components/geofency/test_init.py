@@ -1,7 +1,5 @@
 """The tests for the Geofency device tracker platform."""
 # pylint: disable=redefined-outer-name
-from unittest.mock import patch
-
 import pytest
 
 from homeassistant import config_entries, data_entry_flow
@@ -127,8 +125,7 @@ async def geofency_client(loop, hass, aiohttp_client):
     )
     await hass.async_block_till_done()
 
-    with patch("homeassistant.components.device_tracker.legacy.update_config"):
-        return await aiohttp_client(hass.http.app)
+    return await aiohttp_client(hass.http.app)
 
 
 @pytest.fixture(autouse=True)
@@ -58,7 +58,21 @@ async def test_google_entity_sync_serialize_with_local_sdk(hass):
             "uuid": "abcdef",
         }
 
+        # The local connection details invalidate the cached serialization
+        hass.http.server_port = 4321
+        serialized = await entity.sync_serialize(None)
+        assert serialized["customData"]["httpPort"] == 4321
+
+        await async_process_ha_core_config(
+            hass,
+            {"external_url": "https://otherhost:4321"},
+        )
+        serialized = await entity.sync_serialize(None)
+        assert serialized["customData"]["baseUrl"] == "https://otherhost:4321"
+
     for device_type in NOT_EXPOSE_LOCAL:
+        # The patched type is not part of what invalidates the cache
+        config.serialize_cache.sync.clear()
         with patch(
             "homeassistant.components.google_assistant.helpers.get_google_type",
             return_value=device_type,
@@ -68,6 +82,50 @@ async def test_google_entity_sync_serialize_with_local_sdk(hass):
             assert "customData" not in serialized
 
 
+async def test_google_entity_serialize_cached(hass):
+    """Test serializations are reused until what they are built from changes."""
+    ent_reg = await hass.helpers.entity_registry.async_get_registry()
+    ent_reg.async_get_or_create(
+        "light", "test", "ceiling", suggested_object_id="ceiling_lights"
+    )
+    hass.states.async_set("light.ceiling_lights", "off")
+    config = MockConfig(hass=hass)
+
+    entity = helpers.GoogleEntity(hass, config, hass.states.get("light.ceiling_lights"))
+    synced = await entity.sync_serialize("agent")
+    queried = entity.query_serialize()
+    assert await entity.sync_serialize("agent") is synced
+    assert entity.query_serialize() is queried
+
+    # A state change invalidates the query, but not the sync serialization
+    hass.states.async_set("light.ceiling_lights", "on")
+    entity = helpers.GoogleEntity(hass, config, hass.states.get("light.ceiling_lights"))
+    assert await entity.sync_serialize("agent") is synced
+    assert entity.query_serialize() == {"on": True, "online": True}
+
+    # Changed attributes, registry entries and agents invalidate sync
+    hass.states.async_set(
+        "light.ceiling_lights", "on", {"friendly_name": "Ceiling lights"}
+    )
+    entity = helpers.GoogleEntity(hass, config, hass.states.get("light.ceiling_lights"))
+    synced = await entity.sync_serialize("agent")
+    assert synced["name"] == {"name": "Ceiling lights"}
+
+    ent_reg.async_update_entity("light.ceiling_lights", area_id="living_room")
+    assert await entity.sync_serialize("agent") is not synced
+    synced = await entity.sync_serialize("agent")
+    assert await entity.sync_serialize("other_agent") is not synced
+
+    assert "light.ceiling_lights" in config.serialize_cache.query
+    config.serialize_cache.async_prune(["light.ceiling_lights"])
+    assert "light.ceiling_lights" in config.serialize_cache.sync
+    assert "light.ceiling_lights" in config.serialize_cache.query
+
+    config.serialize_cache.async_prune([])
+    assert config.serialize_cache.sync == {}
+    assert config.serialize_cache.query == {}
+
+
 async def test_config_local_sdk(hass, hass_client):
     """Test the local SDK."""
     command_events = async_capture_events(hass, EVENT_COMMAND_RECEIVED)
@@ -1,6 +1,4 @@
 """The tests the for GPSLogger device tracker platform."""
-from unittest.mock import patch
-
 import pytest
 
 from homeassistant import config_entries, data_entry_flow
@@ -39,8 +37,7 @@ async def gpslogger_client(loop, hass, aiohttp_client):
 
     await hass.async_block_till_done()
 
-    with patch("homeassistant.components.device_tracker.legacy.update_config"):
-        return await aiohttp_client(hass.http.app)
+    return await aiohttp_client(hass.http.app)
 
 
 @pytest.fixture(autouse=True)
@@ -9,7 +9,10 @@ import pytest
 
 from homeassistant import config as hass_config
 from homeassistant.components.history_stats import DOMAIN
-from homeassistant.components.history_stats.sensor import HistoryStatsSensor
+from homeassistant.components.history_stats.sensor import (
+    HistoryStatsSensor,
+    HistoryStatsWindow,
+)
 from homeassistant.const import SERVICE_RELOAD, STATE_UNKNOWN
 import homeassistant.core as ha
 from homeassistant.helpers.template import Template
@@ -352,6 +355,90 @@ async def test_measure_multiple(hass):
     assert hass.states.get("sensor.sensor4").state == "50.0"
 
 
+def test_window_slides():
+    """Test changes sliding out of a window are subtracted."""
+    window = HistoryStatsWindow(0, True)
+    window.add_change(10, False)
+    window.add_change(20, True)
+    window.add_change(25, True)
+    window.add_change(30, False)
+    assert window.elapsed(100) == 20
+    assert window.count == 1
+
+    window.slide(15)
+    assert window.elapsed(100) == 10
+    assert window.count == 1
+
+    window.slide(25)
+    assert window.elapsed(100) == 5
+    assert window.count == 0
+
+    window.add_change(40, True)
+    assert window.elapsed(50) == 15
+    assert window.count == 1
+
+    window.slide(45)
+    assert window.elapsed(50) == 5
+    assert window.count == 0
+
+
+async def test_measure_incremental(hass):
+    """Test state changes update the sensor without querying the recorder."""
+    await async_init_recorder_component(hass)
+
+    t0 = dt_util.utcnow() - timedelta(minutes=40)
+    t1 = t0 + timedelta(minutes=20)
+    hass.states.async_set("binary_sensor.test_id", "off")
+
+    fake_states = {
+        "binary_sensor.test_id": [
+            ha.State("binary_sensor.test_id", "on", last_changed=t0),
+            ha.State("binary_sensor.test_id", "off", last_changed=t1),
+        ]
+    }
+
+    await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "history_stats",
+                    "entity_id": "binary_sensor.test_id",
+                    "name": "sensor1",
+                    "state": "on",
+                    "start": "{{ as_timestamp(now()) - 3600 }}",
+                    "end": "{{ now() }}",
+                    "type": "count",
+                },
+            ]
+        },
+    )
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        return_value=fake_states,
+    ) as mock_changes, patch(
+        "homeassistant.components.recorder.history.get_state", return_value=None
+    ):
+        await hass.helpers.entity_component.async_update_entity("sensor.sensor1")
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "1"
+        assert hass.states.get("sensor.sensor1").attributes["value"] == "20m"
+        call_count = mock_changes.call_count
+
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await hass.async_block_till_done()
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await hass.async_block_till_done()
+        await hass.helpers.entity_component.async_update_entity("sensor.sensor1")
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "2"
+    assert hass.states.get("sensor.sensor1").attributes["value"] == "20m"
+    assert mock_changes.call_count == call_count
+
+
 async def async_test_measure(hass):
     """Test the history statistics sensor measure."""
     t0 = dt_util.utcnow() - timedelta(minutes=40)
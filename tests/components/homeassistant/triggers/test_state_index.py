@@ -0,0 +1,97 @@
+"""The tests for the shared state trigger index."""
+from homeassistant.components.homeassistant.triggers.state_index import (
+    DATA_STATE_TRIGGER_INDEX,
+    async_track_state_trigger,
+)
+from homeassistant.const import MATCH_ALL
+from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
+
+
+async def test_routes_matching_changes(hass):
+    """Test listeners are only called for changes they match."""
+    hass.states.async_set("light.kitchen", "off", {"brightness": 10})
+    calls = {"on": [], "off": [], "any": [], "brightness": []}
+
+    def listener(key):
+        return lambda event, old, new: calls[key].append((old, new))
+
+    unsubs = [
+        async_track_state_trigger(
+            hass, ["light.kitchen"], None, MATCH_ALL, "on", True, listener("on")
+        ),
+        async_track_state_trigger(
+            hass, ["light.kitchen"], None, "on", ["off"], True, listener("off")
+        ),
+        async_track_state_trigger(
+            hass, "light.kitchen", None, MATCH_ALL, MATCH_ALL, False, listener("any")
+        ),
+        async_track_state_trigger(
+            hass,
+            ["light.kitchen"],
+            "brightness",
+            MATCH_ALL,
+            MATCH_ALL,
+            True,
+            listener("brightness"),
+        ),
+    ]
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", "on", {"brightness": 20})
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", "off", {"brightness": 20})
+    await hass.async_block_till_done()
+
+    assert calls == {
+        "on": [("off", "on")],
+        "off": [("on", "off")],
+        "any": [("off", "on"), ("on", "on"), ("on", "off")],
+        "brightness": [(10, 20)],
+    }
+
+    for unsub in unsubs:
+        unsub()
+
+    assert hass.data[DATA_STATE_TRIGGER_INDEX]._entities == {}
+    assert "light.kitchen" not in hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+
+
+async def test_identical_triggers_share_match(hass):
+    """Test identical trigger definitions are evaluated once."""
+    calls = []
+    unsub_1 = async_track_state_trigger(
+        hass,
+        ["sensor.one"],
+        None,
+        ["a", "b"],
+        "c",
+        True,
+        lambda event, old, new: calls.append(1),
+    )
+    unsub_2 = async_track_state_trigger(
+        hass,
+        ["sensor.one"],
+        None,
+        ["b", "a"],
+        "c",
+        True,
+        lambda event, old, new: calls.append(2),
+    )
+
+    index = hass.data[DATA_STATE_TRIGGER_INDEX]
+    assert len(index._entities["sensor.one"][None].matches) == 1
+
+    hass.states.async_set("sensor.one", "a")
+    hass.states.async_set("sensor.one", "c")
+    await hass.async_block_till_done()
+    assert calls == [1, 2]
+
+    unsub_1()
+    hass.states.async_set("sensor.one", "b")
+    hass.states.async_set("sensor.one", "c")
+    await hass.async_block_till_done()
+    assert calls == [1, 2, 2]
+
+    unsub_2()
+    assert index._entities == {}
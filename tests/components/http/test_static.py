@@ -0,0 +1,162 @@
+"""The tests for http static files."""
+import gzip
+import mimetypes
+from unittest.mock import patch
+
+from aiohttp import hdrs
+import pytest
+
+from homeassistant.components.http import static
+from homeassistant.components.http.static import (
+    CACHE_HEADERS,
+    COMPRESS_MIN_SIZE,
+    IMMUTABLE_CACHE_HEADERS,
+)
+from homeassistant.setup import async_setup_component
+
+CONTENT = "console.log('hello');\n" * (COMPRESS_MIN_SIZE // 10)
+
+
+@pytest.fixture
+async def static_dir(hass, tmp_path):
+    """Set up http with a static folder."""
+    assert await async_setup_component(hass, "http", {})
+    (tmp_path / "app.js").write_text(CONTENT)
+    (tmp_path / "tiny.js").write_text("1;")
+    return tmp_path
+
+
+async def test_serve_precompressed_siblings(hass, aiohttp_client, static_dir):
+    """Test brotli and gzip siblings are preferred when accepted."""
+    (static_dir / "app.js.br").write_bytes(b"brotli")
+    (static_dir / "app.js.gz").write_bytes(gzip.compress(CONTENT.encode()))
+    hass.http.register_static_path("/static", str(static_dir))
+    client = await aiohttp_client(hass.http.app, auto_decompress=False)
+
+    resp = await client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip, deflate, br"}
+    )
+    assert resp.status == 200
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "br"
+    assert resp.headers[hdrs.CONTENT_TYPE] == mimetypes.guess_type("app.js")[0]
+    assert resp.headers[hdrs.VARY] == hdrs.ACCEPT_ENCODING
+    assert await resp.read() == b"brotli"
+
+    resp = await client.get("/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip"})
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
+    assert gzip.decompress(await resp.read()).decode() == CONTENT
+
+    resp = await client.get("/static/app.js", headers={hdrs.ACCEPT_ENCODING: ""})
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert await resp.text() == CONTENT
+
+
+async def test_compressed_variant_generated(hass, aiohttp_client, static_dir):
+    """Test gzip variants are generated for files without siblings."""
+    hass.http.register_static_path("/static", str(static_dir))
+    client = await aiohttp_client(hass.http.app)
+
+    resp = await client.get("/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip"})
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert resp.headers[hdrs.CACHE_CONTROL] == CACHE_HEADERS[hdrs.CACHE_CONTROL]
+    assert await resp.text() == CONTENT
+    await hass.async_block_till_done()
+
+    resp = await client.get("/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip"})
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
+    assert await resp.text() == CONTENT
+
+    resp = await client.get("/static/tiny.js", headers={hdrs.ACCEPT_ENCODING: "gzip"})
+    await hass.async_block_till_done()
+    resp = await client.get("/static/tiny.js", headers={hdrs.ACCEPT_ENCODING: "gzip"})
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        ("gzip, deflate, br", {"gzip", "deflate", "br"}),
+        ("GZIP;q=0.5", {"gzip"}),
+        ("gzip;q=0, br", {"br"}),
+        ("gzip; q=0.0", set()),
+        ("*", {"br", "gzip"}),
+        ("*;q=0.1, br;q=0", {"gzip"}),
+        ("gzip;q=bad", set()),
+        ("", set()),
+    ],
+)
+def test_accepted_encodings(accept_encoding, expected):
+    """Test the Accept-Encoding header is parsed with its q-values."""
+    assert static._accepted_encodings(accept_encoding) == expected
+
+
+async def test_refused_encoding_not_served(hass, aiohttp_client, static_dir):
+    """Test an encoding with a quality of 0 is not served."""
+    (static_dir / "app.js.gz").write_bytes(gzip.compress(CONTENT.encode()))
+    hass.http.register_static_path("/static", str(static_dir))
+    client = await aiohttp_client(hass.http.app, auto_decompress=False)
+
+    for _ in range(2):
+        resp = await client.get(
+            "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip;q=0"}
+        )
+        assert hdrs.CONTENT_ENCODING not in resp.headers
+        assert await resp.text() == CONTENT
+        await hass.async_block_till_done()
+
+
+async def test_large_variant_not_cached(hass, aiohttp_client, static_dir):
+    """Test files with too large a variant are compressed once and served plain."""
+    hass.http.register_static_path("/static", str(static_dir))
+    client = await aiohttp_client(hass.http.app)
+
+    with patch.object(static, "COMPRESSED_FILE_MAX_SIZE", 10), patch(
+        "homeassistant.components.http.static._compress_file",
+        wraps=static._compress_file,
+    ) as mock_compress:
+        for _ in range(3):
+            resp = await client.get(
+                "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip"}
+            )
+            assert hdrs.CONTENT_ENCODING not in resp.headers
+            assert await resp.text() == CONTENT
+            await hass.async_block_till_done()
+
+    assert mock_compress.call_count == 1
+
+
+async def test_etag_revalidation(hass, aiohttp_client, static_dir):
+    """Test a matching ETag returns not modified."""
+    hass.http.register_static_path("/static", str(static_dir))
+    hass.http.register_static_path("/app.js", str(static_dir / "app.js"))
+    client = await aiohttp_client(hass.http.app)
+
+    for path in ("/static/app.js", "/app.js"):
+        resp = await client.get(path, headers={hdrs.ACCEPT_ENCODING: ""})
+        etag = resp.headers[hdrs.ETAG]
+
+        resp = await client.get(
+            path, headers={hdrs.ACCEPT_ENCODING: "", hdrs.IF_NONE_MATCH: etag}
+        )
+        assert resp.status == 304
+
+    (static_dir / "app.js").write_text(CONTENT * 2)
+    resp = await client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "", hdrs.IF_NONE_MATCH: etag}
+    )
+    assert resp.status == 200
+
+
+async def test_immutable(hass, aiohttp_client, static_dir):
+    """Test immutable static paths get long lived cache headers."""
+    hass.http.register_static_path("/static", str(static_dir), immutable=True)
+    client = await aiohttp_client(hass.http.app)
+
+    resp = await client.get("/static/app.js")
+    assert resp.status == 200
+    assert (
+        resp.headers[hdrs.CACHE_CONTROL] == IMMUTABLE_CACHE_HEADERS[hdrs.CACHE_CONTROL]
+    )
+
+    resp = await client.get("/static/missing.js")
+    assert resp.status == 404
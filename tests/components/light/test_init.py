@@ -17,6 +17,11 @@ from homeassistant.const import (
     STATE_ON,
 )
 from homeassistant.exceptions import Unauthorized
+from homeassistant.helpers import (
+    area_registry as ar,
+    entity_platform,
+    entity_registry as er,
+)
 from homeassistant.setup import async_setup_component
 
 from tests.common import async_mock_service
@@ -770,6 +775,59 @@ async def test_light_turn_on_auth(hass, hass_admin_user, enable_custom_integrati
         )
 
 
+async def test_light_turn_on_area_batch(hass, enable_custom_integrations):
+    """Test lights targeted by area are passed to a batch handler at once."""
+    platform = getattr(hass.components, "test.light")
+    platform.init(empty=True)
+    for name in ("Kitchen", "Hallway"):
+        entity = platform.MockLight(name, STATE_OFF)
+        entity._attr_unique_id = name.lower()
+        entity.supported_features = light.SUPPORT_BRIGHTNESS
+        platform.ENTITIES.append(entity)
+    assert await async_setup_component(hass, "light", {"light": {"platform": "test"}})
+    await hass.async_block_till_done()
+
+    area = ar.async_get(hass).async_create("Downstairs")
+    registry = er.async_get(hass)
+    for entity_id in ("light.kitchen", "light.hallway"):
+        registry.async_update_entity(entity_id, area_id=area.id)
+
+    calls = []
+
+    async def async_turn_on_batch(lights):
+        """Turn on lights at once."""
+        calls.append([(light.entity_id, params) for light, params in lights])
+
+    entity_platform.async_get_platforms(hass, "test")[0].async_register_batch_service(
+        SERVICE_TURN_ON, async_turn_on_batch
+    )
+
+    await hass.services.async_call(
+        "light",
+        "turn_on",
+        {"area_id": area.id, "brightness_pct": 50},
+        blocking=True,
+    )
+
+    assert calls == [
+        [
+            ("light.kitchen", {"brightness": 128}),
+            ("light.hallway", {"brightness": 128}),
+        ]
+    ]
+    assert hass.states.get("light.kitchen").state == STATE_OFF
+
+    # Lights turned off by a brightness of 0 are not passed to the handler
+    await hass.services.async_call(
+        "light",
+        "turn_on",
+        {"area_id": area.id, "brightness": 0},
+        blocking=True,
+    )
+
+    assert len(calls) == 1
+
+
 async def test_light_brightness_step(hass, enable_custom_integrations):
     """Test that light context works."""
     platform = getattr(hass.components, "test.light")
@@ -0,0 +1 @@
+"""Tests for the event loop monitor integration."""
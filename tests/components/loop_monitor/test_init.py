@@ -0,0 +1,76 @@
+"""Tests for the event loop monitor."""
+import asyncio
+import sys
+import time
+
+from homeassistant.components.loop_monitor.const import DOMAIN
+from homeassistant.components.loop_monitor.monitor import CORE, frame_integration
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.helpers.executor import POOL_CPU, async_run_in_pool
+from homeassistant.setup import async_setup_component
+
+
+def _integration_function(module, source):
+    """Return a function that appears to be defined in a module."""
+    namespace = {"__name__": module, "time": time}
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace["run"]
+
+
+def test_frame_integration():
+    """Test code is attributed to the integration running the innermost frame."""
+    inner = _integration_function(
+        "homeassistant.components.hue.light",
+        "import sys\ndef run():\n    return sys._getframe()",
+    )
+    outer = _integration_function(
+        "custom_components.my_lights",
+        "def run(inner):\n    return inner()",
+    )
+    library = _integration_function(
+        "aiohttp.client",
+        "def run(inner):\n    return inner()",
+    )
+
+    assert frame_integration(outer(inner)) == "hue"
+    assert frame_integration(outer(sys._getframe)) == "my_lights"
+    assert frame_integration(outer(lambda: library(sys._getframe))) == "my_lights"
+    assert frame_integration(library(sys._getframe)) is None
+    assert frame_integration(None) is None
+
+
+async def test_blocking_integrations_reported(hass, hass_ws_client):
+    """Test integrations blocking the loop or running executor jobs are reported."""
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    await hass.async_block_till_done()
+
+    block = _integration_function(
+        "homeassistant.components.slow.sensor",
+        "def run():\n    time.sleep(0.5)",
+    )
+    block()
+    await asyncio.sleep(0.2)
+    await async_run_in_pool(hass, POOL_CPU, "slow", block)
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "loop_monitor/info"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+
+    assert result["lag"]["max"] >= 0.3
+    assert result["blocked"]["slow"]["count"] == 1
+    assert result["blocked"]["slow"]["seconds"] >= 0.3
+    assert CORE not in result["blocked"]
+    assert result["executor"]["run_time"]["slow"] >= 0.5
+    assert result["executor"]["pools"][POOL_CPU]["integrations"]["slow"]["jobs"] == 1
+    assert result["executor"]["queue_depth"] == 0
+
+    await hass.helpers.entity_component.async_update_entity("sensor.event_loop_lag")
+    state = hass.states.get("sensor.event_loop_lag")
+    assert float(state.state) >= 300
+    assert state.attributes["most_blocking_integration"] == "slow"
+    assert hass.states.get("sensor.executor_queue_depth").state == "0"
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
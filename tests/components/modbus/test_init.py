@@ -12,8 +12,10 @@ This file is responsible for testing:
 
 It uses binary_sensors/sensors to do black box testing of the read calls.
 """
+import asyncio
 from datetime import timedelta
 import logging
+import threading
 from unittest import mock
 
 from pymodbus.exceptions import ModbusException
@@ -38,9 +40,11 @@ from homeassistant.components.modbus.const import (
     CALL_TYPE_WRITE_REGISTERS,
     CONF_BAUDRATE,
     CONF_BYTESIZE,
+    CONF_CONNECTIONS,
     CONF_DATA_TYPE,
     CONF_INPUT_TYPE,
     CONF_PARITY,
+    CONF_READ_GAP,
     CONF_STOPBITS,
     CONF_SWAP,
     CONF_SWAP_BYTE,
@@ -53,6 +57,7 @@ from homeassistant.components.modbus.const import (
     SERVICE_WRITE_COIL,
     SERVICE_WRITE_REGISTER,
 )
+from homeassistant.components.modbus.modbus import plan_read_blocks
 from homeassistant.components.modbus.validators import (
     number_validator,
     sensor_schema_validator,
@@ -492,6 +497,180 @@ async def test_pb_read(
     assert state == do_expect
 
 
+def test_plan_read_blocks():
+    """Test reads of nearby addresses are merged."""
+    reads = [(10, 2, "a"), (0, 1, "b"), (12, 1, "c"), (14, 1, "d"), (1, 4, "e")]
+    blocks = plan_read_blocks(reads, 125, 0)
+    assert [(block.address, block.count) for block in blocks] == [
+        (0, 5),
+        (10, 3),
+        (14, 1),
+    ]
+    assert [read[2] for read in blocks[0].reads] == ["b", "e"]
+
+    blocks = plan_read_blocks(reads, 125, 1)
+    assert [(block.address, block.count) for block in blocks] == [(0, 5), (10, 5)]
+
+    blocks = plan_read_blocks(reads, 4, 10)
+    assert [(block.address, block.count) for block in blocks] == [
+        (0, 1),
+        (1, 4),
+        (10, 3),
+        (14, 1),
+    ]
+
+
+async def _async_setup_sensors(hass, addresses, **hub_config):
+    """Set up holding register sensors and return the time of the next poll."""
+    config = {
+        DOMAIN: [
+            {
+                CONF_TYPE: "tcp",
+                CONF_HOST: TEST_HOST,
+                CONF_PORT: 5501,
+                CONF_NAME: TEST_MODBUS_NAME,
+                **hub_config,
+                CONF_SENSORS: [
+                    {
+                        CONF_INPUT_TYPE: CALL_TYPE_REGISTER_HOLDING,
+                        CONF_NAME: f"{TEST_SENSOR_NAME}{address}",
+                        CONF_ADDRESS: address,
+                    }
+                    for address in addresses
+                ],
+            }
+        ],
+    }
+    now = dt_util.utcnow()
+    with mock.patch("homeassistant.helpers.event.dt_util.utcnow", return_value=now):
+        assert await async_setup_component(hass, DOMAIN, config) is True
+        await hass.async_block_till_done()
+    return now
+
+
+async def _async_poll(hass, now):
+    """Poll the sensors and return the time of the poll."""
+    now = now + timedelta(seconds=DEFAULT_SCAN_INTERVAL + 1)
+    with mock.patch("homeassistant.helpers.event.dt_util.utcnow", return_value=now):
+        async_fire_time_changed(hass, now)
+        await hass.async_block_till_done()
+    return now
+
+
+def _read_registers(address, count, **kwargs):
+    """Return the addresses as register values."""
+    return ReadResult(list(range(address, address + count)))
+
+
+async def test_pb_read_merged(hass, mock_pymodbus):
+    """Run test for reads of nearby registers merged into one read."""
+    mock_pymodbus.read_holding_registers.side_effect = _read_registers
+    now = await _async_setup_sensors(hass, (51, 52, 55, 60), **{CONF_READ_GAP: 2})
+    await _async_poll(hass, now)
+
+    assert sorted(
+        call.args for call in mock_pymodbus.read_holding_registers.call_args_list
+    ) == [
+        (51, 5),
+        (60, 1),
+    ]
+    for address in (51, 52, 55, 60):
+        state = hass.states.get(f"{SENSOR_DOMAIN}.{TEST_SENSOR_NAME}{address}")
+        assert state.state == str(address)
+
+    stats = hass.data[DOMAIN][TEST_MODBUS_NAME].slave_stats[0]
+    assert stats.transactions == 2
+    assert stats.errors == 0
+
+
+async def test_pb_read_not_merged_without_gap(hass, mock_pymodbus):
+    """Run test for reads not merged unless a read gap is configured."""
+    mock_pymodbus.read_holding_registers.side_effect = _read_registers
+    now = await _async_setup_sensors(hass, (51, 52))
+    await _async_poll(hass, now)
+
+    assert sorted(
+        call.args for call in mock_pymodbus.read_holding_registers.call_args_list
+    ) == [
+        (51, 1),
+        (52, 1),
+    ]
+
+
+async def test_pb_read_merged_fallback(hass, caplog, mock_pymodbus):
+    """Run test for reads retried one by one and not merged after a failed block."""
+
+    def read_registers(address, count, **kwargs):
+        """Refuse reading the gap between the registers."""
+        if count > 1:
+            return ExceptionResponse(0x03, 0x02)
+        return _read_registers(address, count)
+
+    mock_pymodbus.read_holding_registers.side_effect = read_registers
+    now = await _async_setup_sensors(hass, (51, 53), **{CONF_READ_GAP: 2})
+    caplog.set_level(logging.ERROR)
+    now = await _async_poll(hass, now)
+
+    assert [call.args for call in mock_pymodbus.read_holding_registers.call_args_list][
+        0
+    ] == (51, 3)
+    assert sorted(
+        call.args for call in mock_pymodbus.read_holding_registers.call_args_list[1:]
+    ) == [(51, 1), (53, 1)]
+    for address in (51, 53):
+        state = hass.states.get(f"{SENSOR_DOMAIN}.{TEST_SENSOR_NAME}{address}")
+        assert state.state == str(address)
+    assert "Pymodbus" not in caplog.text
+
+    mock_pymodbus.read_holding_registers.reset_mock()
+    await _async_poll(hass, now)
+    assert sorted(
+        call.args for call in mock_pymodbus.read_holding_registers.call_args_list
+    ) == [(51, 1), (53, 1)]
+
+
+async def test_pb_read_block_exception(hass, mock_pymodbus):
+    """Run test for reads getting the exception of a failed block read."""
+    await _async_setup_sensors(hass, (), **{CONF_READ_GAP: 2})
+    hub = hass.data[DOMAIN][TEST_MODBUS_NAME]
+    mock_pymodbus.read_holding_registers.side_effect = ValueError("Boom")
+
+    reads = [
+        hass.async_create_task(
+            hub.async_pymodbus_call(0, address, 1, CALL_TYPE_REGISTER_HOLDING)
+        )
+        for address in (51, 52)
+    ]
+    for read in reads:
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(read, 5)
+    mock_pymodbus.read_holding_registers.assert_called_once_with(51, 2)
+
+
+async def test_pb_read_connections(hass, mock_pymodbus):
+    """Run test for reads running concurrently over several connections."""
+    in_read = threading.Barrier(2, timeout=5)
+
+    def read_registers(address, count, **kwargs):
+        """Wait until both connections are reading."""
+        in_read.wait()
+        return _read_registers(address, count)
+
+    mock_pymodbus.read_holding_registers.side_effect = read_registers
+    with mock.patch(
+        "homeassistant.components.modbus.modbus.ModbusTcpClient",
+        return_value=mock_pymodbus,
+    ) as mock_client:
+        now = await _async_setup_sensors(hass, (51, 60), **{CONF_CONNECTIONS: 2})
+    assert mock_client.call_count == 2
+
+    await _async_poll(hass, now)
+    for address in (51, 60):
+        state = hass.states.get(f"{SENSOR_DOMAIN}.{TEST_SENSOR_NAME}{address}")
+        assert state.state == str(address)
+    assert not in_read.broken
+
+
 async def test_pymodbus_constructor_fail(hass, caplog):
     """Run test for failing pymodbus constructor."""
     config = {
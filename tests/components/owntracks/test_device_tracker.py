@@ -1384,13 +1384,13 @@ def mock_cipher():
 def config_context(hass, setup_comp):
     """Set up the mocked context."""
     patch_load = patch(
-        "homeassistant.components.device_tracker.async_load_config",
+        "homeassistant.components.device_tracker.async_load_known_devices",
         return_value=mock_coro([]),
     )
     patch_load.start()
 
     patch_save = patch(
-        "homeassistant.components.device_tracker.DeviceTracker.async_update_config"
+        "homeassistant.components.device_tracker.DeviceTracker.async_add_known_device"
     )
     patch_save.start()
 
@@ -0,0 +1,78 @@
+"""Test the shared ICMP engine of the ping integration."""
+import pytest
+
+from homeassistant.components.ping import DOMAIN
+from homeassistant.components.ping.const import PING_ENGINE
+from homeassistant.components.ping.icmp import ICMPEngine, can_create_socket
+from homeassistant.setup import async_setup_component
+
+PRIVILEGED = can_create_socket(True)
+
+pytestmark = pytest.mark.skipif(
+    not PRIVILEGED and not can_create_socket(False),
+    reason="ICMP sockets are not allowed",
+)
+
+
+@pytest.fixture
+def engine(hass):
+    """Return an ICMP engine."""
+    engine = ICMPEngine(hass.loop, PRIVILEGED, 1000)
+    yield engine
+    engine.async_close()
+
+
+async def test_setup(hass):
+    """Test the engine is set up with the configured rate limit."""
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {"rate_limit": 10}})
+    engine = hass.data[DOMAIN][PING_ENGINE]
+    assert engine.privileged == PRIVILEGED
+
+    # Requests are spread over time by the rate limit
+    start = hass.loop.time()
+    result = await engine.async_ping("127.0.0.1", count=3)
+    assert result.is_alive
+    assert hass.loop.time() - start >= 0.2
+
+
+async def test_ping_loopback(engine):
+    """Test pinging the loopback address."""
+    result = await engine.async_ping("127.0.0.1", count=3)
+    assert result.is_alive
+    assert result.packets_sent == 3
+    assert result.packets_received == 3
+    assert result.packet_loss == 0
+    assert 0 <= result.min_rtt <= result.avg_rtt <= result.max_rtt
+    assert result.mdev_rtt >= 0
+
+    result = await engine.async_ping("127.0.0.1", count=3, until_alive=True)
+    assert result.packets_sent == 1
+
+    stats = engine.host_statistics("127.0.0.1")
+    assert stats.packets_sent == 4
+    assert len(stats.rtts) == 4
+
+
+async def test_ping_concurrently(hass, engine):
+    """Test the requests to many hosts share the socket."""
+    hosts = [f"127.0.0.{idx}" for idx in range(1, 11)]
+    results = [
+        await task
+        for task in [
+            hass.async_create_task(engine.async_ping(host, count=2)) for host in hosts
+        ]
+    ]
+    assert all(result.packets_received == 2 for result in results)
+    assert len(engine._sockets) == 1
+
+
+async def test_ping_unreachable(engine):
+    """Test a host that does not reply in time."""
+    result = await engine.async_ping("127.0.0.1", count=2, timeout=0)
+    assert not result.is_alive
+    assert result.packets_sent == 2
+    assert result.packet_loss == 1
+    assert result.avg_rtt == 0
+
+    result = await engine.async_ping("invalid host name", count=2)
+    assert result.packets_sent == 0
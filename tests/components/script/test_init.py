@@ -7,7 +7,11 @@ from unittest.mock import Mock, patch
 import pytest
 
 from homeassistant.components import logbook, script
-from homeassistant.components.script import DOMAIN, EVENT_SCRIPT_STARTED
+from homeassistant.components.script import (
+    DOMAIN,
+    EVENT_SCRIPT_RELOADED,
+    EVENT_SCRIPT_STARTED,
+)
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_NAME,
@@ -24,7 +28,11 @@ from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import bind_hass
 from homeassistant.setup import async_setup_component, setup_component
 
-from tests.common import async_mock_service, get_test_home_assistant
+from tests.common import (
+    async_capture_events,
+    async_mock_service,
+    get_test_home_assistant,
+)
 from tests.components.logbook.test_init import MockLazyEventPartialState
 
 ENTITY_ID = "script.test"
@@ -251,6 +259,51 @@ async def test_reload_service(hass, running):
         assert hass.services.has_service(script.DOMAIN, "test")
 
 
+async def test_reload_keeps_unchanged_scripts(hass):
+    """Test reloading only recreates scripts whose config changed."""
+    config = {
+        "script": {
+            "same": {"sequence": [{"event": "same"}]},
+            "changed": {"sequence": [{"event": "changed"}]},
+            "removed": {"sequence": [{"event": "removed"}]},
+        }
+    }
+    assert await async_setup_component(hass, "script", config)
+    component = hass.data[DOMAIN]
+    same_entity = component.get_entity("script.same")
+    changed_entity = component.get_entity("script.changed")
+
+    reload_events = async_capture_events(hass, EVENT_SCRIPT_RELOADED)
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        return_value={
+            "script": {
+                "same": {"sequence": [{"event": "same"}]},
+                "changed": {"sequence": [{"event": "changed_2"}]},
+                "added": {"sequence": [{"event": "added"}]},
+            }
+        },
+    ):
+        await hass.services.async_call(DOMAIN, SERVICE_RELOAD, blocking=True)
+        await hass.async_block_till_done()
+
+    assert component.get_entity("script.same") is same_entity
+    assert component.get_entity("script.changed") is not changed_entity
+    assert hass.states.get("script.removed") is None
+    assert reload_events[0].data == {
+        "created": ["script.changed", "script.added"],
+        "removed": ["script.changed", "script.removed"],
+        "unchanged": ["script.same"],
+    }
+    assert not hass.services.has_service(DOMAIN, "removed")
+    for object_id in ("same", "changed", "added"):
+        assert hass.services.has_service(DOMAIN, object_id)
+
+    events = async_capture_events(hass, "changed_2")
+    await hass.services.async_call(DOMAIN, "changed", blocking=True)
+    assert len(events) == 1
+
+
 async def test_service_descriptions(hass):
     """Test that service descriptions are loaded and reloaded correctly."""
     # Test 1: has "description" but no "fields"
@@ -0,0 +1,64 @@
+"""Fixtures for the SNMP integration tests."""
+from unittest.mock import patch
+
+from pysnmp.smi import builder, view
+import pytest
+
+from homeassistant.components.snmp import session as snmp_session
+
+# noSuchName and tooBig error status of SNMPv1
+NO_SUCH_NAME = 2
+TOO_BIG = 1
+
+MIB_VIEW = view.MibViewController(builder.MibBuilder())
+
+
+def _resolve(object_type):
+    """Return the OID and value of an object type passed to getCmd or setCmd."""
+    object_type.resolveWithMib(MIB_VIEW)
+    return str(object_type[0].getOid()), object_type[1]
+
+
+class FakeAgent:
+    """SNMP agent answering the GET and SET requests of a session."""
+
+    def __init__(self, values):
+        """Initialize the agent."""
+        self.values = values
+        self.requests = []
+        self.error_indication = None
+        self.max_oids = None
+        # OIDs whose value changes with the value set on another OID
+        self.links = {}
+
+    async def get_cmd(self, *args):
+        """Answer a GET request like an SNMPv1 agent."""
+        oids = [_resolve(object_type)[0] for object_type in args[4:]]
+        self.requests.append(oids)
+        varbinds = [(oid, self.values.get(oid)) for oid in oids]
+        if self.error_indication:
+            return self.error_indication, 0, 0, []
+        if self.max_oids is not None and len(oids) > self.max_oids:
+            return None, TOO_BIG, 0, []
+        for idx, oid in enumerate(oids):
+            if oid not in self.values:
+                return None, NO_SUCH_NAME, idx + 1, varbinds
+        return None, 0, 0, varbinds
+
+    async def set_cmd(self, *args):
+        """Answer a SET request."""
+        oid, value = _resolve(args[4])
+        self.values[oid] = value
+        if oid in self.links:
+            self.values[self.links[oid]] = value
+        return None, 0, 0, [(oid, value)]
+
+
+@pytest.fixture
+def agent():
+    """Answer the requests of the sessions."""
+    agent = FakeAgent({f"1.3.6.1.4.1.{idx}": idx for idx in range(20)})
+    with patch.object(snmp_session, "getCmd", agent.get_cmd), patch.object(
+        snmp_session, "setCmd", agent.set_cmd
+    ):
+        yield agent
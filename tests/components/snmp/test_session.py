@@ -0,0 +1,182 @@
+"""Test the sessions shared by the SNMP entities."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+from pysnmp.hlapi.asyncio import Integer
+import pytest
+
+from homeassistant.components.snmp import session as snmp_session
+from homeassistant.components.snmp.const import (
+    CONF_COMMUNITY,
+    CONF_VERSION,
+    DEFAULT_COMMUNITY,
+)
+from homeassistant.const import CONF_HOST, CONF_PORT
+
+from .conftest import NO_SUCH_NAME
+
+CONFIG = {
+    CONF_HOST: "127.0.0.1",
+    CONF_PORT: 161,
+    CONF_VERSION: "1",
+    CONF_COMMUNITY: DEFAULT_COMMUNITY,
+}
+
+SCAN_INTERVAL = timedelta(seconds=10)
+
+
+@pytest.fixture
+def clock(hass):
+    """Control the time of the event loop seen by the session."""
+    now = [hass.loop.time()]
+    with patch.object(hass.loop, "time", lambda: now[0]):
+        yield now
+
+
+async def _async_get(session, *oids, scan_interval=SCAN_INTERVAL):
+    """Get OIDs concurrently and return their values."""
+    results = await asyncio.gather(
+        *(session.async_get(oid, scan_interval) for oid in oids)
+    )
+    return [varbinds[0][1] if varbinds else None for _, _, _, varbinds in results]
+
+
+async def test_session_shared(hass):
+    """Test entities polling the same agent share the session."""
+    session = snmp_session.async_get_session(hass, CONFIG)
+    assert snmp_session.async_get_session(hass, dict(CONFIG)) is session
+    assert (
+        snmp_session.async_get_session(hass, {**CONFIG, CONF_COMMUNITY: "private"})
+        is not session
+    )
+
+
+async def test_get_chunked(hass, agent):
+    """Test OIDs are read with GET requests of several OIDs."""
+    session = snmp_session.async_get_session(hass, CONFIG)
+    oids = list(agent.values)
+
+    assert await _async_get(session, *oids) == list(range(20))
+    assert agent.requests == [oids[:16], oids[16:]]
+
+
+async def test_get_unknown_oid_split(hass, agent):
+    """Test an OID rejected by an SNMPv1 agent is split from the request."""
+    session = snmp_session.async_get_session(hass, CONFIG)
+
+    errindication, errstatus, errindex, varbinds = (
+        await asyncio.gather(
+            session.async_get("1.3.6.1.4.1.0", SCAN_INTERVAL),
+            session.async_get("1.3.6.1.4.1.99", SCAN_INTERVAL),
+            session.async_get("1.3.6.1.4.1.1", SCAN_INTERVAL),
+        )
+    )[1]
+    assert errindication is None
+    assert errstatus == NO_SUCH_NAME
+    assert errindex == 1
+    assert varbinds == [("1.3.6.1.4.1.99", None)]
+
+    assert await _async_get(session, "1.3.6.1.4.1.0", "1.3.6.1.4.1.1") == [0, 1]
+    assert agent.requests == [
+        ["1.3.6.1.4.1.0", "1.3.6.1.4.1.99", "1.3.6.1.4.1.1"],
+        ["1.3.6.1.4.1.0", "1.3.6.1.4.1.1"],
+    ]
+
+
+async def test_get_too_big(hass, agent):
+    """Test OIDs are read one by one if the agent can't say which one failed."""
+    session = snmp_session.async_get_session(hass, CONFIG)
+    agent.max_oids = 1
+
+    assert await _async_get(session, "1.3.6.1.4.1.0", "1.3.6.1.4.1.1") == [0, 1]
+    assert agent.requests == [
+        ["1.3.6.1.4.1.0", "1.3.6.1.4.1.1"],
+        ["1.3.6.1.4.1.0"],
+        ["1.3.6.1.4.1.1"],
+    ]
+
+
+async def test_get_error_indication(hass, agent):
+    """Test an error indication is passed to all OIDs of the request."""
+    session = snmp_session.async_get_session(hass, CONFIG)
+    agent.error_indication = "requestTimedOut"
+
+    results = await asyncio.gather(
+        session.async_get("1.3.6.1.4.1.0", SCAN_INTERVAL),
+        session.async_get("1.3.6.1.4.1.1", SCAN_INTERVAL),
+    )
+    assert [result[0] for result in results] == ["requestTimedOut"] * 2
+    assert len(agent.requests) == 1
+
+
+async def test_cache_shared(hass, agent, clock):
+    """Test values are cached for part of the scan interval of their OIDs."""
+    session = snmp_session.async_get_session(hass, CONFIG)
+    fast = ("1.3.6.1.4.1.0", "1.3.6.1.4.1.1")
+    slow = "1.3.6.1.4.1.2"
+
+    await asyncio.gather(
+        _async_get(session, *fast),
+        _async_get(session, slow, scan_interval=timedelta(minutes=5)),
+    )
+    assert agent.requests == [[*fast, slow]]
+
+    # The other entity finds its value in the cache
+    agent.requests.clear()
+    clock[0] += 1
+    assert await _async_get(session, fast[1]) == [1]
+    assert agent.requests == []
+
+    # Only the values that are due are read
+    clock[0] += 5
+    assert await _async_get(session, fast[0]) == [0]
+    assert await _async_get(session, fast[1]) == [1]
+    assert agent.requests == [list(fast)]
+
+    agent.requests.clear()
+    clock[0] += 150
+    assert await _async_get(session, fast[0]) == [0]
+    assert agent.requests == [[*fast, slow]]
+
+    # Short scan intervals are not capped by the cache
+    agent.requests.clear()
+    clock[0] += 1.5
+    assert await _async_get(
+        session, "1.3.6.1.4.1.0", scan_interval=timedelta(seconds=2)
+    ) == [0]
+    assert agent.requests == [["1.3.6.1.4.1.0"]]
+
+
+async def test_set_clears_cache(hass, agent):
+    """Test a set invalidates the values read before it."""
+    session = snmp_session.async_get_session(hass, CONFIG)
+    assert await _async_get(session, "1.3.6.1.4.1.0") == [0]
+
+    await session.async_set("1.3.6.1.4.1.1", Integer(100))
+    agent.values["1.3.6.1.4.1.0"] = 100
+    assert await _async_get(session, "1.3.6.1.4.1.0") == [100]
+    assert len(agent.requests) == 2
+
+
+async def test_set_while_reading(hass, agent):
+    """Test values read while setting are read again."""
+    session = snmp_session.async_get_session(hass, CONFIG)
+    reading = asyncio.Event()
+    release = asyncio.Event()
+    get_cmd = agent.get_cmd
+
+    async def slow_get_cmd(*args):
+        """Read the values before they are set, but answer after it."""
+        result = await get_cmd(*args)
+        reading.set()
+        await release.wait()
+        return result
+
+    with patch.object(snmp_session, "getCmd", slow_get_cmd):
+        read = hass.async_create_task(_async_get(session, "1.3.6.1.4.1.0"))
+        await reading.wait()
+        await session.async_set("1.3.6.1.4.1.0", Integer(100))
+        reading.clear()
+        release.set()
+        assert await read == [100]
@@ -0,0 +1,35 @@
+"""Test the SNMP switch."""
+from pysnmp.hlapi.asyncio import Integer
+
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_ON, STATE_OFF, STATE_ON
+from homeassistant.setup import async_setup_component
+
+BASE_OID = "1.3.6.1.4.1.1"
+COMMAND_OID = "1.3.6.1.4.1.2"
+
+
+async def test_turn_on_refreshes_state(hass, agent):
+    """Test the state is read again after a command, not taken from the cache."""
+    agent.values[BASE_OID] = Integer(0)
+    agent.links[COMMAND_OID] = BASE_OID
+    assert await async_setup_component(
+        hass,
+        SWITCH_DOMAIN,
+        {
+            SWITCH_DOMAIN: {
+                "platform": "snmp",
+                "name": "Test",
+                "host": "127.0.0.1",
+                "baseoid": BASE_OID,
+                "command_oid": COMMAND_OID,
+            }
+        },
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("switch.test").state == STATE_OFF
+
+    await hass.services.async_call(
+        SWITCH_DOMAIN, SERVICE_TURN_ON, {ATTR_ENTITY_ID: "switch.test"}, blocking=True
+    )
+    assert hass.states.get("switch.test").state == STATE_ON
@@ -28,6 +28,7 @@ from homeassistant.components.stream.const import (
     PACKETS_TO_WAIT_FOR_AUDIO,
     TARGET_SEGMENT_DURATION,
 )
+from homeassistant.components.stream.core import KeyFrameConverter
 from homeassistant.components.stream.worker import SegmentBuffer, stream_worker
 from homeassistant.setup import async_setup_component
 
@@ -66,6 +67,12 @@ class FakePyAvStream:
 
         self.codec = FakeCodec()
 
+        class FakeCodecContext:
+            name = "h264"
+            extradata = None
+
+        self.codec_context = FakeCodecContext()
+
 
 VIDEO_STREAM = FakePyAvStream(VIDEO_STREAM_FORMAT, VIDEO_FRAME_RATE)
 AUDIO_STREAM = FakePyAvStream(AUDIO_STREAM_FORMAT, AUDIO_SAMPLE_RATE)
@@ -718,3 +725,25 @@ async def test_has_keyframe(hass, record_worker_sync):
     await record_worker_sync.join()
 
     stream.stop()
+
+
+async def test_keyframe_converter(hass):
+    """Test the latest keyframe of a stream is converted to a JPEG image."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    source = generate_h264_video()
+    stream = create_stream(hass, source, {})
+    keyframe_converter = KeyFrameConverter(hass)
+    assert await keyframe_converter.async_get_image() is None
+
+    segment_buffer = SegmentBuffer(stream.outputs, keyframe_converter)
+    stream_worker(source, {}, segment_buffer, threading.Event())
+    await hass.async_block_till_done()
+
+    image = await keyframe_converter.async_get_image()
+    assert image[:2] == b"\xff\xd8"
+    # The image is reused until the next keyframe arrives
+    assert await keyframe_converter.async_get_image() is image
+
+    # A stream that is not running has no image
+    assert await stream.async_get_image() is None
@@ -16,10 +16,18 @@ from homeassistant.components.websocket_api.auth import (
 from homeassistant.components.websocket_api.const import URL
 from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity
+from homeassistant.helpers import entity, polling
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    DATA_SETUP_TIMELINE,
+    PHASE_IMPORT,
+    PHASE_PLATFORM,
+    SetupPhase,
+    async_setup_component,
+)
+import homeassistant.util.dt as dt_util
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
 
@@ -393,6 +401,51 @@ async def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscriptions_watch_polling(hass, websocket_client):
+    """Test entities of template and trigger subscriptions are watched."""
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "event_type": "state_changed"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    # Showing all states does not watch them
+    assert not polling.async_is_watched(hass, ["light.test"])
+
+    await websocket_client.send_json(
+        {
+            "id": 6,
+            "type": "render_template",
+            "template": "{{ states('light.test') }}",
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "event"
+    assert polling.async_is_watched(hass, ["light.test"])
+    assert not polling.async_is_watched(hass, ["sensor.test"])
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_trigger",
+            "trigger": {"platform": "state", "entity_id": "sensor.test"},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert polling.async_is_watched(hass, ["sensor.test"])
+
+    for msg_id, subscription in enumerate((6, 7), start=8):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    assert not polling.async_is_watched(hass, ["light.test", "sensor.test"])
+
+
 async def test_get_states(hass, websocket_client):
     """Test get_states command."""
     hass.states.async_set("greeting.hello", "world")
@@ -1189,3 +1242,41 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         {"domain": "august", "seconds": 12.5},
         {"domain": "isy994", "seconds": 12.8},
     ]
+
+
+async def test_integration_setup_timeline(hass, websocket_client, hass_admin_user):
+    """Test the integration setup timeline command."""
+    started = dt_util.utcnow()
+    hass.data[DATA_SETUP_TIMELINE] = {
+        "august": [
+            SetupPhase(PHASE_IMPORT, started, datetime.timedelta(seconds=0.5)),
+            SetupPhase(
+                PHASE_PLATFORM, started, datetime.timedelta(seconds=2), "sensor"
+            ),
+        ]
+    }
+    await websocket_client.send_json({"id": 7, "type": "integration/setup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "domain": "august",
+            "phases": [
+                {
+                    "phase": "import",
+                    "platform": None,
+                    "start": started.isoformat(),
+                    "seconds": 0.5,
+                },
+                {
+                    "phase": "platform",
+                    "platform": "sensor",
+                    "start": started.isoformat(),
+                    "seconds": 2.0,
+                },
+            ],
+        }
+    ]
@@ -214,15 +214,15 @@ def mock_device_tracker_conf():
     """Prevent device tracker from reading/writing data."""
     devices = []
 
-    async def mock_update_config(path, id, entity):
+    async def mock_add_known_device(entity):
         devices.append(entity)
 
     with patch(
         "homeassistant.components.device_tracker.legacy"
-        ".DeviceTracker.async_update_config",
-        side_effect=mock_update_config,
+        ".DeviceTracker.async_add_known_device",
+        side_effect=mock_add_known_device,
     ), patch(
-        "homeassistant.components.device_tracker.legacy.async_load_config",
+        "homeassistant.components.device_tracker.legacy.async_load_known_devices",
         side_effect=lambda *args: devices,
     ):
         yield devices
@@ -0,0 +1,87 @@
+"""Test the condition cache helper."""
+from homeassistant.components.trace.const import DATA_TRACE
+from homeassistant.helpers import condition
+from homeassistant.helpers.condition_cache import ConditionCache, condition_cache_cv
+from homeassistant.helpers.template import Template
+from homeassistant.setup import async_setup_component
+
+
+async def test_renders_reused_until_state_changes(hass):
+    """Test renders are reused while the states they read are unchanged."""
+    cache = ConditionCache()
+    template = Template("{{ states('sensor.temperature') | float > 20 }}", hass)
+    hass.states.async_set("sensor.temperature", "25")
+
+    token = condition_cache_cv.set(cache)
+    try:
+        assert condition.async_template(hass, template)
+        assert condition.async_template(hass, template, {"unused": [1]})
+        assert cache.stats.as_dict() == {"hits": 1, "misses": 1}
+
+        hass.states.async_set("sensor.temperature", "15")
+        assert not condition.async_template(hass, template)
+        assert cache.stats.as_dict() == {"hits": 1, "misses": 2}
+    finally:
+        condition_cache_cv.reset(token)
+
+
+async def test_renders_keyed_by_variables(hass):
+    """Test renders are keyed by the variables the template reads."""
+    cache = ConditionCache()
+    template = Template("{{ value > 20 }}", hass)
+
+    assert cache.async_render_to_info(template, {"value": 25}).result() is True
+    assert cache.async_render_to_info(template, {"value": 15}).result() is False
+    assert cache.async_render_to_info(template, {"value": 25}).result() is True
+    assert cache.stats.as_dict() == {"hits": 1, "misses": 2}
+
+    # Unhashable variables are rendered every time
+    template = Template("{{ value | length }}", hass)
+    assert cache.async_render_to_info(template, {"value": [1]}).result() == 1
+    assert cache.async_render_to_info(template, {"value": [1]}).result() == 1
+    assert cache.stats.as_dict() == {"hits": 1, "misses": 4}
+
+
+async def test_time_dependent_renders_not_cached(hass):
+    """Test renders reading the time or all states are not reused."""
+    cache = ConditionCache()
+
+    for value in ("{{ now().year > 2000 }}", "{{ states | count >= 0 }}"):
+        template = Template(value, hass)
+        cache.async_render_to_info(template, None)
+        cache.async_render_to_info(template, None)
+
+    assert cache.stats.as_dict() == {"hits": 0, "misses": 4}
+
+
+async def test_shared_between_automations(hass):
+    """Test automations triggered by one state change share renders."""
+    automation = {
+        "trigger": {"platform": "state", "entity_id": "sensor.temperature"},
+        "condition": {
+            "condition": "template",
+            "value_template": "{{ states('sensor.temperature') | float > 20 }}",
+        },
+        "action": {"event": "test_event"},
+    }
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": [
+                {**automation, "id": "first"},
+                {**automation, "id": "second"},
+            ]
+        },
+    )
+
+    hass.states.async_set("sensor.temperature", "25")
+    await hass.async_block_till_done()
+
+    stats = [
+        next(iter(hass.data[DATA_TRACE][("automation", item_id)].values())).as_dict()[
+            "condition_cache"
+        ]
+        for item_id in ("first", "second")
+    ]
+    assert stats == [{"hits": 0, "misses": 1}, {"hits": 1, "misses": 0}]
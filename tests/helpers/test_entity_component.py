@@ -11,11 +11,12 @@ import voluptuous as vol
 from homeassistant.const import (
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
 )
 import homeassistant.core as ha
 from homeassistant.exceptions import PlatformNotReady
-from homeassistant.helpers import discovery
+from homeassistant.helpers import discovery, entity_registry as er
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -28,6 +29,7 @@ from tests.common import (
     async_fire_time_changed,
     mock_entity_platform,
     mock_integration,
+    mock_registry,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -84,6 +86,60 @@ async def test_setup_recovers_when_setup_raises(hass):
     assert platform2_setup.called
 
 
+async def test_setup_deferred_platforms(hass):
+    """Test deferred platforms are set up after start, by priority."""
+    hass.state = ha.CoreState.starting
+    mock_registry(
+        hass,
+        {
+            "test_domain.disabled": er.RegistryEntry(
+                entity_id="test_domain.disabled",
+                unique_id="disabled",
+                platform="mod1",
+                disabled_by=er.DISABLED_USER,
+            ),
+        },
+    )
+    setup_order = []
+    for platform in ("mod1", "mod2", "mod3"):
+        mock_entity_platform(
+            hass,
+            f"test_domain.{platform}",
+            MockPlatform(
+                Mock(side_effect=lambda *args, name=platform: setup_order.append(name))
+            ),
+        )
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component.setup(
+        OrderedDict(
+            [
+                (DOMAIN, {"platform": "mod1", "defer_setup": True}),
+                (f"{DOMAIN} 2", {"platform": "mod2", "defer_setup": True}),
+                (f"{DOMAIN} 3", {"platform": "mod3"}),
+            ]
+        )
+    )
+    await hass.async_block_till_done()
+    assert setup_order == ["mod3"]
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert setup_order == ["mod3", "mod2", "mod1"]
+
+
+async def test_defer_setup_ignored_when_running(hass):
+    """Test platforms are not deferred once Home Assistant is running."""
+    platform_setup = Mock(return_value=None)
+    mock_entity_platform(hass, "test_domain.mod1", MockPlatform(platform_setup))
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component.setup({DOMAIN: {"platform": "mod1", "defer_setup": True}})
+
+    await hass.async_block_till_done()
+    assert platform_setup.called
+
+
 @patch(
     "homeassistant.helpers.entity_component.EntityComponent.async_setup_platform",
 )
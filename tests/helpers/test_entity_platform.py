@@ -13,12 +13,14 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_platform,
     entity_registry as er,
+    polling,
 )
 from homeassistant.helpers.entity import async_generate_entity_id
 from homeassistant.helpers.entity_component import (
     DEFAULT_SCAN_INTERVAL,
     EntityComponent,
 )
+from homeassistant.helpers.executor import POOL_POLLING, async_get_executor_pools
 import homeassistant.util.dt as dt_util
 
 from tests.common import (
@@ -68,6 +70,44 @@ async def test_polling_disabled_by_config_entry(hass):
     assert entity_platform._async_unsub_polling is None
 
 
+async def test_polling_adaptive_scan_interval(hass):
+    """Test the scan interval backs off while the states do not change."""
+    platform = MockPlatform()
+    platform.ADAPTIVE_SCAN_INTERVAL = True
+    entity_platform = MockEntityPlatform(
+        hass, platform=platform, scan_interval=timedelta(seconds=20)
+    )
+    poll_ent = MockEntity(should_poll=True)
+    poll_ent.async_update = Mock()
+
+    with patch("homeassistant.helpers.polling.random.uniform", return_value=20):
+        await entity_platform.async_add_entities([poll_ent])
+    poll_ent.async_update.reset_mock()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert poll_ent.async_update.call_count == 1
+    assert entity_platform.polling_stats.unchanged == 1
+    assert entity_platform.polling_stats.interval == 40
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert poll_ent.async_update.call_count == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    await hass.async_block_till_done()
+    assert poll_ent.async_update.call_count == 2
+    assert entity_platform.polling_stats.interval == 80
+
+    # Watched entities are polled at the shortest interval
+    release = polling.async_watch_entities(hass, [poll_ent.entity_id])
+    assert entity_platform.polling_stats.interval == 20
+    release()
+
+    entity_platform.async_unsub_polling()
+    assert entity_platform._async_cancel_poll is None
+
+
 async def test_polling_updates_entities_with_exception(hass):
     """Test the updated entities that not break with an exception."""
     component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
@@ -354,6 +394,13 @@ async def test_parallel_updates_sync_platform_with_constant(hass):
     assert entity.parallel_updates is not None
     assert entity.parallel_updates._value == 2
 
+    # The updates can use as many threads of the polling pool
+    pool = async_get_executor_pools(hass).pools[POOL_POLLING]
+    assert pool._get_quota("platform") == 2
+
+    await handle.async_destroy()
+    assert pool._get_quota("platform") == pool.default_quota
+
 
 async def test_raise_error_on_update(hass):
     """Test the add entity if they raise an error on update."""
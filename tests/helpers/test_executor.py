@@ -0,0 +1,138 @@
+"""Test the executor pools helper."""
+import asyncio
+import threading
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.helpers import executor
+
+
+async def test_quota_per_integration(hass):
+    """Test an integration cannot run more jobs than its quota at once."""
+    pool = executor.async_get_executor_pools(hass).pools[executor.POOL_POLLING]
+    pool.async_set_quota("slow", 1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_job():
+        """Run until released."""
+        started.set()
+        return release.wait(5)
+
+    try:
+        first = hass.async_create_task(pool.async_run("slow", slow_job))
+        second = hass.async_create_task(pool.async_run("slow", slow_job))
+        assert await hass.async_add_executor_job(started.wait, 5)
+        started.clear()
+        assert pool.integration_stats["slow"].active == 2
+        assert pool.queue_depth == 1
+
+        # Other integrations are not kept waiting
+        assert await pool.async_run("fast", lambda: True)
+        assert pool.integration_stats["fast"].jobs == 1
+        assert not first.done() and not second.done()
+        assert not started.is_set()
+    finally:
+        release.set()
+
+    assert await asyncio.gather(first, second) == [True, True]
+    stats = pool.integration_stats["slow"]
+    assert stats.jobs == 2
+    assert stats.active == 0
+    assert stats.max_wait_time > 0
+    assert stats.run_time > 0
+    assert pool.stats.jobs == 3
+    assert pool.queue_depth == 0
+
+
+async def test_queue_depth_waiting_for_thread(hass):
+    """Test jobs waiting for a thread of the pool are counted."""
+    pool = executor.ExecutorPool(hass, "test", 1, 2)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_job():
+        """Run until released."""
+        started.set()
+        return release.wait(5)
+
+    try:
+        first = hass.async_create_task(pool.async_run("slow", slow_job))
+        second = hass.async_create_task(pool.async_run("slow", lambda: True))
+        assert await hass.async_add_executor_job(started.wait, 5)
+        await asyncio.sleep(0)
+        assert pool.queue_depth == 1
+
+        # A job cancelled before it started is not counted anymore
+        second.cancel()
+        await asyncio.gather(second, return_exceptions=True)
+        assert pool.queue_depth == 0
+    finally:
+        release.set()
+
+    assert await first
+    assert pool.queue_depth == 0
+    await pool.async_shutdown()
+
+
+async def test_isolated_pool_reserved_quota(hass):
+    """Test integrations get threads of their own and reserved quotas."""
+    pool = executor.ExecutorPool(hass, "test", 1, 1, isolated=True)
+    release_first = pool.async_reserve("slow", 1)
+    pool.async_reserve("slow", 1)
+    started = threading.Barrier(4)
+    release = threading.Event()
+
+    def slow_job():
+        """Run until released."""
+        started.wait(5)
+        return release.wait(5)
+
+    try:
+        jobs = [hass.async_create_task(pool.async_run("slow", slow_job))]
+        jobs.append(hass.async_create_task(pool.async_run("slow", slow_job)))
+        # A reservation made after the first job still gets its threads
+        pool.async_reserve("slow", 1)
+        jobs.append(hass.async_create_task(pool.async_run("slow", slow_job)))
+        await hass.async_add_executor_job(started.wait, 5)
+        assert pool.integration_stats["slow"].active == 3
+        assert pool.queue_depth == 0
+
+        # Other integrations have threads of their own
+        name = await pool.async_run("fast", lambda: threading.current_thread().name)
+        assert name.startswith("TestWorker-fast")
+    finally:
+        release.set()
+
+    assert await asyncio.gather(*jobs) == [True] * 3
+
+    release_first()
+    assert pool._get_quota("slow") == 2
+    await pool.async_shutdown()
+
+
+async def test_run_in_pool(hass):
+    """Test running jobs in the named pools."""
+    name = await executor.async_run_in_pool(
+        hass,
+        executor.POOL_DATABASE,
+        "history",
+        lambda: threading.current_thread().name,
+    )
+    assert name.startswith("DatabaseWorker")
+
+    pools = executor.async_get_executor_pools(hass)
+    assert (
+        pools.as_dict()[executor.POOL_DATABASE]["integrations"]["history"]["jobs"] == 1
+    )
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+    # Jobs run in the default executor once the pools are shut down
+    name = await executor.async_run_in_pool(
+        hass,
+        executor.POOL_DATABASE,
+        "history",
+        lambda: threading.current_thread().name,
+    )
+    assert not name.startswith("DatabaseWorker")
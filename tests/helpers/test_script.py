@@ -23,7 +23,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import SERVICE_CALL_LIMIT, Context, CoreState, callback
 from homeassistant.exceptions import ConditionError, ServiceNotFound
-from homeassistant.helpers import config_validation as cv, script, trace
+from homeassistant.helpers import config_validation as cv, script, service, trace
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -311,6 +311,59 @@ async def test_calling_service_template(hass):
     )
 
 
+async def test_static_service_call_rendered_once(hass):
+    """Test service calls without dynamic templates are only rendered once."""
+    calls = async_mock_service(hass, "test", "script")
+
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "service": "test.script",
+                "target": {"entity_id": "light.kitchen"},
+                "data": {"hello": "world"},
+            },
+            {"service": "test.script", "data": {"hello": "{{ hello_var }}"}},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with patch(
+        "homeassistant.helpers.service.async_prepare_call_from_config",
+        wraps=service.async_prepare_call_from_config,
+    ) as mock_prepare:
+        await script_obj.async_run(MappingProxyType({"hello_var": "one"}), Context())
+        await script_obj.async_run(MappingProxyType({"hello_var": "two"}), Context())
+        await hass.async_block_till_done()
+
+    # The static step is rendered on the first run only
+    assert mock_prepare.call_count == 3
+    assert [call.data for call in calls] == [
+        {"entity_id": ["light.kitchen"], "hello": "world"},
+        {"hello": "one"},
+        {"entity_id": ["light.kitchen"], "hello": "world"},
+        {"hello": "two"},
+    ]
+
+
+async def test_script_without_trace(hass):
+    """Test steps of scripts created without tracing are not traced."""
+    calls = async_mock_service(hass, "test", "script")
+
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"service": "test.script", "data": {"hello": "world"}},
+            {"repeat": {"count": 2, "sequence": {"service": "test.script"}}},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain", trace=False)
+
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert len(calls) == 3
+    assert_action_trace({})
+
+
 async def test_data_template_with_templated_key(hass):
     """Test the calling of a service with a data_template with a templated key."""
     context = Context()
@@ -29,6 +29,7 @@ from homeassistant.setup import async_setup_component
 
 from tests.common import (
     MockEntity,
+    MockEntityPlatform,
     get_test_home_assistant,
     mock_device_registry,
     mock_registry,
@@ -463,6 +464,79 @@ async def test_async_get_all_descriptions(hass):
     assert "fields" in descriptions[logger.DOMAIN]["set_level"]
 
 
+async def test_call_with_batch_service(hass):
+    """Test entities of platforms with a batch handler are called at once."""
+    batch_platform = MockEntityPlatform(hass, domain="light")
+    other_platform = MockEntityPlatform(hass, domain="light", platform_name="other")
+    await batch_platform.async_add_entities(
+        [MockEntity(entity_id=f"light.batch_{idx}") for idx in range(3)]
+    )
+    await other_platform.async_add_entities([MockEntity(entity_id="light.other")])
+
+    batch_mock = AsyncMock(return_value=None)
+    batch_platform.async_register_batch_service("turn_on", batch_mock)
+    test_service_mock = AsyncMock(return_value=None)
+    call = ha.ServiceCall("light", "turn_on", {"entity_id": "all"})
+
+    def batch_params(entity, service_call):
+        """Return the parameters of an entity, or None to call it on its own."""
+        assert service_call is call
+        if entity.entity_id == "light.batch_2":
+            return None
+        return {"entity": entity.entity_id}
+
+    await service.entity_service_call(
+        hass,
+        [batch_platform, other_platform],
+        test_service_mock,
+        call,
+        batch_params=batch_params,
+    )
+
+    assert batch_mock.call_count == 1
+    assert [
+        (entity.entity_id, params) for entity, params in batch_mock.call_args[0][0]
+    ] == [
+        ("light.batch_0", {"entity": "light.batch_0"}),
+        ("light.batch_1", {"entity": "light.batch_1"}),
+    ]
+    assert sorted(
+        mock_call[0][0].entity_id for mock_call in test_service_mock.call_args_list
+    ) == ["light.batch_2", "light.other"]
+
+    # Services without batch parameters are called for each entity
+    test_service_mock.reset_mock()
+    await service.entity_service_call(
+        hass, [batch_platform, other_platform], test_service_mock, call
+    )
+    assert batch_mock.call_count == 1
+    assert test_service_mock.call_count == 4
+
+    # Method services are batched with their service data
+    await service.entity_service_call(
+        hass,
+        [batch_platform],
+        "async_turn_on",
+        ha.ServiceCall("light", "turn_on", {"entity_id": "all", "brightness": 10}),
+    )
+    assert batch_mock.call_count == 2
+    assert [params for _, params in batch_mock.call_args[0][0]] == [
+        {"brightness": 10}
+    ] * 3
+
+    # Other services of the domain are called for each entity
+    test_service_mock.reset_mock()
+    await service.entity_service_call(
+        hass,
+        [batch_platform, other_platform],
+        test_service_mock,
+        ha.ServiceCall("light", "turn_off", {"entity_id": "all"}),
+        batch_params=batch_params,
+    )
+    assert batch_mock.call_count == 2
+    assert test_service_mock.call_count == 4
+
+
 async def test_call_with_required_features(hass, mock_entities):
     """Test service calls invoked only if entity has required features."""
     test_service_mock = AsyncMock(return_value=None)
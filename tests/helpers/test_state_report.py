@@ -0,0 +1,184 @@
+"""Test the state report helper."""
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import state_report
+from homeassistant.util.dt import utcnow
+
+from tests.common import async_fire_time_changed
+
+
+def _data_changed(hass, old_state, old_attrs, old_data, new_state, new_attrs, new_data):
+    """Check if the serialized data has changed."""
+    return old_data != new_data
+
+
+async def _async_pipeline(hass, domain, report, window=0, exposed=("light",)):
+    """Set up a pipeline reporting the state of exposed domains."""
+    pipeline = state_report.StateReportPipeline(
+        hass,
+        domain,
+        should_expose=lambda state: state.domain in exposed,
+        serialize=lambda state: None if state.state == "skip" else state.state,
+        report=report,
+        window=window,
+        extra_significant_check=_data_changed,
+    )
+    await pipeline.async_setup()
+    return pipeline
+
+
+async def test_changes_coalesced(hass):
+    """Test changes of an entity within the window are coalesced."""
+    report = AsyncMock()
+    pipeline = await _async_pipeline(hass, "test", report, window=1)
+    unsub = pipeline.async_start()
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.living_room", "on")
+    hass.states.async_set("light.hallway", "skip")
+    hass.states.async_set("switch.ac", "on")
+    await hass.async_block_till_done()
+    assert report.call_count == 0
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    report.assert_called_once_with({"light.kitchen": "off", "light.living_room": "on"})
+
+    # Not significant, so not reported
+    report.reset_mock()
+    hass.states.async_set("light.kitchen", "off", {"changed": True})
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert report.call_count == 0
+
+    unsub()
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=3))
+    await hass.async_block_till_done()
+    assert report.call_count == 0
+
+
+async def test_pipelines_share_listener(hass):
+    """Test pipelines share a single state change listener."""
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    first_report = AsyncMock()
+    second_report = AsyncMock()
+    first = await _async_pipeline(hass, "first", first_report)
+    second = await _async_pipeline(hass, "second", second_report, exposed=("switch",))
+    unsub_first = first.async_start()
+    unsub_second = second.async_start()
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("switch.ac", "on")
+    await hass.async_block_till_done()
+    first_report.assert_called_once_with({"light.kitchen": "on"})
+    second_report.assert_called_once_with({"switch.ac": "on"})
+
+    unsub_first()
+    unsub_second()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+
+
+async def test_invalidate_exposed_entities(hass):
+    """Test which entities are exposed is decided again when invalidated."""
+    exposed = {"light"}
+    report = AsyncMock()
+    pipeline = await _async_pipeline(hass, "test", report, exposed=exposed)
+    pipeline.async_start()
+
+    hass.states.async_set("switch.ac", "on")
+    await hass.async_block_till_done()
+    assert report.call_count == 0
+
+    exposed.add("switch")
+    hass.states.async_set("switch.ac", "off")
+    await hass.async_block_till_done()
+    assert report.call_count == 0
+
+    state_report.async_invalidate_exposed_entities(hass, "other")
+    state_report.async_invalidate_exposed_entities(hass, "test")
+    hass.states.async_set("switch.ac", "on")
+    await hass.async_block_till_done()
+    report.assert_called_once_with({"switch.ac": "on"})
+
+
+async def test_removed_entities_forgotten(hass):
+    """Test pending changes of removed entities are dropped and forgotten."""
+    report = AsyncMock()
+    pipeline = await _async_pipeline(hass, "test", report, window=1)
+    pipeline.async_start()
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    report.assert_called_once_with({"light.kitchen": "on"})
+
+    report.reset_mock()
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_remove("light.kitchen")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert report.call_count == 0
+
+    # Added again, the entity is reported even if it has its last reported state
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=3))
+    await hass.async_block_till_done()
+    report.assert_called_once_with({"light.kitchen": "on"})
+
+
+async def test_events_not_coalesced(hass):
+    """Test every event is reported, even if the entity changed again."""
+    report = AsyncMock()
+    pipeline = state_report.StateReportPipeline(
+        hass,
+        "test",
+        should_expose=lambda state: True,
+        serialize=lambda state: None,
+        report=report,
+        serialize_event=lambda state: state_report.StateReportEvent(state.state)
+        if state.state == "on"
+        else None,
+    )
+    await pipeline.async_setup()
+    pipeline.async_start()
+
+    hass.states.async_set("binary_sensor.doorbell", "on")
+    hass.states.async_set("binary_sensor.doorbell", "off")
+    hass.states.async_set("binary_sensor.doorbell", "on")
+    hass.states.async_set("binary_sensor.doorbell", "off")
+    await hass.async_block_till_done()
+
+    assert report.call_count == 2
+    for call in report.mock_calls:
+        assert list(call[1][0]) == ["binary_sensor.doorbell"]
+        assert call[1][0]["binary_sensor.doorbell"].data == "on"
+
+
+async def test_report_error_reschedules(hass, caplog):
+    """Test a failing report is logged and changes made meanwhile are reported."""
+    calls = []
+
+    async def report(reports):
+        calls.append(reports)
+        if len(calls) == 1:
+            hass.states.async_set("light.kitchen", "off")
+            raise ValueError("Boom")
+
+    pipeline = await _async_pipeline(hass, "test", report)
+    pipeline.async_start()
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert calls == [{"light.kitchen": "on"}, {"light.kitchen": "off"}]
+    assert "Error reporting states for test" in caplog.text
@@ -13,7 +13,7 @@ from homeassistant import config_entries
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import update_coordinator
+from homeassistant.helpers import polling, update_coordinator
 from homeassistant.util.dt import utcnow
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -381,3 +381,69 @@ async def test_not_schedule_refresh_if_system_option_disable_polling(hass):
     crd = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
     crd.async_add_listener(lambda: None)
     assert crd._unsub_refresh is None
+
+
+async def test_adaptive_update_interval(hass):
+    """Test refreshes back off while the data does not change."""
+    values = [1, 1, 1, 2, 2, 2]
+
+    async def refresh():
+        return {"value": values.pop(0)}
+
+    crd = update_coordinator.DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=refresh,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        adaptive_update_interval=True,
+        max_update_interval=timedelta(seconds=40),
+    )
+    entity = update_coordinator.CoordinatorEntity(crd)
+    entity.entity_id = "sensor.test"
+    entity.async_write_ha_state = Mock()
+    with patch("homeassistant.helpers.polling.random.uniform", return_value=0):
+        crd.async_add_listener(entity._handle_coordinator_update)
+
+    async def refresh_after(seconds):
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=seconds))
+        await hass.async_block_till_done()
+
+    await refresh_after(0)
+    assert crd.data == {"value": 1}
+    assert crd.polling_stats.interval == 10
+
+    await refresh_after(10)
+    assert crd.polling_stats.interval == 20
+
+    # Not refreshed at the configured interval
+    await refresh_after(10)
+    assert len(values) == 4
+
+    await refresh_after(20)
+    assert crd.polling_stats.interval == 40
+
+    # Changed data resets the interval
+    await refresh_after(40)
+    assert crd.data == {"value": 2}
+    assert crd.polling_stats.interval == 10
+
+    await refresh_after(10)
+    assert crd.polling_stats.interval == 20
+
+    # Other watched entities do not change the interval
+    release_other = polling.async_watch_entities(hass, ["sensor.other"])
+    assert crd.polling_stats.interval == 20
+    release_other()
+
+    # Watched entities are refreshed at the shortest interval
+    release = polling.async_watch_entities(hass, ["sensor.test"])
+    assert crd.polling_stats.interval == 10
+    await refresh_after(10)
+    assert not values
+    assert crd.polling_stats.interval == 10
+    release()
+
+    assert crd.polling_stats.polls == 6
+    assert crd.polling_stats.unchanged == 4
+    assert crd.polling_stats.skipped == 5
@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, runner
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
@@ -669,3 +669,20 @@ async def test_empty_integrations_list_is_only_sent_at_the_end_of_bootstrap(hass
 
     assert "normal_integration" in hass.config.components
     assert order == ["an_after_dep", "normal_integration"]
+
+
+async def test_preimport_integrations(hass):
+    """Test integrations and their configured platforms are imported ahead."""
+    integrations = {"light": await loader.async_get_integration(hass, "light")}
+
+    with patch("homeassistant.bootstrap._preimport_module") as mock_preimport:
+        await bootstrap._async_preimport_integrations(
+            hass,
+            {"light": [{"platform": "demo"}, {"platform": "not_an_integration"}]},
+            integrations,
+        )
+
+    assert [call[1][0] for call in mock_preimport.mock_calls] == [
+        "homeassistant.components.light",
+        "homeassistant.components.demo.light",
+    ]
@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import pathlib
 from unittest.mock import patch
 
 import pytest
@@ -6,8 +8,17 @@ import pytest
 from homeassistant import core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
+import homeassistant.util.dt as dt_util
 
-from tests.common import MockModule, async_mock_service, mock_integration
+from tests.common import (
+    MockModule,
+    async_fire_time_changed,
+    async_mock_service,
+    mock_integration,
+)
+
+COMPONENTS_DIR = pathlib.Path(hue.__file__).parent.parent
 
 
 async def test_component_dependencies(hass):
@@ -481,3 +492,145 @@ async def test_custom_integration_missing(hass, caplog):
 
         with pytest.raises(loader.IntegrationNotFound):
             await loader.async_get_integration(hass, "test1")
+
+
+async def test_manifest_index_saved(hass, hass_storage):
+    """Test that resolved manifests are written to the manifest index."""
+    await loader.async_get_integration(hass, "hue")
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_INDEX_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]
+    assert data["ha_version"] == __version__
+    assert data["components_mtime"] == COMPONENTS_DIR.stat().st_mtime
+    entry_path = pathlib.Path(hue.__file__).parent / "manifest.json"
+    entry = data["manifests"][str(entry_path)]
+    assert entry["mtime"] == pathlib.Path(entry_path).stat().st_mtime
+    assert entry["manifest"]["domain"] == "hue"
+
+
+def _mock_manifest_index(hass_storage, manifest_path, manifest, **data):
+    """Store a manifest index containing a single manifest."""
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY] = {
+        "version": loader.MANIFEST_INDEX_STORAGE_VERSION,
+        "key": loader.MANIFEST_INDEX_STORAGE_KEY,
+        "data": {
+            "ha_version": __version__,
+            "components_mtime": COMPONENTS_DIR.stat().st_mtime,
+            "manifests": {
+                str(manifest_path): {
+                    "mtime": manifest_path.stat().st_mtime,
+                    "manifest": manifest,
+                },
+            },
+            **data,
+        },
+    }
+
+
+async def test_manifest_index_used(hass, hass_storage):
+    """Test that built-in integrations are resolved from the manifest index."""
+    _mock_manifest_index(
+        hass_storage,
+        pathlib.Path(hue.__file__).parent / "manifest.json",
+        {"domain": "hue", "name": "Indexed Hue"},
+    )
+
+    with patch("pathlib.Path.read_text") as mock_read:
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert not mock_read.called
+    assert integration.name == "Indexed Hue"
+    assert integration.is_built_in
+    assert integration.file_path == pathlib.Path(hue.__file__).parent
+
+
+async def test_manifest_index_invalidated_by_version(hass, hass_storage):
+    """Test that indexed built-in manifests are dropped on a version change."""
+    _mock_manifest_index(
+        hass_storage,
+        pathlib.Path(hue.__file__).parent / "manifest.json",
+        {"domain": "hue", "name": "Indexed Hue"},
+        ha_version="0.1.0",
+    )
+
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name == "Philips Hue"
+
+
+async def test_manifest_index_builtin_invalidated_by_components_dir(hass, hass_storage):
+    """Test that indexed built-in manifests are dropped when components changed."""
+    _mock_manifest_index(
+        hass_storage,
+        pathlib.Path(hue.__file__).parent / "manifest.json",
+        {"domain": "hue", "name": "Indexed Hue"},
+        components_mtime=COMPONENTS_DIR.stat().st_mtime - 1,
+    )
+
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name == "Philips Hue"
+
+
+async def test_manifest_index_validated_once(hass, hass_storage):
+    """Test that indexed manifests are not checked again on lookup."""
+    _mock_manifest_index(
+        hass_storage,
+        pathlib.Path(hue.__file__).parent / "manifest.json",
+        {"domain": "hue", "name": "Indexed Hue"},
+    )
+
+    await loader.async_get_manifest_index(hass)
+    with patch("pathlib.Path.stat") as mock_stat:
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert not mock_stat.called
+    assert integration.name == "Indexed Hue"
+
+
+async def test_manifest_index_drops_missing(hass, hass_storage):
+    """Test that manifests that no longer exist are dropped from the index."""
+    manifest_path = pathlib.Path(hue.__file__).parent / "manifest.json"
+    _mock_manifest_index(
+        hass_storage, manifest_path, {"domain": "hue", "name": "Indexed Hue"}
+    )
+    missing_path = pathlib.Path(
+        hass.config.path("custom_components/gone/manifest.json")
+    )
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]["manifests"][
+        str(missing_path)
+    ] = {"mtime": 1.0, "manifest": {"domain": "gone", "name": "Gone"}}
+
+    await loader.async_get_manifest_index(hass)
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_INDEX_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    manifests = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]["manifests"]
+    assert str(missing_path) not in manifests
+    assert str(manifest_path) in manifests
+
+
+async def test_manifest_index_custom_invalidated_by_mtime(
+    hass, hass_storage, enable_custom_integrations
+):
+    """Test that indexed custom manifests are dropped when the file changed."""
+    manifest_path = (
+        pathlib.Path(hass.config.path("custom_components"))
+        / "test_package"
+        / "manifest.json"
+    )
+    _mock_manifest_index(
+        hass_storage,
+        manifest_path,
+        {"domain": "test_package", "name": "Indexed", "version": "1.2.3"},
+    )
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]["manifests"][
+        str(manifest_path)
+    ]["mtime"] = (manifest_path.stat().st_mtime - 1)
+
+    integration = await loader.async_get_integration(hass, "test_package")
+    assert integration.name == "Test Package"
@@ -12,7 +12,7 @@ import voluptuous as vol
 from homeassistant import config_entries, setup
 import homeassistant.config as config_util
 from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_START
-from homeassistant.core import callback
+from homeassistant.core import CoreState, callback
 from homeassistant.helpers import discovery
 from homeassistant.helpers.config_validation import (
     PLATFORM_SCHEMA,
@@ -708,3 +708,32 @@ async def test_async_start_setup_platforms(hass):
     assert "august" not in hass.data[setup.DATA_SETUP_STARTED]
     assert isinstance(hass.data[setup.DATA_SETUP_TIME]["august"], datetime.timedelta)
     assert "sensor" not in hass.data[setup.DATA_SETUP_TIME]
+
+
+async def test_setup_timeline(hass):
+    """Test the phases of setting up an integration are recorded."""
+    hass.state = CoreState.starting
+    mock_integration(hass, MockModule("comp", async_setup=AsyncMock(return_value=True)))
+
+    assert await setup.async_setup_component(hass, "comp", {})
+
+    phases = [
+        setup_phase.phase
+        for setup_phase in setup.async_get_setup_timeline(hass)["comp"]
+    ]
+    assert phases == [setup.PHASE_IMPORT, setup.PHASE_CONFIG, setup.PHASE_SETUP]
+
+    with setup.async_start_setup(hass, ["sensor.comp"]):
+        pass
+
+    platform_phase = setup.async_get_setup_timeline(hass)["comp"][-1]
+    assert platform_phase.phase == setup.PHASE_PLATFORM
+    assert platform_phase.platform == "sensor"
+    assert isinstance(platform_phase.duration, datetime.timedelta)
+
+    # Setups done once Home Assistant is running are not recorded
+    hass.state = CoreState.running
+    with setup.async_start_setup(hass, ["light.comp"]):
+        pass
+
+    assert setup.async_get_setup_timeline(hass)["comp"][-1] is platform_phase
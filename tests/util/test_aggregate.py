@@ -0,0 +1,126 @@
+"""Test Home Assistant incremental aggregates."""
+import pytest
+
+from homeassistant.util.aggregate import (
+    RESUM_INTERVAL,
+    CountAggregate,
+    NumericAggregate,
+    TupleMeanAggregate,
+    UnionAggregate,
+)
+
+
+def test_numeric_aggregate():
+    """Test the numeric aggregate."""
+    aggregate = NumericAggregate(["a", "b", "c"])
+    assert aggregate.mean is None
+    assert aggregate.median is None
+    assert aggregate.min is None
+    assert aggregate.max_member is None
+
+    aggregate.set_value("c", 3)
+    aggregate.set_value("b", 3)
+    aggregate.set_value("a", 1)
+    assert len(aggregate) == 3
+    assert aggregate.sum == 7
+    assert aggregate.median == 3
+    assert (aggregate.min, aggregate.min_member) == (1, "a")
+    # Ties are resolved by the order of the members
+    assert (aggregate.max, aggregate.max_member) == (3, "b")
+
+    aggregate.set_value("b", 0)
+    assert aggregate.mean == 4 / 3
+    assert aggregate.median == 1
+    assert (aggregate.min, aggregate.min_member) == (0, "b")
+
+    aggregate.remove("c")
+    aggregate.remove("unknown")
+    assert aggregate.median == 0.5
+    assert (aggregate.max, aggregate.max_member) == (1, "a")
+
+    aggregate.set_value("d", 1)
+    assert aggregate.max_member == "a"
+
+    for member in ("a", "b", "d"):
+        aggregate.remove(member)
+    assert aggregate.sum == 0
+    assert aggregate.mean is None
+
+
+def test_numeric_aggregate_sum_drift():
+    """Test the sum is computed again so rounding errors do not accumulate."""
+    aggregate = NumericAggregate()
+    aggregate.set_value("small", 0.1)
+    for _ in range(RESUM_INTERVAL):
+        aggregate.set_value("large", 1e17)
+        aggregate.remove("large")
+    assert aggregate.sum == 0.1
+
+
+def test_numeric_aggregate_rejects_nan():
+    """Test NaN is rejected and leaves the previous value in place."""
+    aggregate = NumericAggregate()
+    aggregate.set_value("a", 1.0)
+    with pytest.raises(ValueError):
+        aggregate.set_value("a", float("nan"))
+    assert aggregate.values == {"a": 1.0}
+    assert aggregate.median == 1.0
+
+
+def test_tuple_mean_aggregate():
+    """Test the tuple mean aggregate."""
+    aggregate = TupleMeanAggregate()
+    assert aggregate.mean is None
+
+    aggregate.set_value("a", (0, 10))
+    aggregate.set_value("b", (10, 20))
+    assert aggregate.mean == (5, 15)
+
+    aggregate.set_value("b", (20, 30))
+    assert aggregate.mean == (10, 20)
+
+    # Only the columns all values have are averaged
+    aggregate.set_value("c", (40,))
+    assert aggregate.mean == (20,)
+
+    aggregate.remove("c")
+    assert aggregate.mean == (10, 20)
+
+
+def test_count_aggregate():
+    """Test the count aggregate."""
+    aggregate = CountAggregate()
+    assert aggregate.most_common() is None
+    assert not aggregate.any("on")
+
+    aggregate.set_value("a", "on")
+    aggregate.set_value("b", "on")
+    aggregate.set_value("c", None)
+    assert aggregate.counts == {"on": 2, None: 1}
+    assert aggregate.most_common() == "on"
+    assert not aggregate.all("on")
+
+    aggregate.set_value("a", "off")
+    aggregate.remove("c")
+    assert aggregate.counts == {"on": 1, "off": 1}
+    assert aggregate.count("on") == 1
+
+    aggregate.remove("a")
+    assert aggregate.all("on")
+    assert not aggregate.any("off")
+
+
+def test_union_aggregate():
+    """Test the union aggregate."""
+    aggregate = UnionAggregate()
+    assert aggregate.union == set()
+
+    aggregate.set_value("a", ["x", "y"])
+    aggregate.set_value("b", ["y", "z"])
+    assert aggregate.union == {"x", "y", "z"}
+
+    aggregate.set_value("b", ["z"])
+    assert aggregate.union == {"x", "y", "z"}
+
+    aggregate.remove("a")
+    assert aggregate.union == {"z"}
@@ -445,3 +445,136 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+def test_fast_loader_keeps_references():
+    """Test the default loader annotates nodes with their source."""
+    conf = "key:\n  nested: value\nlist:\n  - item"
+    with io.StringIO(conf) as file:
+        doc = yaml.parse_yaml(file)
+    assert doc["key"]["nested"] == "value"
+    assert doc["key"].__line__ == 1
+    assert doc["list"].__line__ == 3
+    assert doc["list"].__config_file__ == "<file>"
+
+
+def _write(path, content):
+    """Write a file and bump its mtime so changes are always detected."""
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_parsed_cache(tmp_path):
+    """Test parsed files are cached until a dependency changes."""
+    config_path = tmp_path / "configuration.yaml"
+    secrets_path = tmp_path / "secrets.yaml"
+    _write(config_path, "http:\n  password: !secret pw\nauto: !include auto.yaml")
+    _write(secrets_path, "pw: abc")
+    _write(tmp_path / "auto.yaml", "- id: one")
+    cache = yaml.ParsedYamlCache()
+
+    def load():
+        return yaml.load_yaml(str(config_path), yaml.Secrets(tmp_path, cache))
+
+    assert load() == {"http": {"password": "abc"}, "auto": [{"id": "one"}]}
+    # Nothing is written to disk
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "auto.yaml",
+        "configuration.yaml",
+        "secrets.yaml",
+    ]
+
+    with patch.object(yaml_loader, "_load_yaml") as mock_load:
+        doc = load()
+    assert not mock_load.called
+    assert doc == {"http": {"password": "abc"}, "auto": [{"id": "one"}]}
+    assert doc["auto"].__config_file__ == str(config_path)
+    assert doc["auto"].__line__ == 2
+
+    # Returned objects are copies
+    doc["auto"].append({"id": "changed"})
+    assert load()["auto"] == [{"id": "one"}]
+
+    _write(secrets_path, "pw: def")
+    assert load()["http"]["password"] == "def"
+
+    _write(tmp_path / "auto.yaml", "- id: two")
+    assert load()["auto"] == [{"id": "two"}]
+
+
+def test_parsed_cache_size_change(tmp_path):
+    """Test a file changed without a new mtime is parsed again."""
+    config_path = tmp_path / "configuration.yaml"
+    _write(config_path, "key: one")
+    cache = yaml.ParsedYamlCache()
+    secrets = yaml.Secrets(tmp_path, cache)
+    assert yaml.load_yaml(str(config_path), secrets) == {"key": "one"}
+
+    stat = config_path.stat()
+    config_path.write_text("key: three")
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert yaml.load_yaml(str(config_path), secrets) == {"key": "three"}
+
+
+def test_parsed_cache_prunes_removed_files(tmp_path):
+    """Test entries of files that no longer exist are dropped."""
+    config_path = tmp_path / "configuration.yaml"
+    included_path = tmp_path / "included.yaml"
+    _write(config_path, "included: !include included.yaml")
+    _write(included_path, "key: value")
+    cache = yaml.ParsedYamlCache()
+    secrets = yaml.Secrets(tmp_path, cache)
+
+    yaml.load_yaml(str(config_path), secrets)
+    assert set(cache._entries) == {str(config_path), str(included_path)}
+
+    _write(config_path, "key: value")
+    included_path.unlink()
+    assert yaml.load_yaml(str(config_path), secrets) == {"key": "value"}
+    assert set(cache._entries) == {str(config_path)}
+
+
+def test_parsed_cache_include_dir(tmp_path):
+    """Test files added to an included directory invalidate the cache."""
+    config_path = tmp_path / "configuration.yaml"
+    (tmp_path / "scripts").mkdir()
+    _write(config_path, "script: !include_dir_merge_named scripts")
+    _write(tmp_path / "scripts" / "one.yaml", "one: 1")
+    cache = yaml.ParsedYamlCache()
+    secrets = yaml.Secrets(tmp_path, cache)
+
+    assert yaml.load_yaml(str(config_path), secrets) == {"script": {"one": 1}}
+
+    (tmp_path / "scripts" / "two.yaml").write_text("two: 2")
+    scripts_dir = tmp_path / "scripts"
+    stat = scripts_dir.stat()
+    os.utime(scripts_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert yaml.load_yaml(str(config_path), secrets) == {"script": {"one": 1, "two": 2}}
+
+
+def test_parsed_cache_skips_env_var(tmp_path):
+    """Test files using environment variables are not cached."""
+    config_path = tmp_path / "configuration.yaml"
+    _write(config_path, "password: !env_var PASSWORD")
+    cache = yaml.ParsedYamlCache()
+    secrets = yaml.Secrets(tmp_path, cache)
+
+    with patch.dict(os.environ, {"PASSWORD": "abc"}):
+        assert yaml.load_yaml(str(config_path), secrets) == {"password": "abc"}
+    with patch.dict(os.environ, {"PASSWORD": "def"}):
+        assert yaml.load_yaml(str(config_path), secrets) == {"password": "def"}
+
+
+def test_parsed_cache_skips_missing_files(tmp_path):
+    """Test files that can not be stat'ed are not cached."""
+    config_path = str(tmp_path / "configuration.yaml")
+    cache = yaml.ParsedYamlCache()
+    secrets = yaml.Secrets(tmp_path, cache)
+
+    with patch_yaml_files({config_path: "key: one"}):
+        assert yaml.load_yaml(config_path, secrets) == {"key": "one"}
+    with patch_yaml_files({config_path: "key: two"}):
+        assert yaml.load_yaml(config_path, secrets) == {"key": "two"}
+    assert not cache._entries